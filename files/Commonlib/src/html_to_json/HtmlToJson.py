@@ -40,10 +40,20 @@ converter = HTMLTocreate_from_string(html_sample)
 print(converter.json())
 '''
 
-from json import dumps, loads
-from typing import Dict
+from json import dumps
+from typing import Any, Dict, Optional
 from lxml import html, etree
 from collections import OrderedDict
+from array import array
+from mmap import mmap, ACCESS_READ
+from struct import Struct, error as struct_error
+from sys import byteorder, getsizeof
+from hashlib import blake2b
+from threading import Lock, get_ident
+from os import getpid, makedirs, remove, replace
+from os.path import isfile, join
+from functools import lru_cache
+from re import compile as re_compile, IGNORECASE, VERBOSE
 
 
 def docs(module_name='__main__', include_private=False):
@@ -197,19 +207,21 @@ class HTMLToJSON:
         self._namespace_mapping = {}
         self._namespace_prefix = kwargs.get("namespace_prefix", "ns")
         self._xpath_mapping = OrderedDict()
+        self._tag_index = None
 
         self._validate_element(root_element)
         self._traverse_tree()
 
     @classmethod
-    def create_from_string(cls, html_str: str, **kwargs) -> "HTMLToJSON":
+    def create_from_string(cls, html_str: str, cache: Optional["DocumentCache"] = None, **kwargs) -> "HTMLToJSON":
         '''
         从HTML字符串创建转换器实例
 
         ### 参数说明
-        | 参数名     | 类型  | 必须 | 说明               |
-        |-----------|-------|------|--------------------|
-        | html_str  | str   | 是   | 有效的HTML内容字符串 |
+        | 参数名     | 类型          | 必须 | 说明                                     |
+        |-----------|---------------|------|------------------------------------------|
+        | html_str  | str           | 是   | 有效的HTML内容字符串                     |
+        | cache     | DocumentCache | 否   | 文档缓存，相同内容直接返回已解析的实例   |
 
         ### 返回值
         HTMLToJSON: 初始化完成的转换器实例
@@ -230,6 +242,14 @@ class HTMLToJSON:
         if not html_str.strip():
             raise ValueError("输入内容不能为空")
 
+        if cache is not None:
+            cache_key = cache.key(html_str, kwargs)
+            converter = cache.get(cache_key, **kwargs)
+            if converter is None:
+                converter = cls.create_from_string(html_str, **kwargs)
+                cache.put(cache_key, converter)
+            return converter
+
         parser = html.HTMLParser(remove_blank_text=True, remove_comments=True)
         try:
             root = html.fromstring(html_str, parser=parser)
@@ -242,6 +262,29 @@ class HTMLToJSON:
             raise ValueError("\n".join(filter(None, error_info))) from e
         return cls(root, **kwargs)
 
+    @classmethod
+    def create_from_mapping(cls, mapping: Dict[str, Dict], **kwargs) -> "HTMLToJSON":
+        '''
+        从已有映射创建转换器实例，不重新解析和遍历DOM
+
+        ### 参数说明
+        | 参数名   | 类型 | 必须 | 说明                               |
+        |----------|------|------|------------------------------------|
+        | mapping  | dict | 是   | `dict()`格式的映射（如缓存中读取） |
+
+        ### 返回值
+        HTMLToJSON: 不持有DOM根元素的转换器实例
+        '''
+        converter = cls.__new__(cls)
+        converter._element_root = None
+        converter._include_tail = kwargs.get("include_tail", False)
+        converter._max_depth = kwargs.get("max_depth", 10000)
+        converter._namespace_mapping = {}
+        converter._namespace_prefix = kwargs.get("namespace_prefix", "ns")
+        converter._xpath_mapping = OrderedDict(mapping)
+        converter._tag_index = None
+        return converter
+
     def json(self, indent: int = 4) -> str:
         '''
         生成格式化JSON输出
@@ -305,6 +348,40 @@ class HTMLToJSON:
         '''
         return dict(self._xpath_mapping)
 
+    def index(self) -> Dict[str, list]:
+        '''
+        获取标签索引（首次调用时构建并缓存在实例上）
+
+        ### 返回值
+        Dict[str, list]: 标签名到XPath列表的映射，列表按文档顺序排列
+
+        ### 示例返回
+        ```python
+        {"html": ["/html"], "p": ["/html/body/p[1]", "/html/body/p[2]"]}
+        ```
+        '''
+        if self._tag_index is None:
+            tag_index = {}
+            for xpath, record in self._xpath_mapping.items():
+                tag_index.setdefault(record["tag"], []).append(xpath)
+            self._tag_index = tag_index
+        return self._tag_index
+
+    def compact(self) -> "CompactMapping":
+        '''
+        获取紧凑列式表示
+
+        ### 返回值
+        CompactMapping: 字符串驻留、整数父节点编号的列式映射，可写入二进制文件
+
+        ### 示例调用
+        ```python
+        compact = converter.compact()
+        compact.save("page.htjc")
+        ```
+        '''
+        return CompactMapping.from_mapping(self._xpath_mapping)
+
     def _validate_element(self, element):
         '''[内部方法] 验证元素有效性'''
         if not isinstance(element, html.HtmlElement):
@@ -348,8 +425,8 @@ class HTMLToJSON:
             namespace_part, tag_part = raw_tag.split("}", 1)
             ns_uri = namespace_part[1:]
             if ns_uri not in self._namespace_mapping:
-                self._namespace_mapping[ns_uri] = f"{
-                    self._namespace_prefix}{len(self._namespace_mapping)+1}"
+                self._namespace_mapping[ns_uri] = \
+                    f"{self._namespace_prefix}{len(self._namespace_mapping)+1}"
             return f"{self._namespace_mapping[ns_uri]}:{tag_part.lower()}"
         return raw_tag.lower()
 
@@ -372,6 +449,702 @@ class HTMLToJSON:
         return text
 
 
+class CompactMapping:
+    '''
+    HTMLToJSON映射的紧凑列式表示
+
+    ## 类功能说明
+    - 标签、属性、文本字符串统一驻留到字符串表，记录中只保存整数编号
+    - 使用整数父节点编号代替重复的父XPath字符串
+    - depth/unique等字段以`array`列存储，内存占用远小于逐元素字典
+    - 支持二进制文件读写，加载时通过`mmap`按需读取，不一次性解码全部数据
+
+    ## 版本信息
+    - 类版本: 1.0.0
+    - 更新日期: 2026年10月19日
+
+    ## 文件格式
+    | 区段          | 类型     | 长度       | 说明                       |
+    |---------------|----------|------------|----------------------------|
+    | header        | struct   | 24字节     | 魔数、版本、各区段元素数量 |
+    | parent        | int32    | 节点数     | 父节点编号，根节点为-1     |
+    | index         | uint32   | 节点数     | 同名兄弟序号，0表示无序号  |
+    | depth         | uint32   | 节点数     | 节点深度                   |
+    | unique        | uint8    | 节点数     | 是否唯一                   |
+    | tag / text    | uint32   | 节点数     | 字符串表编号               |
+    | attr_start    | uint32   | 节点数+1   | 属性区间起点               |
+    | attr_key/value| uint32   | 属性数     | 字符串表编号               |
+    | str_offset    | uint32   | 字符串数+1 | 字符串在blob中的偏移       |
+    | blob          | bytes    | 可变       | UTF-8字符串数据            |
+
+    各区段按8字节对齐，字节序为小端。
+
+    ## 初始化示例
+    ```python
+    compact = HTMLToJSON.create_from_string(html_str).compact()
+    compact.save("page.htjc")
+    with CompactMapping.load("page.htjc") as page:
+        print(page.xpath(2), page.record(2))
+    ```
+    '''
+
+    _magic = b"HTJC"
+    _version = 1
+    _header = Struct("<4sHHIIII")
+    _columns = (
+        ("parent", "i"), ("index", "I"), ("depth", "I"), ("unique", "B"),
+        ("tag", "I"), ("text", "I"), ("attr_start", "I"),
+        ("attr_key", "I"), ("attr_value", "I"), ("str_offset", "I"),
+    )
+
+    def __init__(self, columns: Dict[str, Any], blob, source=None):
+        '''
+        初始化紧凑映射实例（通常通过`from_mapping`或`load`创建）
+
+        ### 参数说明
+        | 参数名   | 类型  | 必须 | 默认值 | 说明                              |
+        |----------|-------|------|--------|-----------------------------------|
+        | columns  | dict  | 是   | 无     | 列名到array/memoryview的映射      |
+        | blob     | bytes | 是   | 无     | 字符串表的UTF-8数据               |
+        | source   | mmap  | 否   | None   | 懒加载时持有的文件映射对象        |
+        '''
+        self._cols = columns
+        self._blob = blob
+        self._source = source
+        self._strings = {}
+        self._string_ids = None
+        self._lookup = None
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, Dict]) -> "CompactMapping":
+        '''
+        从`HTMLToJSON.dict()`格式的映射构建紧凑表示
+
+        ### 参数说明
+        | 参数名  | 类型 | 必须 | 说明                                  |
+        |---------|------|------|---------------------------------------|
+        | mapping | dict | 是   | XPath到元素记录的有序映射（先序遍历） |
+
+        ### 返回值
+        CompactMapping: 内存中的紧凑映射
+
+        ### 示例调用
+        ```python
+        compact = CompactMapping.from_mapping(converter.dict())
+        ```
+        '''
+        cols = {name: array(code) for name, code in cls._columns}
+        strings = {"": 0}
+        node_ids = {}
+
+        def intern(value: str) -> int:
+            if value not in strings:
+                strings[value] = len(strings)
+            return strings[value]
+
+        for xpath, record in mapping.items():
+            parent_path = record["path"]
+            if parent_path and parent_path not in node_ids:
+                raise ValueError(f"父节点未出现在子节点之前: {xpath}")
+            node_ids[xpath] = len(node_ids)
+            cols["parent"].append(node_ids[parent_path] if parent_path else -1)
+            cols["index"].append(
+                int(xpath[xpath.rindex("[") + 1:-1]) if xpath.endswith("]") else 0)
+            cols["depth"].append(record["depth"])
+            cols["unique"].append(1 if record["unique"] else 0)
+            cols["tag"].append(intern(record["tag"]))
+            cols["text"].append(intern(record["text"]))
+            cols["attr_start"].append(len(cols["attr_key"]))
+            for key, value in record["attributes"].items():
+                cols["attr_key"].append(intern(key))
+                cols["attr_value"].append(intern(value))
+        cols["attr_start"].append(len(cols["attr_key"]))
+
+        blob = bytearray()
+        for value in strings:
+            cols["str_offset"].append(len(blob))
+            blob += value.encode("utf-8")
+        cols["str_offset"].append(len(blob))
+        return cls(cols, bytes(blob))
+
+    @classmethod
+    def load(cls, file_path: str) -> "CompactMapping":
+        '''
+        懒加载紧凑映射文件
+
+        ### 参数说明
+        | 参数名    | 类型 | 必须 | 说明             |
+        |-----------|------|------|------------------|
+        | file_path | str  | 是   | `save`生成的文件 |
+
+        ### 返回值
+        CompactMapping: 基于`mmap`的只读映射，列数据按需读取
+
+        ### 示例调用
+        ```python
+        with CompactMapping.load("page.htjc") as page:
+            mapping = page.dict()
+        ```
+        '''
+        with open(file_path, "rb") as pf:
+            source = mmap(pf.fileno(), 0, access=ACCESS_READ)
+        view = memoryview(source)
+        magic, version, _, nodes, attrs, strings, blob_size = cls._header.unpack_from(
+            view)
+        if magic != cls._magic or version != cls._version:
+            view.release()
+            source.close()
+            raise ValueError(f"不是有效的紧凑映射文件: {file_path}")
+
+        sizes = {
+            "parent": nodes, "index": nodes, "depth": nodes, "unique": nodes,
+            "tag": nodes, "text": nodes, "attr_start": nodes + 1,
+            "attr_key": attrs, "attr_value": attrs, "str_offset": strings + 1,
+        }
+        # 文件长度与文件头不符（截断或写了一半）时拒绝加载
+        offset = cls._align(cls._header.size)
+        for name, code in cls._columns:
+            offset = cls._align(offset + sizes[name] * array(code).itemsize)
+        if offset + blob_size > len(view):
+            view.release()
+            source.close()
+            raise ValueError(f"紧凑映射文件不完整: {file_path}")
+
+        cols = {}
+        offset = cls._align(cls._header.size)
+        for name, code in cls._columns:
+            size = sizes[name] * array(code).itemsize
+            segment = view[offset:offset + size]
+            if byteorder == "little":
+                cols[name] = segment.cast(code)
+            else:
+                cols[name] = array(code, segment)
+                cols[name].byteswap()
+                segment.release()
+            offset = cls._align(offset + size)
+        return cls(cols, view[offset:offset + blob_size], source)
+
+    def save(self, file_path: str) -> int:
+        '''
+        将紧凑映射写入二进制文件
+
+        ### 参数说明
+        | 参数名    | 类型 | 必须 | 说明     |
+        |-----------|------|------|----------|
+        | file_path | str  | 是   | 目标路径 |
+
+        ### 返回值
+        int: 写入的字节数
+        '''
+        header = self._header.pack(
+            self._magic, self._version, 0, len(self),
+            len(self._cols["attr_key"]), len(self._cols["str_offset"]) - 1,
+            len(self._blob)
+        )
+        with open(file_path, "wb") as pf:
+            pf.write(header)
+            written = self._pad(pf, len(header))
+            for name, code in self._columns:
+                column = self._cols[name]
+                if byteorder != "little":
+                    column = array(code, column)
+                    column.byteswap()
+                written += pf.write(column)
+                written = self._pad(pf, written)
+            written += pf.write(self._blob)
+        return written
+
+    def close(self) -> None:
+        '''释放懒加载持有的文件映射，内存构建的实例调用无副作用'''
+        if self._source is None:
+            return
+        for column in self._cols.values():
+            if isinstance(column, memoryview):
+                column.release()
+        self._blob.release()
+        self._source.close()
+        self._source = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._cols["parent"])
+
+    def __iter__(self):
+        return (xpath for xpath, _ in self.items())
+
+    def __getitem__(self, key):
+        '''按节点编号或XPath获取元素记录'''
+        if isinstance(key, str):
+            if self._lookup is None:
+                self._lookup = {xpath: node for node, xpath in enumerate(self)}
+            key = self._lookup[key]
+        return self.record(key)
+
+    @property
+    def nbytes(self) -> int:
+        '''列数据与字符串表占用的字节数'''
+        return sum(
+            len(self._cols[name]) * array(code).itemsize
+            for name, code in self._columns
+        ) + len(self._blob)
+
+    def string(self, string_id: int) -> str:
+        '''按编号读取驻留字符串，解码结果会被缓存'''
+        if string_id not in self._strings:
+            offsets = self._cols["str_offset"]
+            self._strings[string_id] = bytes(
+                self._blob[offsets[string_id]:offsets[string_id + 1]]
+            ).decode("utf-8")
+        return self._strings[string_id]
+
+    def string_id(self, value: str) -> Optional[int]:
+        '''按字符串查找驻留编号，不存在时返回None'''
+        if self._string_ids is None:
+            self._string_ids = {
+                self.string(string_id): string_id
+                for string_id in range(len(self._cols["str_offset"]) - 1)
+            }
+        return self._string_ids.get(value)
+
+    def xpath(self, node: int) -> str:
+        '''沿父节点编号回溯，重建节点的XPath路径'''
+        parts = []
+        while node >= 0:
+            parts.append(self._step(node))
+            node = self._cols["parent"][node]
+        return "".join(reversed(parts))
+
+    def record(self, node: int, xpath_parent: Optional[str] = None) -> Dict[str, Any]:
+        '''
+        还原单个节点的记录，字段与`HTMLToJSON.dict()`一致
+
+        ### 参数说明
+        | 参数名       | 类型 | 必须 | 默认值 | 说明                           |
+        |--------------|------|------|--------|--------------------------------|
+        | node         | int  | 是   | 无     | 节点编号                       |
+        | xpath_parent | str  | 否   | None   | 已知的父XPath，避免重复回溯    |
+        '''
+        cols = self._cols
+        parent = cols["parent"][node]
+        if xpath_parent is None:
+            xpath_parent = self.xpath(parent) if parent >= 0 else ""
+        start, stop = cols["attr_start"][node], cols["attr_start"][node + 1]
+        return {
+            "path": xpath_parent,
+            "unique": bool(cols["unique"][node]),
+            "tag": self.string(cols["tag"][node]),
+            "depth": cols["depth"][node],
+            "text": self.string(cols["text"][node]),
+            "attributes": {
+                self.string(cols["attr_key"][i]): self.string(cols["attr_value"][i])
+                for i in range(start, stop)
+            }
+        }
+
+    def items(self):
+        '''按先序遍历顺序逐个生成`(xpath, record)`，父路径沿途复用'''
+        xpaths = []
+        for node in range(len(self)):
+            parent = self._cols["parent"][node]
+            xpath_parent = xpaths[parent] if parent >= 0 else ""
+            xpaths.append(xpath_parent + self._step(node))
+            yield xpaths[node], self.record(node, xpath_parent)
+
+    def dict(self) -> Dict[str, Dict]:
+        '''还原为`HTMLToJSON.dict()`格式的完整映射'''
+        return dict(self.items())
+
+    def json(self, indent: Optional[int] = None) -> str:
+        '''生成与`HTMLToJSON.json()`一致的JSON字符串，默认不缩进'''
+        return dumps(self.dict(), indent=indent, ensure_ascii=False)
+
+    def _step(self, node: int) -> str:
+        '''[内部方法] 生成节点自身的XPath片段'''
+        index = self._cols["index"][node]
+        tag = self.string(self._cols["tag"][node])
+        return f"/{tag}[{index}]" if index else f"/{tag}"
+
+    @staticmethod
+    def _align(offset: int) -> int:
+        '''[内部方法] 按8字节对齐偏移'''
+        return (offset + 7) & ~7
+
+    @classmethod
+    def _pad(cls, pf, written: int) -> int:
+        '''[内部方法] 写入对齐填充并返回新的偏移'''
+        padding = cls._align(written) - written
+        pf.write(b"\0" * padding)
+        return written + padding
+
+
+class DocumentCache:
+    '''
+    按内容哈希缓存已解析文档的LRU缓存
+
+    ## 类功能说明
+    - 以HTML内容与解析参数的哈希作为键，重复内容直接返回已解析的转换器
+    - 内存层按估算字节数进行LRU淘汰
+    - 可选磁盘层，以`CompactMapping`二进制文件保存，进程重启后仍可命中
+    - 提供命中/未命中等统计信息，线程安全
+
+    ## 版本信息
+    - 类版本: 1.0.0
+    - 更新日期: 2026年10月19日
+
+    ## 初始化示例
+    ```python
+    cache = DocumentCache(max_bytes=64 * 1024 * 1024, cache_dir="./htjc_cache")
+    converter = HTMLToJSON.create_from_string(html_str, cache=cache)
+    print(cache.stats())
+    ```
+    '''
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, cache_dir: Optional[str] = None):
+        '''
+        初始化文档缓存
+
+        ### 参数说明
+        | 参数名    | 类型 | 必须 | 默认值 | 说明                         |
+        |-----------|------|------|--------|------------------------------|
+        | max_bytes | int  | 否   | 64MB   | 内存层允许的估算字节上限     |
+        | cache_dir | str  | 否   | None   | 磁盘层目录，None表示不启用   |
+        '''
+        self._max_bytes = max_bytes
+        self._cache_dir = cache_dir
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        if cache_dir:
+            makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(html_str: str, kwargs: Dict[str, Any]) -> str:
+        '''计算HTML内容与解析参数的缓存键'''
+        digest = blake2b(html_str.encode("utf-8"), digest_size=20)
+        digest.update(dumps(kwargs, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str, **kwargs) -> Optional["HTMLToJSON"]:
+        '''
+        查询缓存，内存层未命中时尝试磁盘层
+
+        ### 返回值
+        HTMLToJSON | None: 命中时返回共享的转换器实例，请勿修改其记录
+        '''
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return self._entries[key][0]
+        file_path = self._file_path(key)
+        if file_path and isfile(file_path):
+            try:
+                with CompactMapping.load(file_path) as compact:
+                    converter = HTMLToJSON.create_from_mapping(
+                        compact.dict(), **kwargs)
+            except (OSError, ValueError, TypeError, IndexError, KeyError, struct_error):
+                # 文件被截断或损坏：删除后由下一次 put 重新写入
+                converter = None
+                try:
+                    remove(file_path)
+                except OSError:
+                    pass
+            if converter is not None:
+                self._store(key, converter)
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+                return converter
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key: str, converter: "HTMLToJSON") -> None:
+        '''写入内存层，并在启用时写入磁盘层'''
+        self._store(key, converter)
+        file_path = self._file_path(key)
+        if file_path and not isfile(file_path):
+            # 先写入临时文件再原子替换，读取方不会看到写了一半的文件
+            temp_path = f"{file_path}.{getpid()}.{get_ident()}.tmp"
+            try:
+                converter.compact().save(temp_path)
+                replace(temp_path, file_path)
+            finally:
+                if isfile(temp_path):
+                    remove(temp_path)
+
+    def stats(self) -> Dict[str, int]:
+        '''
+        获取缓存统计
+
+        ### 示例返回
+        ```python
+        {"hits": 9, "disk_hits": 0, "misses": 1, "evictions": 0, "entries": 1, "bytes": 10240}
+        ```
+        '''
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._bytes}
+
+    def clear(self) -> None:
+        '''清空内存层（磁盘层文件保留）'''
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _store(self, key: str, converter: "HTMLToJSON") -> None:
+        '''[内部方法] 写入内存层并按字节上限淘汰最久未使用的条目'''
+        size = self._sizeof(converter._xpath_mapping)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (converter, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._stats["evictions"] += 1
+
+    def _file_path(self, key: str) -> Optional[str]:
+        '''[内部方法] 磁盘层文件路径'''
+        return join(self._cache_dir, f"{key}.htjc") if self._cache_dir else None
+
+    @staticmethod
+    def _sizeof(mapping: Dict[str, Dict]) -> int:
+        '''[内部方法] 估算映射占用的内存字节数'''
+        size = getsizeof(mapping)
+        for xpath, record in mapping.items():
+            size += getsizeof(xpath) + getsizeof(record)
+            size += getsizeof(record["text"]) + getsizeof(record["attributes"])
+            for key, value in record["attributes"].items():
+                size += getsizeof(key) + getsizeof(value)
+        return size
+
+
+class Selector:
+    '''
+    预编译的元素选择器
+
+    ## 类功能说明
+    - 将查询字符串编译为一组谓词，编译一次即可在多个文档上复用
+    - 支持标签、属性相等/包含/单词/前缀、深度范围、祖先XPath前缀与文本正则
+    - 对`HTMLToJSON`与`CompactMapping`优先使用标签索引缩小候选范围
+
+    ## 版本信息
+    - 类版本: 1.0.0
+    - 更新日期: 2026年10月19日
+
+    ## 查询语法
+    | 写法                      | 说明                                   |
+    |---------------------------|----------------------------------------|
+    | `div` / `*`               | 标签名（省略或`*`表示任意标签）        |
+    | `[href]`                  | 属性存在                               |
+    | `[id=main]`               | 属性值相等                             |
+    | `[href*=video]`           | 属性值包含                             |
+    | `[class~=item]`           | 属性值按空白分隔后包含该单词           |
+    | `[href^=https]`           | 属性值前缀                             |
+    | `depth:3` / `depth:2..5`  | 深度等于或位于区间，`2..`/`..5`为半开  |
+    | `path:/html/body/div[2]`  | 元素位于该XPath之下（祖先前缀）        |
+    | `text:/^\\d+$/i`           | 文本正则，`i`表示忽略大小写            |
+
+    属性值与参数中含空白时可使用单引号或双引号包裹，各条件之间为“与”关系。
+
+    ## 初始化示例
+    ```python
+    selector = compile('a[class~=link][href*="/video/"] depth:3.. path:/html/body')
+    result = selector.find(converter)
+    # 多个条件同时成立：位于两个祖先之下，且文本同时包含 apple 与 banana
+    compile("p path:/html/body path:/html/body/div text:/apple/ text:/banana/i").find(converter)
+    selector.match("/html/body/a", converter.dict()["/html/body/a"])
+    ```
+    '''
+
+    _token = re_compile(r'''
+        (?P<space>\s+)
+      | \[\s*(?P<name>[^\]\s=*~^]+)\s*
+        (?:(?P<op>[*~^]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]]*?)\s*)?\]
+      | (?P<key>depth|path):(?P<arg>"[^"]*"|'[^']*'|\S+)
+      | text:(?P<pattern>"[^"]*"|'[^']*'|/(?:\\.|[^/\\])*/i?|\S+)
+      | (?P<tag>[\w:*-]+)
+    ''', VERBOSE)
+
+    def __init__(self, query: str):
+        '''
+        编译查询字符串
+
+        ### 参数说明
+        | 参数名 | 类型 | 必须 | 说明       |
+        |--------|------|------|------------|
+        | query  | str  | 是   | 查询字符串 |
+
+        ### 异常
+        ValueError: 查询字符串无法解析时抛出，并指明出错位置
+        '''
+        self.query = query
+        self.tag = None
+        self._tests = []
+        tests_attr, tests_text = [], []
+        position = 0
+        while position < len(query):
+            token = self._token.match(query, position)
+            if token is None:
+                raise ValueError(f"无法解析的查询: {query!r}，位置: {position}")
+            position = token.end()
+            if token["name"]:
+                tests_attr.append(self._attribute(
+                    token["name"], token["op"], self._unquote(token["value"] or "")))
+            elif token["key"] == "depth":
+                self._tests.append(self._depth(token["arg"]))
+            elif token["key"] == "path":
+                self._tests.append(self._path(self._unquote(token["arg"])))
+            elif token["pattern"]:
+                tests_text.append(self._text(self._pattern(token["pattern"])))
+            elif token["tag"]:
+                if self.tag is not None:
+                    raise ValueError(f"查询中只能指定一个标签: {query!r}")
+                self.tag = None if token["tag"] == "*" else token["tag"].lower()
+        self._tests.extend(tests_attr)
+        self._tests.extend(tests_text)
+
+    def __repr__(self) -> str:
+        return f"Selector({self.query!r})"
+
+    def match(self, xpath: str, record: Dict[str, Any]) -> bool:
+        '''
+        判断单个元素记录是否匹配
+
+        ### 参数说明
+        | 参数名 | 类型 | 必须 | 说明                          |
+        |--------|------|------|-------------------------------|
+        | xpath  | str  | 是   | 元素XPath                     |
+        | record | dict | 是   | `HTMLToJSON.dict()`中的记录   |
+        '''
+        if self.tag is not None and record["tag"] != self.tag:
+            return False
+        return all(test(xpath, record) for test in self._tests)
+
+    def find(self, source) -> Dict[str, Dict]:
+        '''
+        在文档中查找全部匹配元素
+
+        ### 参数说明
+        | 参数名 | 类型                                  | 必须 | 说明     |
+        |--------|---------------------------------------|------|----------|
+        | source | HTMLToJSON / CompactMapping / dict    | 是   | 目标文档 |
+
+        ### 返回值
+        dict: 与`Scanner.find`相同形式的`{xpath: record}`结果
+        '''
+        if isinstance(source, HTMLToJSON):
+            mapping = source._xpath_mapping
+            candidates = source.index().get(self.tag, ()) if self.tag else mapping
+            return {
+                xpath: mapping[xpath] for xpath in candidates
+                if self.match(xpath, mapping[xpath])
+            }
+        if isinstance(source, CompactMapping):
+            if self.tag is None:
+                candidates = range(len(source))
+            else:
+                tag_id = source.string_id(self.tag)
+                tags = source._cols["tag"]
+                candidates = () if tag_id is None else (
+                    node for node in range(len(source)) if tags[node] == tag_id)
+            result = {}
+            for node in candidates:
+                xpath = source.xpath(node)
+                record = source.record(node)
+                if self.match(xpath, record):
+                    result[xpath] = record
+            return result
+        return {
+            xpath: record for xpath, record in source.items()
+            if self.match(xpath, record)
+        }
+
+    @staticmethod
+    def _unquote(value: str) -> str:
+        '''[内部方法] 去除成对引号'''
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            return value[1:-1]
+        return value
+
+    @classmethod
+    def _pattern(cls, arg: str):
+        '''[内部方法] 编译文本正则，支持`/pattern/i`写法'''
+        if arg.startswith("/") and (arg.endswith("/") or arg.endswith("/i")) and len(arg) > 1:
+            flags = IGNORECASE if arg.endswith("i") else 0
+            return re_compile(arg[1:arg.rindex("/")], flags)
+        return re_compile(cls._unquote(arg))
+
+    @staticmethod
+    def _path(arg: str):
+        '''[内部方法] 解析祖先XPath前缀条件'''
+        prefix = arg.rstrip("/") + "/"
+        return lambda xpath, record: xpath.startswith(prefix)
+
+    @staticmethod
+    def _text(pattern):
+        '''[内部方法] 生成文本正则条件'''
+        return lambda xpath, record: pattern.search(record["text"]) is not None
+
+    @staticmethod
+    def _depth(arg: str):
+        '''[内部方法] 解析深度条件'''
+        try:
+            if ".." in arg:
+                low, high = arg.split("..", 1)
+                low = int(low) if low else 0
+                high = int(high) if high else float("inf")
+            else:
+                low = high = int(arg)
+        except ValueError as e:
+            raise ValueError(f"无效的深度条件: depth:{arg}") from e
+        return lambda xpath, record: low <= record["depth"] <= high
+
+    @staticmethod
+    def _attribute(name: str, op: Optional[str], value: str):
+        '''[内部方法] 解析属性条件'''
+        match op:
+            case None:
+                return lambda xpath, record: name in record["attributes"]
+            case "=":
+                return lambda xpath, record: record["attributes"].get(name) == value
+            case "*=":
+                return lambda xpath, record: value in record["attributes"].get(name, "")
+            case "~=":
+                return lambda xpath, record: value in record["attributes"].get(name, "").split()
+            case "^=":
+                return lambda xpath, record: record["attributes"].get(name, "").startswith(value)
+
+
+@lru_cache(maxsize=256)
+def compile(query: str) -> Selector:
+    '''
+    编译查询字符串为可复用的选择器，相同查询只编译一次
+
+    ## 输入参数
+    | 参数名 | 类型 | 必须 | 说明                         |
+    |--------|------|------|------------------------------|
+    | query  | str  | 是   | 查询字符串，语法见`Selector` |
+
+    ## 返回值
+    Selector: 预编译的选择器
+
+    ## 示例调用
+    ```python
+    selector = compile("p[class~=title] depth:..5")
+    for converter in converters:
+        print(selector.find(converter))
+    ```
+    '''
+    return Selector(query)
+
+
 class Scanner:
     '''
     数据扫描工具
@@ -557,7 +1330,8 @@ def search(
 </body>
 </html>
 """,
-    type_fuzzy_match=False
+    type_fuzzy_match=False,
+    cache=None
 ):
     '''
     主测试函数
@@ -588,6 +1362,7 @@ def search(
     | 参数名       | 类型   | 必须 | 默认值 | 说明         |
     |--------------|--------|------|--------|--------------|
     | data_search  | str    | 否   | "关注" | 要搜索的字符串 |
+    | cache        | DocumentCache | 否 | None | 文档缓存，重复页面不再重新解析 |
 
     ## 返回值
     无
@@ -603,8 +1378,8 @@ def search(
 
     try:
         # 从HTML字符串生成JSON
-        html_code = HTMLToJSON.create_from_string(html_code).json()
-        html_code = loads(html_code)
+        html_code = HTMLToJSON.create_from_string(
+            html_code, cache=cache).dict()
         html_code = Scanner(
             html_code,
             html_search,
@@ -160,7 +160,10 @@ async def websocket(ws):
     - 持续监听客户端发送的消息，超时时间设置为 0.2 秒。
     - 支持以下两种类型的消息处理：
         - **查询请求**：如果消息中包含 `$query`，则返回查询结果的总数和详细数据。
-        - **常规消息**：处理常规消息，检查消息的有效性，并根据需要存储到 MongoDB 中。
+        - **常规消息**：处理常规消息，检查消息的有效性，并根据需要存储到 MongoDB 中；
+          消息带有关联标识 `id` 时，回执中原样带回该 `id`，发送方可据此匹配回执。
+        - **扇出消息**：`receive` 为地址列表时，向列表中每个已连接的设备各转发一份消息（一次提交），
+          回执的 `targets` 中列出每个设备的状态，`status` 仅在全部设备均已连接时为 True。
 
     5. **缓存数据转发**：
     - 从 MongoDB 缓存表中删除并获取数据，将其转发给客户端。
@@ -236,13 +239,27 @@ async def websocket(ws):
                     await ws.send(dumps(f1, indent=4, ensure_ascii=False))
             else:
                 if (data_msg != dict()):
+                    # receive 为地址列表时向每个设备分发一份消息（扇出），回执中附带每个设备的状态
+                    data_fanout = all(type(f1) == list for f1 in data_msg["receive"])
+                    data_targets = [
+                        {
+                            "receive": f1,
+                            "status": type(db_type.find_one({"receive": f1}, {"_id": 0})) == dict
+                        }
+                        for f1 in (data_msg["receive"] if data_fanout else [data_msg["receive"]])
+                    ]
                     data_status = {
-                        "status": type(db_type.find_one({"receive": data_msg["receive"]}, {"_id": 0})) == dict,
+                        "status": all(f1["status"] for f1 in data_targets) and bool(data_targets),
                         "send": data_msg["send"],
                         "receive": data_msg["receive"],
                     }
-                    if (data_status["status"]):
-                        db_mq.insert_one(data_msg.copy())
+                    if ("id" in data_msg):
+                        data_status["id"] = data_msg["id"]
+                    if (data_fanout):
+                        data_status["targets"] = data_targets
+                    for f1 in data_targets:
+                        if (f1["status"]):
+                            db_mq.insert_one({**data_msg, "receive": f1["receive"]})
                     await ws.send(dumps(data_status, indent=4, ensure_ascii=False))
             data_msg = db_mq.find_one_and_delete(
                 {"receive": data_base["receive"]}, {"_id": 0}
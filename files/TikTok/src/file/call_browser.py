@@ -118,29 +118,147 @@ See Also:
 
 
 # 标准库
-from time import sleep, time
-from os import makedirs
+from time import sleep, time, perf_counter
+from os import makedirs, cpu_count
 from os.path import dirname, join
+from socket import socket, create_connection
+from threading import Condition
+from collections import OrderedDict
+from contextlib import contextmanager
+from queue import Queue
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # 第三方库
 from io import BytesIO
 from PIL import Image
-from numpy import array
-from base64 import b64decode
-from cv2 import COLOR_RGB2GRAY, QRCodeDetector, cvtColor
+from numpy import array, frombuffer, full, uint8
+from base64 import b64decode, b64encode
+from cv2 import (
+    COLOR_RGB2GRAY,
+    IMREAD_GRAYSCALE,
+    INTER_NEAREST,
+    QRCodeDetector,
+    QRCodeEncoder,
+    cvtColor,
+    imdecode,
+    imencode,
+    resize
+)
 
 # Selenium 相关库
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from typing import List, Dict, Any, Callable, Iterator, Optional, Set, Tuple, Union
+from inspect import Signature, signature
 from pyautogui import press
 from subprocess import Popen
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.action_chains import ActionChains
 
+# 页面脚本与字段映射
+from call_script import (
+    JS_EXTRACT,
+    JS_COLLECT,
+    JS_NETWORK_IDLE,
+    JS_TRAFFIC,
+    JS_DEBUG,
+    JS_QR_PIXELS,
+    FIELDS_COMMENT,
+    FIELDS_USER_LIST,
+    FIELDS_SEARCH_USER,
+    FIELDS_SEARCH_VIDEO,
+    BLOCK_PATTERNS,
+    LIST_SELECTORS
+)
+from call_plan import commands as plan_commands, plan as plan_steps
+
+# 网络接口抓取与页面快照
+from call_capture import capture
+from call_dedup import dedup_store, pending as dedup_pending
+
+
+class qrdecoder:
+    """
+    可复用的二维码解码器，保留 `QRCodeDetector` 与带白边的灰度缓冲区，避免每次解码重新创建。
+
+    支持两种输入：页面画布的原始灰度像素（`decode_gray`，跳过 PNG 编解码）与 PNG 数据 URL（`decode_png`）。
+    `QRCodeDetector` 不是线程安全的，每个 `tiktok` 实例使用各自的解码器。
+
+    属性:
+        border (int): 图像四周补充的白边宽度（像素）。
+
+    示例:
+        >>> decoder = qrdecoder()
+        >>> decoder.decode_png("data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAUA...")
+        "https://example.com/login/callback"
+    """
+
+    def __init__(
+        self,
+        border: int = 10
+    ) -> None:
+        self.border = border
+        self._detector = QRCodeDetector()
+        self._buffer = None
+
+    def decode_gray(
+        self,
+        qr_gray: bytes,
+        width: int,
+        height: int
+    ) -> str:
+        """
+        解码按行排列的 8 位灰度像素。
+
+        参数:
+            qr_gray (bytes): 长度为 width * height 的灰度像素。
+            width (int): 图像宽度。
+            height (int): 图像高度。
+
+        返回:
+            str: 解码后的二维码内容，解码失败时为空字符串。
+        """
+        qr_buffer = self._padded(width, height)
+        qr_buffer[self.border:self.border + height, self.border:self.border + width] = frombuffer(
+            qr_gray,
+            dtype=uint8
+        ).reshape(height, width)
+        return self._detector.detectAndDecode(qr_buffer)[0]
+
+    def decode_png(
+        self,
+        qr_image_base64: str
+    ) -> str:
+        """
+        解码 PNG 数据 URL（或纯 base64 字符串），直接解码为灰度图像。
+
+        返回:
+            str: 解码后的二维码内容，解码失败时为空字符串。
+        """
+        qr_image = imdecode(
+            frombuffer(b64decode(qr_image_base64.split(",", 1)[-1]), dtype=uint8),
+            IMREAD_GRAYSCALE
+        )
+        if qr_image is None:
+            return str()
+        return self.decode_gray(qr_image.tobytes(), qr_image.shape[1], qr_image.shape[0])
+
+    def _padded(
+        self,
+        width: int,
+        height: int
+    ):
+        # 尺寸不变时复用缓冲区，白边区域始终保持为 255
+        qr_shape = (height + 2 * self.border, width + 2 * self.border)
+        if self._buffer is None or self._buffer.shape != qr_shape:
+            self._buffer = full(qr_shape, 255, dtype=uint8)
+        return self._buffer
+
 
 class tiktok:
     """
@@ -160,6 +278,9 @@ class tiktok:
         username (str): TikTok 账号用户名。
         proxy (str): 代理服务器地址（可选）。
         headless (bool): 是否以无头模式运行浏览器。
+        capture (bool): 是否开启网络抓取模式。
+        lite (bool): 是否以轻量模式启动浏览器。
+        network (capture): 网络抓取模式下的接口抓取器。
         driver (webdriver): Selenium WebDriver 实例。
         browser_process (Popen): 浏览器进程实例。
         user_data_dir (str): 用户数据目录。
@@ -181,16 +302,36 @@ class tiktok:
     注意:
         使用该类时需要确保 Chrome 浏览器已安装，并且 Selenium WebDriver 配置正确。
         如果使用代理或无头模式，需要确保相关配置正确。
+        开启 `capture` 后，未指定回复内容的 `comment`、`user_list`、`search_user`、`search_video` 直接读取接口响应（见 `call_capture`），返回的键名与 DOM 提取相同。
         网络问题可能导致某些操作失败，请确保网络连接正常，并检查提供的 URL 是否合法。
     """
 
+    # 资源拦截规则（Network.setBlockedURLs 通配符），按类型由 `block` 选用
+    block_patterns: Dict[str, List[str]] = BLOCK_PATTERNS
+
+    # 各列表提取器的 (父容器, 子元素) CSS 选择器，供 `snapshot` 滚动加载使用
+    list_selectors: Dict[str, Tuple[str, str]] = LIST_SELECTORS
+
+    # 轻量模式的额外启动参数：不自动播放、静音、关闭后台网络与组件更新，并限制渲染进程数量
+    lite_args: List[str] = [
+        "--autoplay-policy=user-gesture-required",
+        "--mute-audio",
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-sync",
+        "--disable-features=MediaRouter,OptimizationHints,Translate",
+        "--renderer-process-limit=2",
+    ]
+
     def __init__(
         self,
         browser_path: Optional[str] = None,
         debug_port: Optional[int] = None,
         username: Optional[str] = None,
         proxy: Optional[str] = None,
-        headless: bool = False
+        headless: bool = False,
+        capture: bool = False,
+        lite: bool = False
     ) -> None:
         """
         初始化 TikTok 自动化操作类。
@@ -201,6 +342,8 @@ class tiktok:
             username (str, 可选): TikTok 账号用户名，默认为 "default"。
             proxy (str, 可选): 代理服务器地址，默认为 None。
             headless (bool, 可选): 是否以无头模式运行浏览器，默认为 False。
+            capture (bool, 可选): 是否开启网络抓取模式，开启后搜索、评论与用户列表直接读取接口响应，默认为 False。
+            lite (bool, 可选): 是否以轻量模式启动浏览器（见 `lite_args`），默认为 False。
 
         示例:
             >>> tiktok_instance = tiktok(browser_path="/path/to/chrome", debug_port=9222, username="my_username")
@@ -210,80 +353,198 @@ class tiktok:
         self.username = username or "default"
         self.proxy = proxy
         self.headless = headless
+        self.capture = capture
+        self.lite = lite
+        self.network = None
+        self.decoder = None
         self.driver = None
         self.browser_process = None
+        self.dedup_pending: Dict[str, Dict[str, None]] = dict()
         self.user_data_dir = join(dirname(__file__), "profiles", self.username)
         self.cache_dir = join(dirname(__file__), "cache", self.username)
         makedirs(self.user_data_dir, exist_ok=True)
         makedirs(self.cache_dir, exist_ok=True)
 
-    def _rec_trav_debug_(
+    def debug_iter(
         self,
-        html_element: WebElement
-    ) -> List[WebElement]:
+        css_selector: str,
+        depth_max: Optional[int] = None,
+        chunk_size: int = 2000
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        递归遍历给定元素的所有子元素，并返回扁平化的 WebElement 对象列表。
+        按先序遍历分批返回目标容器子树的标签结构，每批最多 `chunk_size` 个标签，适用于非常大的子树。
+
+        每批只需一次 `execute_script` 调用：页面内以显式栈遍历子树，并只序列化本批范围内的标签。
 
         参数:
-            html_element (WebElement): 当前要遍历的 WebElement 对象。
+            css_selector (str): 目标容器的 CSS 选择器。
+            depth_max (int, 可选): 相对于目标容器的最大深度，0 表示只返回容器本身，默认为不限。
+            chunk_size (int): 每批返回的标签数量。
 
         返回:
-            List[WebElement]: 扁平化的 WebElement 对象列表。
+            Iterator[List[Dict[str, Any]]]: 逐批生成的标签结构列表，格式同 `debug`。
 
-        注意:
-            该方法主要用于内部调试，不建议直接调用。
+        示例:
+            >>> for chunk in tiktok_instance.debug_iter("body", chunk_size=1000):
+            ...     print(len(chunk))
         """
-        html_elements = [html_element]
-        html_children = html_element.find_elements(By.XPATH, "./*")
-        for html_child in html_children:
-            html_elements.extend(self._rec_trav_debug_(html_child))
-        return html_elements
+        debug_start = 0
+        while True:
+            debug_step = self.driver.execute_script(
+                JS_DEBUG,
+                css_selector,
+                depth_max,
+                debug_start,
+                chunk_size
+            )
+            if debug_step is None:
+                raise NoSuchElementException(
+                    f"Unable to locate element: {css_selector}")
+            debug_start += len(debug_step["items"])
+            if debug_step["items"]:
+                yield debug_step["items"]
+            if debug_step["done"]:
+                break
 
     def debug(
         self,
-        css_selector: str
+        css_selector: str,
+        depth_max: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         通过给定的 CSS 选择器获取页面上的所有标签结构。
 
+        整个子树在页面内一次序列化，只需一次 `execute_script` 调用；子树非常大时请使用 `debug_iter` 分批获取。
+
         参数:
             css_selector (str): 目标容器的 CSS 选择器。
+            depth_max (int, 可选): 相对于目标容器的最大深度，0 表示只返回容器本身，默认为不限。
 
         返回:
-            List[Dict[str, Any]]: 标签结构列表，每个标签包含其名称、属性、文本内容和 CSS 类名。
+            List[Dict[str, Any]]: 标签结构列表（先序），每个标签包含其名称、属性、文本内容和 CSS 类名。
 
         示例:
             >>> tiktok_instance.get("https://www.tiktok.com/@exampleuser")
-            >>> result = tiktok_instance.debug("div.some-class")
+            >>> result = tiktok_instance.debug("div.some-class", depth_max=3)
             >>> print(result)
             [
                 {"html_tag_name": "div", "html_class": "some-class", "html_text": "Example Text",
                     "html_attributes": "<div class='some-class'>Example Text</div>"}
             ]
         """
-        obj_data = []
-        for obj_element in self._rec_trav_debug_(
-            self.driver.find_element(
-                By.CSS_SELECTOR,
-                css_selector
-            )
-        ):
-            obj_data.append(
-                {
-                    "html_tag_name": obj_element.tag_name,
-                    "html_class": obj_element.get_attribute("class"),
-                    "html_text": obj_element.text,
-                    "html_attributes": obj_element.get_attribute("outerHTML"),
-                }
-            )
-        return obj_data
+        debug_step = self.driver.execute_script(
+            JS_DEBUG,
+            css_selector,
+            depth_max,
+            0,
+            None
+        )
+        if debug_step is None:
+            raise NoSuchElementException(
+                f"Unable to locate element: {css_selector}")
+        return debug_step["items"]
+
+    def _collect(
+        self,
+        css_parent: str,
+        css_child: str,
+        fields: Optional[Dict[str, List[Any]]] = None,
+        css_max: float = float('inf'),
+        time_delay: float = 5.0
+    ) -> Iterator[List[Any]]:
+        """
+        增量采集无限滚动列表，每次滚动只返回新出现的条目。
+
+        每一步通过一次 `execute_async_script` 完成：已有未采集的子元素时立即返回；
+        否则滚动到最后一个子元素，由页面内的 `MutationObserver` 在新子元素出现时立即返回，
+        等待时间只取决于页面加载速度。达到 `css_max` 条或等待超时仍无新条目时结束。
+
+        参数:
+            css_parent (str): 父容器的 CSS 选择器。
+            css_child (str): 子元素的 CSS 选择器。
+            fields (dict, 可选): 字段映射，为 None 时返回 WebElement，否则返回提取后的字典。
+            css_max (float): 最大获取的数量。
+            time_delay (float): 每次滚动后等待新条目出现的最长时间（秒）。
+
+        返回:
+            Iterator[List[Any]]: 逐批生成新条目的列表。
+
+        示例:
+            >>> for batch in tiktok_instance._collect(".parent-class", ".child-class", FIELDS_SEARCH_VIDEO, css_max=100):
+            ...     print(len(batch))
+        """
+        self.driver.set_script_timeout(time_delay + 10)
+        css_seen = 0
+        try:
+            while css_seen < css_max:
+                css_step = self.driver.execute_async_script(
+                    JS_COLLECT,
+                    css_parent,
+                    css_child,
+                    css_seen,
+                    fields,
+                    int(time_delay * 1000)
+                )
+                if not css_step["parent"]:
+                    raise NoSuchElementException(
+                        f"Unable to locate element: {css_parent}")
+                css_items = css_step["items"][:int(min(len(css_step["items"]), css_max - css_seen))]
+                if not css_items:
+                    break
+                css_seen += len(css_items)
+                yield css_items
+        finally:
+            self.driver.execute_script("window.scrollTo(0, 0);")
+
+    def _dedup(
+        self,
+        api_name: str,
+        batches: Iterator[List[Dict[str, Any]]],
+        dedup_stop: Optional[float] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        按去重索引过滤逐批结果：只生成新条目，一批中已知条目的比例达到 `dedup_stop` 时停止采集。
+
+        参数:
+            api_name (str): 提取器名，见 `call_dedup.DEDUP_KEYS`。
+            batches (Iterator): 原始批次。
+            dedup_stop (float, 可选): 停止比例，None 表示不去重，原样生成。
+
+        注意:
+            `css_count` 限制的是加载的条目数量（含已知条目）。新条目的键只加入 `dedup_pending`，
+            由调用方在结果送达后通过 `dedup_pop` 取出并交给 `dedup.commit` 记录。
+        """
+        if dedup_stop is None:
+            yield from batches
+            return
+        dedup_index = dedup_store()
+        api_pending = self.dedup_pending.setdefault(api_name, dict())
+        try:
+            for items in batches:
+                items, items_known, items_keys = dedup_index.filter(api_name, items, api_pending)
+                api_pending.update(dict.fromkeys(items_keys))
+                if items:
+                    yield items
+                if items_known >= dedup_stop:
+                    break
+        finally:
+            batches.close()
+
+    def dedup_pop(
+        self
+    ) -> Dict[str, List[str]]:
+        """
+        取出尚未记录的去重键 {提取器名: [键, ...]}（见 `_dedup`），没有时返回空字典。
+        """
+        pending, self.dedup_pending = self.dedup_pending, dict()
+        return {api_name: list(api_keys) for api_name, api_keys in pending.items() if api_keys}
 
     def _object(
         self,
         css_parent: str = ".css-7whb78-DivCommentListContainer",
         css_child: str = ".css-13wx63w-DivCommentObjectWrapper",
         css_max: float = float('inf'),
-        time_delay: float = 1.0
+        time_delay: float = 5.0
     ) -> List[WebElement]:
         """
         获取页面上的列表。
@@ -292,49 +553,78 @@ class tiktok:
             css_parent (str): 父容器的 CSS 选择器。
             css_child (str): 子元素的 CSS 选择器。
             css_max (float): 最大获取的数量。
-            time_delay (float): 每次滚动后的延迟时间。
+            time_delay (float): 每次滚动后等待新元素出现的最长时间（秒）。
 
         返回:
             list: 包含子元素的 WebElement 列表。
 
         示例:
-            >>> result = tiktok_instance._object(css_parent=".parent-class", css_child=".child-class", css_max=10, time_delay=1.0)
+            >>> result = tiktok_instance._object(css_parent=".parent-class", css_child=".child-class", css_max=10, time_delay=5.0)
             >>> print(result)
             [<WebElement (session="abc123", element="def456")>, ...]
         """
-        obj_comments = [
-            self.driver.find_element(
-                By.CSS_SELECTOR,
-                css_parent
-            )
-        ]
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView();",
-            obj_comments[0]
-        )
-        obj_prev_comments = None
-        while len(obj_comments) < css_max and obj_comments != obj_prev_comments:
-            obj_prev_comments = obj_comments.copy()
-            for _ in range(2):
-                sleep(time_delay)
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView(true);",
-                    obj_comments[-1]
-                )
-                sleep(time_delay)
-                obj_comments = self.driver.find_elements(
-                    By.CSS_SELECTOR,
-                    css_child
-                )
-                time_delay += (time_delay / 100)
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        return obj_comments[:int(css_max)]
+        return list(chain.from_iterable(self._collect(
+            css_parent=css_parent,
+            css_child=css_child,
+            css_max=css_max,
+            time_delay=time_delay
+        )))
+
+    def _extract(
+        self,
+        html_elements: List[WebElement],
+        fields: Dict[str, List[Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        按字段映射批量提取元素信息，所有条目与字段只需一次 `execute_script` 调用。
 
-    def launch(
+        参数:
+            html_elements (List[WebElement]): 要提取的条目元素列表。
+            fields (Dict[str, List[Any]]): 字段映射，格式见 `call_script` 模块说明。
+
+        返回:
+            List[Dict[str, Any]]: 与条目顺序一致的字典列表，键与字段映射一致。
+
+        示例:
+            >>> tiktok_instance._extract(elements, {"link": ["a", "href"], "name": ["p", "text"]})
+            [{"link": "https://www.tiktok.com/@user1", "name": "user1"}, ...]
+        """
+        if not html_elements:
+            return []
+        return self.driver.execute_script(JS_EXTRACT, html_elements, fields)
+
+    def alive(
         self
+    ) -> bool:
+        """
+        检查浏览器会话是否可用：浏览器进程仍在运行，且 WebDriver 能正常执行脚本。
+
+        返回:
+            bool: 会话可用时返回 True；否则返回 False。
+
+        示例:
+            >>> tiktok_instance.alive()
+            True
+        """
+        if self.browser_process is not None and self.browser_process.poll() is not None:
+            return False
+        if self.driver is None:
+            return False
+        try:
+            return self.driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def launch(
+        self,
+        time_delay: float = 10.0
     ) -> bool:
         """
         启动浏览器，并根据指定的配置运行。
+        浏览器进程已在运行时不会重复启动；新启动时会等待调试端口可连接（最多 `time_delay` 秒）。
+
+        参数:
+            time_delay (float): 等待调试端口可连接的最长时间（秒）。
 
         返回:
             bool: 如果浏览器启动成功，返回 True；否则返回 False。
@@ -343,6 +633,8 @@ class tiktok:
             >>> tiktok_instance.launch()
             True
         """
+        if self.browser_process is not None and self.browser_process.poll() is None:
+            return True
         try:
             browser_args = [
                 self.browser_path,
@@ -360,8 +652,20 @@ class tiktok:
             ]
             self.proxy and browser_args.append(f"--proxy-server={self.proxy}")
             self.headless and browser_args.append("--headless=new")
+            self.lite and browser_args.extend(self.lite_args)
             self.browser_process = Popen(browser_args)
-            return True
+            time_start = time()
+            while time() - time_start < time_delay:
+                try:
+                    create_connection(("127.0.0.1", self.debug_port), timeout=0.5).close()
+                    return True
+                except OSError:
+                    if self.browser_process.poll() is not None:
+                        break
+                    sleep(0.1)
+            # 调试端口始终不可连接（或浏览器已退出）：结束进程，视为启动失败
+            self.close()
+            return False
         except:
             return False
 
@@ -369,7 +673,7 @@ class tiktok:
         self
     ) -> bool:
         """
-        连接到正在运行的浏览器实例。
+        连接到正在运行的浏览器实例。已有可用的 WebDriver 会话时直接复用。
 
         返回:
             bool: 如果连接成功，返回 True；否则返回 False。
@@ -378,13 +682,20 @@ class tiktok:
             >>> tiktok_instance.connect()
             True
         """
+        if self.alive():
+            return True
         try:
             browser_options = Options()
             browser_options.add_experimental_option(
                 "debuggerAddress",
                 f"127.0.0.1:{self.debug_port}"
             )
+            self.capture and browser_options.set_capability(
+                "goog:loggingPrefs",
+                {"performance": "ALL"}
+            )
             self.driver = webdriver.Chrome(options=browser_options)
+            self.network = capture(self.driver) if self.capture else None
             return True
         except Exception as e:
             return False
@@ -392,43 +703,173 @@ class tiktok:
     def quit(self):
         self.driver.close()
         self.driver.quit()
+        self.driver = None
+
+    def close(
+        self
+    ) -> None:
+        """
+        结束 WebDriver 会话并终止由本实例启动的浏览器进程，失败时忽略。
+
+        示例:
+            >>> tiktok_instance.close()
+        """
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+        if self.browser_process is not None:
+            try:
+                self.browser_process.terminate()
+                self.browser_process.wait(timeout=10)
+            except Exception:
+                self.browser_process.kill()
+            self.browser_process = None
+
+    def wait(
+        self,
+        wait_for: Union[str, Dict[str, Any], None] = None,
+        time_delay: float = 5.0,
+        browser_link: Optional[str] = None
+    ) -> bool:
+        """
+        等待页面满足指定条件，条件满足时立即返回，最长等待 `time_delay` 秒。
+
+        参数:
+            wait_for (str | dict, 可选): 等待条件，为空时不等待。字符串表示 CSS 选择器，字典可组合以下条件（需全部满足）：
+                - "css" (str): 页面上存在匹配该 CSS 选择器的元素。
+                - "url" (str | bool): 当前 URL 包含该字符串；为 True 时表示 URL 与 `browser_link` 不同。
+                - "idle" (int | bool): 页面加载完成且网络静默指定毫秒数（为 True 时为 500 毫秒）。
+            time_delay (float): 最长等待时间（秒）。
+            browser_link (str, 可选): 判断 URL 变化时的原始 URL，默认为当前 URL。
+
+        返回:
+            bool: 条件在超时前满足时返回 True；超时返回 False。
+
+        示例:
+            >>> tiktok_instance.wait({"css": "div[data-e2e='user-post-item']", "idle": 500}, time_delay=5.0)
+            True
+        """
+        if not wait_for or time_delay <= 0:
+            return True
+        if isinstance(wait_for, str):
+            wait_for = {"css": wait_for}
+        browser_link = browser_link or self.driver.current_url
+        wait_conditions = list()
+        if wait_for.get("css"):
+            wait_conditions.append(lambda driver: driver.find_elements(
+                By.CSS_SELECTOR,
+                wait_for["css"]
+            ))
+        if wait_for.get("url") is True:
+            wait_conditions.append(lambda driver: driver.current_url != browser_link)
+        elif wait_for.get("url"):
+            wait_conditions.append(lambda driver: wait_for["url"] in driver.current_url)
+        if wait_for.get("idle"):
+            wait_quiet = 500 if wait_for["idle"] is True else int(wait_for["idle"])
+            wait_conditions.append(lambda driver: driver.execute_script(
+                JS_NETWORK_IDLE,
+                wait_quiet
+            ))
+        try:
+            WebDriverWait(self.driver, time_delay, poll_frequency=0.1).until(
+                lambda driver: all(condition(driver) for condition in wait_conditions)
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def block(
+        self,
+        block_types: List[str] = ["media", "font", "tracker"],
+        block_urls: List[str] = []
+    ) -> List[str]:
+        """
+        拦截指定类型的资源请求，对当前会话后续的所有页面生效，直到再次调用。
+
+        通过 CDP `Network.setBlockedURLs` 在浏览器内拦截，被拦截的请求不会下载。
+        可作为命令单独调用：在只需要文本的命令（如 `user_list`）前加入 `"block": None`，
+        需要恢复时加入 `"block": {"block_types": []}`。
+
+        参数:
+            block_types (list): 拦截的资源类型，可选 "image"、"font"、"media"、"tracker"（见 `block_patterns`）。
+            block_urls (list): 额外拦截的 URL 通配符。
+
+        返回:
+            list: 当前生效的拦截规则。
+
+        示例:
+            >>> tiktok_instance.block(block_types=["image", "media", "font", "tracker"])
+            ['*.jpg*', '*.jpeg*', ...]
+        """
+        block_list = [
+            pattern
+            for block_type in block_types
+            for pattern in self.block_patterns.get(block_type, [])
+        ] + list(block_urls)
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": block_list})
+        return block_list
+
+    def traffic(
+        self
+    ) -> Dict[str, int]:
+        """
+        统计当前页面自加载以来的网络请求数量与传输字节数，用于比较开启拦截前后的流量。
+
+        返回:
+            dict: {"requests": 请求数量, "bytes": 传输字节数}；被拦截的请求不计入。
+
+        示例:
+            >>> tiktok_instance.traffic()
+            {'requests': 86, 'bytes': 1843210}
+        """
+        return self.driver.execute_script(JS_TRAFFIC)
 
     def get(
         self,
         browser_link: str = "https://www.tiktok.com/login/qrcode",
-        time_delay: float = 1.0
-    ) -> None:
+        time_delay: float = 1.0,
+        wait_for: Union[str, Dict[str, Any], None] = {"idle": 300}
+    ) -> bool:
         """
-        在浏览器中导航到指定的 URL。
+        在浏览器中导航到指定的 URL，并等待页面就绪。
 
         参数:
             browser_link (str): 要导航到的 URL。
-            time_delay (float): 导航后等待的时间（秒）。
+            time_delay (float): 导航后等待页面就绪的最长时间（秒）。
+            wait_for (str | dict, 可选): 页面就绪条件，格式见 `wait`，默认为网络静默 300 毫秒。
 
         返回:
-            None
+            bool: 就绪条件在超时前满足时返回 True；否则返回 False。
 
         示例:
             >>> tiktok_instance.get("https://www.tiktok.com/@exampleuser", time_delay=5.0)
+            >>> tiktok_instance.get("https://www.tiktok.com/search/video?q=google", time_delay=5.0, wait_for="a.css-1mdo0pl-AVideoContainer")
 
         注意:
             如果导航失败，可能是由于网络问题或提供的 URL 不合法。请检查网络连接并确保 URL 正确。
         """
+        self.network and self.network.drain()
         self.driver.get(browser_link)
         press("esc")
-        sleep(time_delay)
+        return self.wait(wait_for, time_delay)
 
     def click(
         self,
         css_selector: str = "div.css-1ldzp5s-DivNumber",
-        time_delay: float = 1.0
+        time_delay: float = 1.0,
+        wait_for: Union[str, Dict[str, Any], None] = {"idle": 300}
     ) -> bool:
         """
-        点击页面上的指定元素。
+        点击页面上的指定元素，并等待页面响应。
 
         参数:
             css_selector (str): 要点击的元素的 CSS 选择器。
-            time_delay (float): 点击前的延迟时间。
+            time_delay (float): 点击后等待条件满足的最长时间（秒）。
+            wait_for (str | dict, 可选): 点击后的等待条件，格式见 `wait`，默认为网络静默 300 毫秒。
 
         返回:
             bool: 如果点击成功，返回 True；否则返回 False。
@@ -437,6 +878,7 @@ class tiktok:
             >>> tiktok_instance.click(css_selector="button.some-class", time_delay=1.0)
             True
         """
+        browser_link = self.driver.current_url
         try:
             self.driver.find_elements(
                 By.CSS_SELECTOR,
@@ -444,30 +886,32 @@ class tiktok:
             )[1].click()
         except:
             return False
-        sleep(time_delay)
+        self.wait(wait_for, time_delay, browser_link)
         return True
 
     def msg(
         self,
         msg_send: str = "Hello World!",
-        time_delay: float = 0.0
+        time_delay: float = 0.0,
+        wait_for: Union[str, Dict[str, Any], None] = None
     ) -> None:
         """
         在输入框中输入指定内容并发送消息。
 
         参数:
             msg_send (str): 要发送的消息内容。
-            time_delay (float): 发送消息后等待的时间（秒）。
+            time_delay (float): 输入后、发送前等待条件满足的最长时间（秒）。
+            wait_for (str | dict, 可选): 发送前的等待条件，格式见 `wait`，为空时输入后立即发送。
 
         返回:
             None
 
         示例:
-            >>> tiktok_instance.msg(msg_send="Hello, world!", time_delay=1.0)
+            >>> tiktok_instance.msg(msg_send="Hello, world!", time_delay=1.0, wait_for={"idle": 200})
         """
         msg_actions = ActionChains(self.driver)
         msg_actions.send_keys(msg_send).perform()
-        sleep(time_delay)
+        self.wait(wait_for, time_delay)
         msg_actions.send_keys(Keys.RETURN).perform()
 
     def qrcode(
@@ -492,66 +936,65 @@ class tiktok:
         注意:
             该方法依赖于二维码解析库，如果解析失败，可能是由于图像数据不完整或二维码损坏。
         """
-        with Image.open(
-            BytesIO(
-                b64decode(
-                    qr_image_base64.replace(
-                        "data:image/png;base64,",
-                        str()
-                    )
-                )
-            )
-        ) as qr_image:
-            qr_image_with_border = Image.new(
-                'RGB',
-                (
-                    qr_image.size[0] + 20,
-                    qr_image.size[1] + 20
-                ),
-                'white'
-            )
-            qr_image_with_border.paste(
-                qr_image,
-                (10, 10)
-            )
-            qr_code_result = QRCodeDetector().detectAndDecode(
-                cvtColor(
-                    array(qr_image_with_border),
-                    COLOR_RGB2GRAY
-                )
-            )
-        return qr_code_result[0]
+        self.decoder = self.decoder or qrdecoder()
+        return self.decoder.decode_png(qr_image_base64)
 
     def login(
-        self
+        self,
+        css_selector: str = "canvas",
+        qr_last: Optional[str] = None,
+        time_delay: float = 30.0
     ) -> str:
         """
-        使用二维码完成登录过程。
+        读取登录二维码，直到解码成功且内容与 `qr_last` 不同时返回。
+
+        每次轮询只执行一次脚本：页面内将画布转为灰度像素并计算哈希，画布未变化时不传输像素也不重复解码。
+
+        参数:
+            css_selector (str): 二维码画布的 CSS 选择器。
+            qr_last (str, 可选): 上一次返回的二维码内容，用于等待二维码刷新；为空时返回第一次解码成功的内容。
+            time_delay (float): 最长等待时间（秒）。
 
         返回:
-            str: 解码后的二维码内容。
+            str: 解码后的二维码内容；超时时返回最后一次解码的内容（可能为空字符串）。
 
         示例:
             >>> tiktok_instance.get("https://www.tiktok.com/login/qrcode", time_delay=5.0)
             >>> login_result = tiktok_instance.login()
             >>> print(login_result)
             "https://example.com/login/callback"
+            >>> tiktok_instance.login(qr_last=login_result)  # 等待二维码刷新
 
         注意:
             登录过程需要用户手动扫描二维码。如果二维码加载失败，可能是由于网络问题或页面未正确加载。
         """
-        return self.qrcode(
-            self.driver.execute_script(
-                "return arguments[0].toDataURL('image/png');",
-                self.driver.find_element(By.CSS_SELECTOR, "canvas")
+        self.decoder = self.decoder or qrdecoder()
+        qr_state = {"hash": None, "code": str()}
+
+        def qr_changed(driver) -> bool:
+            qr_pixels = driver.execute_script(JS_QR_PIXELS, css_selector, qr_state["hash"])
+            if not qr_pixels or (qr_pixels["gray"] is None and qr_pixels["png"] is None):
+                return False
+            qr_state["hash"] = qr_pixels["hash"]
+            qr_state["code"] = self.decoder.decode_png(qr_pixels["png"]) if qr_pixels["png"] else self.decoder.decode_gray(
+                b64decode(qr_pixels["gray"]),
+                qr_pixels["width"],
+                qr_pixels["height"]
             )
-        )
+            return bool(qr_state["code"]) and qr_state["code"] != qr_last
+
+        try:
+            WebDriverWait(self.driver, time_delay, poll_frequency=0.2).until(qr_changed)
+        except TimeoutException:
+            pass
+        return qr_state["code"]
 
     def comment(
         self,
         comments_count: Dict[str, Optional[str]] = dict(),
         css_count: int = 0x400,
-        time_delay: float = 1.0
+        time_delay: float = 1.0,
+        wait_for: Union[str, Dict[str, Any], None] = {"idle": 300}
     ) -> List[Dict[str, Any]]:
         """
         根据指定的评论内容选择并回复评论。
@@ -559,7 +1002,8 @@ class tiktok:
         参数:
             comments_count (dict): 包含评论内容和回复内容的字典。
             css_count (int): 最大尝试加载的评论数量。
-            time_delay (float): 每次操作之间的等待时间。
+            time_delay (float): 每次滚动后等待新评论出现、以及每次回复后等待条件满足的最长时间（秒）。
+            wait_for (str | dict, 可选): 每次回复后的等待条件，格式见 `wait`，默认为网络静默 300 毫秒。
 
         返回:
             list: 包含处理后的评论信息。
@@ -576,22 +1020,18 @@ class tiktok:
         注意:
             如果评论加载失败，可能是由于网络问题或页面未正确加载。请确保网络连接正常，并检查页面是否加载完成。
         """
+        if not comments_count:
+            return list(chain.from_iterable(self.comment_iter(css_count=css_count, time_delay=time_delay)))
+        browser_link = self.driver.current_url
         comments_data = [
-            {
-                "browser_link": self.driver.current_url,
-                "comment_img": comment.find_element(By.CSS_SELECTOR, "img.css-1zpj2q-ImgAvatar").get_attribute("src"),
-                "comment_user": comment.find_element(By.CSS_SELECTOR, "div.css-2hpyn8-DivTriggerWrapper>a.link-a11y-focus").get_attribute("href"),
-                "comment_name": comment.find_element(By.CSS_SELECTOR, "a.link-a11y-focus > p.TUXText").text,
-                "comment_text": comment.find_element(By.CSS_SELECTOR, "div.css-1k8xzzl-DivCommentContentWrapper > span > p").text,
-                "comment_time": comment.find_element(By.CSS_SELECTOR, "div.css-1ivw6bb-DivCommentSubContentSplitWrapper > div > span").text,
-                "comment_reply": comment.find_element(By.CSS_SELECTOR, "span.TUXText--weight-medium")
-            }
-            for comment in self._object(
+            {"browser_link": browser_link, **comment}
+            for comment in chain.from_iterable(self._collect(
                 css_parent=".css-x4xlc7-DivCommentContainer",
                 css_child=".css-13wx63w-DivCommentObjectWrapper",
+                fields=FIELDS_COMMENT,
                 css_max=css_count,
                 time_delay=time_delay
-            )
+            ))
         ]
         if (comments_count):
             comments_data = {f2["comment_text"]: f2 for f2 in comments_data}
@@ -622,15 +1062,49 @@ class tiktok:
                 self.msg(msg_send=f1k, time_delay=0.0)
                 f1v["comment_reply"] = f1k
                 comments_data.append(f1v)
-                sleep(time_delay)
-        else:
-            comments_data = [
-                {**comment, "comment_reply": None}
-                for comment in comments_data
-            ]
+                self.wait(wait_for, time_delay)
         self.driver.execute_script("window.scrollTo(0, 0);")
         return comments_data
 
+    def comment_iter(
+        self,
+        css_count: int = 0x400,
+        time_delay: float = 1.0
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        逐批获取当前视频的评论（不回复），每次滚动加载出的新评论为一批，键名与 `comment` 相同。
+
+        参数:
+            css_count (int): 最大加载的评论数量。
+            time_delay (float): 每次滚动后等待新评论出现的最长时间（秒）。
+
+        返回:
+            Iterator[List[Dict[str, Any]]]: 逐批生成的评论列表，`comment_reply` 为 None。
+
+        示例:
+            >>> for comments in tiktok_instance.comment_iter(css_count=1000):
+            ...     print(len(comments))
+        """
+        browser_link = self.driver.current_url
+        for comments in (
+            self.network.iterate(
+                "comment",
+                css_max=css_count,
+                time_delay=time_delay,
+                css_scroll=".css-x4xlc7-DivCommentContainer"
+            ) if self.network else self._collect(
+                css_parent=".css-x4xlc7-DivCommentContainer",
+                css_child=".css-13wx63w-DivCommentObjectWrapper",
+                fields=FIELDS_COMMENT,
+                css_max=css_count,
+                time_delay=time_delay
+            )
+        ):
+            yield [
+                {"browser_link": browser_link, **comment, "comment_reply": None}
+                for comment in comments
+            ]
+
     def user_get(
         self
     ) -> Dict[str, Any]:
@@ -706,14 +1180,17 @@ class tiktok:
         css_parent=".css-wq5jjc-DivUserListContainer",
         css_child=".css-14xr620-DivUserContainer",
         css_count: int = 0xEB,
-        time_delay: float = 1.0
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         获取当前页面用户的关注列表或粉丝列表。
 
         参数:
             css_count (int): 最大尝试加载的用户数量。
-            time_delay (float): 每次滚动页面后等待的时间。
+            time_delay (float): 每次滚动页面后等待新用户出现的最长时间（秒）。
+            dedup_stop (float, 可选): 开启去重（见 `call_dedup`）：跳过已采集过的用户，并在一批中已知用户的比例达到该值时停止滚动；
+                大于 1 时只跳过不停止。默认为 None，不去重。
 
         返回:
             list: 包含用户信息的字典列表。
@@ -732,35 +1209,54 @@ class tiktok:
         注意:
             如果用户列表加载失败，可能是由于网络问题或页面未正确加载。请确保网络连接正常，并检查页面是否加载完成。
         """
-        return [
-            {
-                "user_link": self.driver.current_url,
-                "followers_img": user.find_element(By.XPATH, "//*[@id='tux-portal-container']/div/div[2]/div/div/div[2]/div/div/section/div/div[3]/li[1]/div/div/a/span/img").get_attribute("src"),
-                "followers_user": user.find_element(By.CSS_SELECTOR, "p.css-swczgi-PUniqueId").text,
-                "followers_name": user.find_element(By.CSS_SELECTOR, "div.css-1d8n6nn-DivNicknameContainer > span").text,
-                # "followers_status": user.find_element(By.CSS_SELECTOR, "button.e1bph0nm2.css-82eomn-Button-StyledFollowButtonV2.ehk74z00").text.strip() != "关注"
-            }
-            for user in self._object(
-                css_parent=css_parent,
-                css_child=css_child,
-                css_max=css_count,
-                time_delay=time_delay
+        return list(chain.from_iterable(self.user_list_iter(css_parent, css_child, css_count, time_delay, dedup_stop)))
+
+    def user_list_iter(
+        self,
+        css_parent=".css-wq5jjc-DivUserListContainer",
+        css_child=".css-14xr620-DivUserContainer",
+        css_count: int = 0xEB,
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        逐批获取关注列表或粉丝列表，参数与键名与 `user_list` 相同。
+        """
+        user_link = self.driver.current_url
+        yield from self._dedup("user_list", (
+            [{"user_link": user_link, **user} for user in users]
+            for users in (
+                self.network.iterate(
+                    "user_list",
+                    css_max=css_count,
+                    time_delay=time_delay,
+                    css_scroll=css_parent
+                ) if self.network else self._collect(
+                    css_parent=css_parent,
+                    css_child=css_child,
+                    fields=FIELDS_USER_LIST,
+                    css_max=css_count,
+                    time_delay=time_delay
+                )
             )
-        ]
+        ), dedup_stop)
 
     def search_user(
         self,
         css_parent=".css-f2h6fp-DivSearchContainer",
         css_child="[data-e2e='search-user-container']",
         css_count: int = 0x20,
-        time_delay: float = 0.2
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         搜索 TikTok 用户并返回用户信息列表。
 
         参数:
             css_count (int): 最大返回的用户数量。
-            time_delay (float): 每次操作之间的等待时间。
+            time_delay (float): 每次滚动后等待新结果出现的最长时间（秒）。
+            dedup_stop (float, 可选): 开启去重（见 `call_dedup`）：跳过已采集过的用户，并在一批中已知用户的比例达到该值时停止滚动；
+                大于 1 时只跳过不停止。默认为 None，不去重。
 
         返回:
             list: 包含用户信息的字典列表。
@@ -779,36 +1275,48 @@ class tiktok:
         注意:
             如果搜索结果加载失败，可能是由于网络问题或页面未正确加载。请确保网络连接正常，并检查页面是否加载完成。
         """
-        return [
-            {
-                "user_link": element.find_element(By.CSS_SELECTOR, "a.css-7ogsq9-StyledAvatarUserLink").get_attribute("href"),
-                "user_img": element.find_element(By.CSS_SELECTOR, "img.css-1zpj2q-ImgAvatar").get_attribute("src"),
-                "user_id": element.find_element(By.XPATH, "//*[@id='search_user-item-user-link-1']/div/div/a[2]/div/p").text,
-                "user_name": element.find_element(By.CSS_SELECTOR, "p.css-1ns35wh-PTitle").text,
-                # "user_followers": element.find_element(By.CSS_SELECTOR, "div.css-ss1kov-DivLink > div > div > a > div > span").text,
-                # "user_description": element.find_element(By.XPATH, "//*[@id='search_user-item-user-link-0']/div/div/a[2]/p[2]").text
-            }
-            for element in self._object(
-                css_parent=css_parent,
-                css_child=css_child,
-                css_max=css_count,
-                time_delay=time_delay
-            )[:css_count]
-        ]
+        return list(chain.from_iterable(self.search_user_iter(css_parent, css_child, css_count, time_delay, dedup_stop)))
+
+    def search_user_iter(
+        self,
+        css_parent=".css-f2h6fp-DivSearchContainer",
+        css_child="[data-e2e='search-user-container']",
+        css_count: int = 0x20,
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        逐批获取用户搜索结果，参数与键名与 `search_user` 相同。
+        """
+        yield from self._dedup("search_user", self.network.iterate(
+            "search_user",
+            css_max=css_count,
+            time_delay=time_delay,
+            css_scroll=css_parent
+        ) if self.network else self._collect(
+            css_parent=css_parent,
+            css_child=css_child,
+            fields=FIELDS_SEARCH_USER,
+            css_max=css_count,
+            time_delay=time_delay
+        ), dedup_stop)
 
     def search_video(
         self,
         css_parent=".css-4dxm8q-DivVideoFeed.eegew6e0",
         css_child=".css-1soki6-DivItemContainerForSearch",
         css_count: int = 0x100,
-        time_delay: float = 0.3
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         搜索 TikTok 视频并返回视频信息列表。
 
         参数:
             css_count (int): 最大返回的视频数量。
-            time_delay (float): 每次操作之间的等待时间。
+            time_delay (float): 每次滚动后等待新结果出现的最长时间（秒）。
+            dedup_stop (float, 可选): 开启去重（见 `call_dedup`）：跳过已采集过的视频，并在一批中已知视频的比例达到该值时停止滚动；
+                大于 1 时只跳过不停止。默认为 None，不去重。
 
         返回:
             list: 包含视频信息的字典列表。
@@ -827,105 +1335,207 @@ class tiktok:
         注意:
             如果搜索结果加载失败，可能是由于网络问题或页面未正确加载。请确保网络连接正常，并检查页面是否加载完成。
         """
-        return [
-            {
-                "video_link": element.find_element(By.CSS_SELECTOR, "a.css-1mdo0pl-AVideoContainer").get_attribute("href"),
-                "video_avatar": element.find_element(By.CSS_SELECTOR, "img").get_attribute("src"),
-                "video_description": element.find_element(By.CSS_SELECTOR, "img").get_attribute("alt"),
-                "video_tags": [tag.strip() for tag in element.find_element(By.CSS_SELECTOR, "img").get_attribute("alt").split() if tag.startswith('#')],
-                "video_username": element.find_element(By.CSS_SELECTOR, "a.css-1mdo0pl-AVideoContainer").get_attribute("href").split('/')[-3],
-                "video_view_count": element.find_element(By.CSS_SELECTOR, "strong.video-count.css-dirst9-StrongVideoCount.e148ts222").text,
-                "video_like_count": element.find_element(By.CSS_SELECTOR, "div.css-11u47i-DivCardFooter svg.like-icon + strong").text if element.find_elements(By.CSS_SELECTOR, "div.css-11u47i-DivCardFooter svg.like-icon + strong") else "0"
-            }
-            for element in self._object(
+        return list(chain.from_iterable(self.search_video_iter(css_parent, css_child, css_count, time_delay, dedup_stop)))
+
+    def search_video_iter(
+        self,
+        css_parent=".css-4dxm8q-DivVideoFeed.eegew6e0",
+        css_child=".css-1soki6-DivItemContainerForSearch",
+        css_count: int = 0x100,
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        逐批获取视频搜索结果，每次滚动加载出的新视频为一批，参数与键名与 `search_video` 相同。
+
+        示例:
+            >>> for videos in tiktok_instance.search_video_iter(css_count=1000):
+            ...     print(len(videos))
+        """
+        yield from self._dedup("search_video", self.network.iterate(
+            "search_video",
+            css_max=css_count,
+            time_delay=time_delay,
+            css_scroll=css_parent
+        ) if self.network else (
+            [
+                {
+                    "video_link": video["video_link"],
+                    "video_avatar": video["video_avatar"],
+                    "video_description": video["video_description"],
+                    "video_tags": [tag.strip() for tag in (video["video_description"] or "").split() if tag.startswith('#')],
+                    "video_username": (video["video_link"] or "").split('/')[-3] if (video["video_link"] or "").count('/') >= 3 else None,
+                    "video_view_count": video["video_view_count"],
+                    "video_like_count": video["video_like_count"]
+                }
+                for video in videos
+            ]
+            for videos in self._collect(
                 css_parent=css_parent,
                 css_child=css_child,
+                fields=FIELDS_SEARCH_VIDEO,
                 css_max=css_count,
                 time_delay=time_delay
-            )[:css_count]
-        ]
+            )
+        ), dedup_stop)
 
-    def call(
+    def snapshot(
         self,
-        func_call: Dict[str, Any]
+        api_name: str = "search_video",
+        css_count: int = 0x100,
+        time_delay: float = 5.0,
+        snapshot_path: Optional[str] = None
     ) -> Dict[str, Any]:
+        """
+        将指定提取器的列表滚动加载到 `css_count` 条（或没有更多条目）后，一次性保存页面源码。
+
+        字段提取由 `call_snapshot.extract_snapshot` / `extract_many` 离线完成，浏览器在快照后即可执行其他命令。
+
+        参数:
+            api_name (str): 提取器名，可选 "comment"、"user_list"、"search_user"、"search_video"。
+            css_count (int): 最多加载的条目数量。
+            time_delay (float): 每次滚动后等待新条目出现的最长时间（秒）。
+            snapshot_path (str, 可选): 保存路径（gzip 压缩的 JSON），指定时返回值中不含页面源码而是文件路径。
+
+        返回:
+            dict: 快照 {"api", "browser_link", "utc", "count", "html"}；指定 `snapshot_path` 时 "html" 替换为 "path"。
+
+        示例:
+            >>> tiktok_instance.get("https://www.tiktok.com/search/video?q=google", time_delay=5.0)
+            >>> page = tiktok_instance.snapshot("search_video", css_count=100)
+            >>> from call_snapshot import extract_snapshot
+            >>> extract_snapshot(page)
+        """
+        css_parent, css_child = self.list_selectors[api_name]
+        snapshot_count = sum(len(items) for items in self._collect(
+            css_parent=css_parent,
+            css_child=css_child,
+            fields=dict(),
+            css_max=css_count,
+            time_delay=time_delay
+        ))
+        snapshot_data = {
+            "api": api_name,
+            "browser_link": self.driver.current_url,
+            "utc": time(),
+            "count": snapshot_count,
+            "html": self.driver.page_source
+        }
+        if snapshot_path:
+            # call_snapshot 依赖 lxml 与 HtmlToJson，仅在保存快照时导入
+            from call_snapshot import save as snapshot_save
+            snapshot_save(snapshot_data, snapshot_path)
+            snapshot_data["path"] = snapshot_path
+            del snapshot_data["html"]
+        return snapshot_data
+
+    # 命令分发表 {方法名: (函数, 签名)}，由 `commands` 在首次使用时构建，之后所有实例共用
+    _commands: Optional[Dict[str, Tuple[Callable, Signature]]] = None
+
+    @classmethod
+    def commands(
+        cls
+    ) -> Dict[str, Tuple[Callable, Signature]]:
+        """
+        返回可通过 `call` 调用的命令表：类中所有公开的实例方法（不含 `call` 与生成器方法）及其签名。
+
+        返回:
+            dict: {方法名: (函数, 签名)}。
+
+        示例:
+            >>> list(tiktok.commands())[:3]
+            ['alive', 'block', 'click']
+        """
+        if cls.__dict__.get("_commands") is None:
+            cls._commands = plan_commands(cls)
+        return cls._commands
+
+    @classmethod
+    def plan(
+        cls,
+        func_plan: List[Any]
+    ) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        校验有序命令计划，返回 [(方法名, 参数), ...]；计划中的全部错误一次性以 ValueError 抛出。
+
+        计划中的每一步可以是方法名字符串（无参数），或只有一个键的字典 {方法名: 参数字典或 None}。
+        参数按方法签名校验（未知参数、缺少必填参数都会报错），因此错误的计划在启动浏览器之前就会失败。
+
+        参数:
+            func_plan (list): 有序命令计划。
+
+        返回:
+            list: 校验后的 (方法名, 参数) 列表。
+
+        示例:
+            >>> tiktok.plan([{"get": {"browser_link": "https://www.tiktok.com/"}}, "search_user"])
+            [('get', {'browser_link': 'https://www.tiktok.com/'}), ('search_user', None)]
+        """
+        return plan_steps(func_plan, cls.commands())
+
+    def call(
+        self,
+        func_call: Union[List[Any], Dict[str, Any]]
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any], None]:
         """
         调用指定的功能方法，并返回执行结果。
 
-        该方法允许通过一个字典动态调用类中的其他方法。字典的键为方法名，值为该方法的参数（如果需要）。
-        如果方法调用成功，返回结果会包含执行状态和返回值；如果失败，则返回错误信息。
+        推荐使用有序列表形式的命令计划（格式见 `plan`）：同一方法可以出现多次，计划在执行前整体校验，
+        校验失败时抛出 ValueError，不会执行任何一步。仍兼容旧的字典形式（键为方法名，重复的键会被合并）。
+        每一步都会记录开始时间 `utc` 与耗时 `time`（秒）。
 
         参数:
-            func_call (dict): 包含要调用的方法及其参数的字典。
-                - 键为方法名（如 `launch`、`connect`、`get` 等）。
-                - 值为该方法的参数（如果需要），可以是 `None` 或一个字典。
+            func_call (list | dict): 有序命令计划，或旧的 {方法名: 参数} 字典。
 
         返回:
-            dict: 包含每个方法的执行结果，格式如下：
-                {
-                    "method_name": {
+            list: 列表形式时，返回每一步的执行结果：
+                [
+                    {
+                        "func": "方法名",
                         "utc": "调用时间戳",
                         "args": "方法参数",
-                        "status": "执行状态（True/False/None）",
-                        "return": "方法返回值或错误信息"
+                        "status": "执行状态（True/False）",
+                        "return": "方法返回值或错误信息",
+                        "time": "耗时（秒）"
                     }
-                }
+                ]
+            dict: 字典形式时，返回 {方法名: 执行结果}，方法不存在时 `status` 与 `return` 为 None。
 
         示例:
-            >>> data = {
-            ...     "launch": None,
-            ...     "connect": None,
-            ...     "get": {"browser_link": "https://www.tiktok.com/@exampleuser", "time_delay": 5.0},
-            ...     "user_get": None,
-            ...     "comment": {"comments_count": {"😭😭😭": None, "😭😭": "Unc clip farming ❤️‍🩹"}},
-            ...     "get": {"browser_link": "https://www.tiktok.com/@anotheruser", "time_delay": 5.0},
-            ...     "user_list": None,
-            ...     "search_user": None,
-            ...     "search_video": None,
-            ...     "quit": None
-            ... }
+            >>> data = [
+            ...     "launch",
+            ...     "connect",
+            ...     {"get": {"browser_link": "https://www.tiktok.com/@exampleuser", "time_delay": 5.0}},
+            ...     "user_get",
+            ...     {"get": {"browser_link": "https://www.tiktok.com/@anotheruser", "time_delay": 5.0}},
+            ...     "user_list",
+            ...     "quit"
+            ... ]
             >>> result = tiktok_instance.call(data)
             >>> print(result)
-            {
-                "launch": {"utc": 1681234567, "args": None, "status": True, "return": None},
-                "connect": {"utc": 1681234568, "args": None, "status": True, "return": None},
-                "get": {"utc": 1681234569, "args": {"browser_link": "https://www.tiktok.com/@exampleuser", "time_delay": 5.0}, "status": True, "return": None},
-                "user_get": {"utc": 1681234570, "args": None, "status": True, "return": {"user_id": "123456789", "user_name": "example_user", ...}},
-                "comment": {"utc": 1681234571, "args": {"comments_count": {"😭😭😭": None, "😭😭": "Unc clip farming ❤️‍🩹"}}, "status": True, "return": [...]},
-                "get": {"utc": 1681234572, "args": {"browser_link": "https://www.tiktok.com/@anotheruser", "time_delay": 5.0}, "status": True, "return": None},
-                "user_list": {"utc": 1681234573, "args": None, "status": True, "return": [...]},
-                "search_user": {"utc": 1681234574, "args": None, "status": True, "return": [...]},
-                "search_video": {"utc": 1681234575, "args": None, "status": True, "return": [...]},
-                "quit": {"utc": 1681234576, "args": None, "status": True, "return": None}
-            }
+            [
+                {"func": "launch", "utc": 1681234567, "args": None, "status": True, "return": True, "time": 0.002},
+                {"func": "connect", "utc": 1681234567, "args": None, "status": True, "return": True, "time": 0.001},
+                {"func": "get", "utc": 1681234567, "args": {"browser_link": "https://www.tiktok.com/@exampleuser", "time_delay": 5.0}, "status": True, "return": True, "time": 1.204},
+                {"func": "user_get", "utc": 1681234568, "args": None, "status": True, "return": {"user_id": "123456789", ...}, "time": 0.183},
+                {"func": "get", "utc": 1681234569, "args": {"browser_link": "https://www.tiktok.com/@anotheruser", "time_delay": 5.0}, "status": True, "return": True, "time": 0.981},
+                {"func": "user_list", "utc": 1681234570, "args": None, "status": True, "return": [...], "time": 3.518},
+                {"func": "quit", "utc": 1681234574, "args": None, "status": True, "return": None, "time": 0.093}
+            ]
 
         注意:
-            - 如果某个方法调用失败，`status` 会是 `False`，并且 `return` 会包含错误信息。
-            - 如果某个方法名在类中不存在，`status` 会是 `None`，并且 `return` 会是 `None`。
-            - 该方法会自动处理多个方法的调用顺序，但不会自动处理方法之间的依赖关系。如果某个方法依赖于之前的某个方法的结果，请确保调用顺序正确。
-        """
-        func_list = {
-            name: getattr(self, name)
-            for name in dir(self)
-            if callable(getattr(self, name)) and not name.startswith("__") and name != 'call'
-        }
-        if type(func_call) == dict:
+            - 如果某个方法调用失败，`status` 会是 `False`，并且 `return` 会包含错误信息，后续步骤继续执行。
+            - 该方法按顺序执行各步骤，但不会自动处理方法之间的依赖关系。如果某个方法依赖于之前的某个方法的结果，请确保调用顺序正确。
+        """
+        if isinstance(func_call, list):
+            return [
+                {"func": func_name, **self._step(func_name, func_args)}
+                for func_name, func_args in self.plan(func_call)
+            ]
+        if isinstance(func_call, dict):
             for func_name in list(func_call):
-                if func_name in func_list:
-                    try:
-                        func_call[func_name] = {
-                            "utc": time(),
-                            "args": func_call[func_name],
-                            "status": True,
-                            "return": func_list[func_name](**func_call[func_name]) if type(func_call[func_name]) == dict else func_list[func_name]()
-                        }
-                    except Exception as func_error:
-                        func_call[func_name] = {
-                            "utc": time(),
-                            "args": func_call[func_name],
-                            "status": False,
-                            "return": str(func_error)
-                        }
+                if func_name in self.commands():
+                    func_call[func_name] = self._step(func_name, func_call[func_name])
                 else:
                     func_call[func_name] = {
                         "utc": time(),
@@ -936,6 +1546,534 @@ class tiktok:
             return func_call
         return None
 
+    def stream(
+        self,
+        func_call: List[Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        按顺序执行有序命令计划（格式见 `plan`），逐条生成执行进度，长时间的列表采集在滚动过程中分批返回。
+
+        有对应 `<方法名>_iter` 生成器的步骤（`comment` 不回复时、`user_list`、`search_user`、`search_video`）
+        每加载出一批记录就生成一条批次消息，步骤结束时再生成该步骤的执行结果，其中 `return` 为记录总数；
+        其他步骤只生成执行结果，格式与 `call` 相同。
+
+        参数:
+            func_call (list): 有序命令计划。
+
+        返回:
+            Iterator[Dict[str, Any]]: 批次消息 {"func", "batch", "return"}（开启去重时附带本批新条目的键 "dedup"，见 `dedup_pop`），
+            或步骤结果 {"func", "utc", "args", "status", "return", "time"}。
+
+        示例:
+            >>> for frame in tiktok_instance.stream([
+            ...     {"get": {"browser_link": "https://www.tiktok.com/search/video?q=google"}},
+            ...     {"search_video": {"css_count": 1000}}
+            ... ]):
+            ...     print(frame["func"], frame.get("batch"), len(frame["return"]) if "batch" in frame else frame["return"])
+        """
+        for func_name, func_args in self.plan(func_call):
+            func_iter = getattr(self, f"{func_name}_iter", None)
+            if func_iter is None or (func_name == "comment" and (func_args or {}).get("comments_count")):
+                yield {"func": func_name, **self._step(func_name, func_args)}
+                continue
+            iter_args = {
+                arg_name: arg_value
+                for arg_name, arg_value in (func_args or {}).items()
+                if arg_name in signature(func_iter).parameters
+            }
+            func_utc, func_start, func_count = time(), perf_counter(), 0
+            try:
+                for func_batch, func_items in enumerate(func_iter(**iter_args)):
+                    func_count += len(func_items)
+                    func_pending = self.dedup_pop()
+                    yield {
+                        "func": func_name,
+                        "batch": func_batch,
+                        "return": func_items,
+                        **({"dedup": func_pending} if func_pending else {})
+                    }
+                func_status, func_return = True, func_count
+            except Exception as func_error:
+                func_status, func_return = False, str(func_error)
+            yield {
+                "func": func_name,
+                "utc": func_utc,
+                "args": func_args,
+                "status": func_status,
+                "return": func_return,
+                "time": round(perf_counter() - func_start, 6)
+            }
+
+    def _step(
+        self,
+        func_name: str,
+        func_args: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        # 执行一步命令并记录开始时间与耗时
+        func = self.commands()[func_name][0]
+        func_utc, func_start = time(), perf_counter()
+        try:
+            func_status, func_return = True, func(self, **func_args) if isinstance(func_args, dict) else func(self)
+        except Exception as func_error:
+            func_status, func_return = False, str(func_error)
+        return {
+            "utc": func_utc,
+            "args": func_args,
+            "status": func_status,
+            "return": func_return,
+            "time": round(perf_counter() - func_start, 6)
+        }
+
+
+class pool:
+    """
+    浏览器会话池，按账号/代理等配置保存已启动并已连接的 `tiktok` 实例，供多次命令复用。
+
+    命令执行前通过 `lease` 取得会话（不存在或不可用时启动新的浏览器），执行后通过 `release` 归还。
+    同一账号（即同一用户数据目录）的会话同一时间只会被一个命令使用；空闲超过 `idle_timeout` 秒的会话会被关闭，
+    会话总数达到 `max_size` 时优先关闭最久未使用的空闲会话，没有空闲会话时等待归还。
+
+    属性:
+        max_size (int): 会话数量上限。
+        idle_timeout (float): 空闲会话的最长保留时间（秒）。
+
+    示例:
+        >>> browser_pool = pool(max_size=4, idle_timeout=600.0)
+        >>> with browser_pool.session({"username": "mxlbbi"}) as browser:
+        ...     browser.call({"get": {"browser_link": "https://www.tiktok.com/"}})
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4,
+        idle_timeout: float = 600.0
+    ) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._idle: "OrderedDict[Tuple, Tuple[tiktok, float]]" = OrderedDict()
+        self._busy: Dict[Tuple, tiktok] = dict()
+        self._cond = Condition()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._ports: Set[int] = set()
+
+    @staticmethod
+    def key(
+        data_config: Dict[str, Any]
+    ) -> Tuple:
+        """
+        根据配置生成会话键：浏览器路径、账号、代理、无头模式、抓取模式与轻量模式相同的配置共用同一个会话。
+        """
+        return (
+            data_config.get("browser_path"),
+            data_config.get("username") or "default",
+            data_config.get("proxy"),
+            bool(data_config.get("headless")),
+            bool(data_config.get("capture")),
+            bool(data_config.get("lite"))
+        )
+
+    @staticmethod
+    def port() -> int:
+        """
+        向系统申请一个当前空闲的本地端口，用作浏览器调试端口。
+        """
+        with socket() as port_socket:
+            port_socket.bind(("127.0.0.1", 0))
+            return port_socket.getsockname()[1]
+
+    def lease(
+        self,
+        data_config: Dict[str, Any]
+    ) -> tiktok:
+        """
+        取得与配置对应的会话：优先复用健康的空闲会话，否则启动并连接新的浏览器。
+
+        参数:
+            data_config (dict): `tiktok` 的初始化参数，`debug_port` 为空时自动分配空闲端口。
+
+        返回:
+            tiktok: 已启动并已连接的实例。
+        """
+        session_key = self.key(data_config)
+        expired = list()
+        with self._cond:
+            # 每次被唤醒后重新检查：同一账号没有正在使用的会话，且有可复用的空闲会话或仍有容量
+            while True:
+                expired.extend(self._expire())
+                if all(busy_key[1] != session_key[1] for busy_key in self._busy):
+                    # 同一账号共用一个用户数据目录，配置不同的旧会话需先关闭
+                    for idle_key in [idle_key for idle_key in self._idle if idle_key[1] == session_key[1] and idle_key != session_key]:
+                        expired.append(self._idle.pop(idle_key)[0])
+                        self._stats["evictions"] += 1
+                    session = self._idle.pop(session_key, (None, 0.0))[0]
+                    if session is not None or len(self._idle) + len(self._busy) < self.max_size:
+                        break
+                    if self._idle:
+                        expired.append(self._idle.popitem(last=False)[1][0])
+                        self._stats["evictions"] += 1
+                        continue
+                self._cond.wait()
+            # 释放锁之前占用会话键（新会话先以 None 占位），同一账号的其他租用需等待归还
+            self._busy[session_key] = session
+        for expired_session in expired:
+            expired_session.close()
+        try:
+            session_hit = session is not None and session.alive()
+            with self._cond:
+                self._stats["hits" if session_hit else "misses"] += 1
+            if session_hit:
+                return session
+            session is not None and session.close()
+            session = None
+            session_port = self._reserve_port(data_config.get("debug_port"))
+            try:
+                session = tiktok(**{**data_config, "debug_port": session_port})
+                if not (session.launch() and session.connect() and session.alive()):
+                    raise RuntimeError(f"浏览器会话启动失败: 账号 {session.username}，调试端口 {session_port}")
+                with self._cond:
+                    self._busy[session_key] = session
+            finally:
+                with self._cond:
+                    self._ports.discard(session_port)
+            return session
+        except BaseException:
+            session is not None and session.close()
+            with self._cond:
+                self._busy.pop(session_key, None)
+                self._cond.notify_all()
+            raise
+
+    def _reserve_port(
+        self,
+        debug_port: Optional[int] = None
+    ) -> int:
+        # 在锁内选择调试端口：跳过池中会话正在使用与其他租用正在启动的端口，同时启动的会话不会拿到同一个端口
+        with self._cond:
+            used_ports = self._ports | {
+                session.debug_port
+                for session in [*self._busy.values(), *(session for session, _ in self._idle.values())]
+                if session is not None
+            }
+            session_port = debug_port or self.port()
+            while not debug_port and session_port in used_ports:
+                session_port = self.port()
+            self._ports.add(session_port)
+            return session_port
+
+    def release(
+        self,
+        session: tiktok
+    ) -> None:
+        """
+        归还会话：仍然可用的会话放回空闲队列，不可用的会话直接关闭。
+        """
+        session_alive = session.alive()
+        with self._cond:
+            for session_key, busy_session in list(self._busy.items()):
+                if busy_session is session:
+                    del self._busy[session_key]
+                    if session_alive:
+                        self._idle[session_key] = (session, time())
+            self._cond.notify_all()
+        session_alive or session.close()
+
+    @contextmanager
+    def session(
+        self,
+        data_config: Dict[str, Any]
+    ) -> Iterator[tiktok]:
+        """
+        以上下文管理器形式租用会话，退出时自动归还。
+        """
+        session = self.lease(data_config)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def evict(
+        self
+    ) -> int:
+        """
+        关闭空闲超时的会话，返回关闭的数量。
+        """
+        with self._cond:
+            expired = self._expire()
+        for expired_session in expired:
+            expired_session.close()
+        return len(expired)
+
+    def close(
+        self
+    ) -> None:
+        """
+        关闭全部空闲会话，正在使用的会话在归还后由调用方决定是否关闭。
+        """
+        with self._cond:
+            idle_sessions = [session for session, _ in self._idle.values()]
+            self._idle.clear()
+        for session in idle_sessions:
+            session.close()
+
+    def stats(
+        self
+    ) -> Dict[str, int]:
+        """
+        返回会话池统计：命中、新建、淘汰次数以及空闲/使用中的会话数量。
+        """
+        with self._cond:
+            return {**self._stats, "idle": len(self._idle), "busy": len(self._busy)}
+
+    def _expire(
+        self
+    ) -> List[tiktok]:
+        # 调用方需持有 self._cond，返回的会话在释放锁后关闭
+        time_now = time()
+        expired_keys = [
+            session_key
+            for session_key, (_, session_used) in self._idle.items()
+            if time_now - session_used > self.idle_timeout
+        ]
+        self._stats["evictions"] += len(expired_keys)
+        return [self._idle.pop(session_key)[0] for session_key in expired_keys]
+
+
+# 进程内共享的浏览器会话池，首次使用时创建
+_pool: Optional[pool] = None
+
+
+def session_pool() -> pool:
+    """
+    返回进程内共享的浏览器会话池。
+    """
+    global _pool
+    if _pool is None:
+        _pool = pool()
+    return _pool
+
+
+class scheduler:
+    """
+    并发调度器，在多个浏览器配置（账号/调试端口/用户数据目录）上同时执行多组 `tiktok.call` 命令。
+
+    每组命令在独立的 `tiktok` 实例中执行：同一账号的命令串行执行，不同账号的命令并发执行，
+    同时执行的数量不超过 `max_workers`。未指定 `username` 的命令自动分配到空闲的 `auto-N` 配置，
+    调试端口由会话池自动分配，用户数据目录随账号名自动生成。
+
+    属性:
+        max_workers (int): 同时执行的命令组数量上限，默认按 CPU 核数与可用内存估算。
+        pool (pool): 调度器使用的浏览器会话池。
+
+    示例:
+        >>> with scheduler(max_workers=4) as runner:
+        ...     results = runner.map([
+        ...         ({"username": None}, {"get": {"browser_link": "https://www.tiktok.com/search/user?q=google"}, "search_user": None}),
+        ...         ({"username": None}, {"get": {"browser_link": "https://www.tiktok.com/search/video?q=google"}, "search_video": None}),
+        ...     ])
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        browser_pool: Optional[pool] = None
+    ) -> None:
+        self.max_workers = max_workers or self.capacity()
+        self.pool = browser_pool or pool(max_size=self.max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="tiktok"
+        )
+        self._profiles: "Queue[str]" = Queue()
+        for profile_index in range(self.max_workers):
+            self._profiles.put(f"auto-{profile_index}")
+
+    @staticmethod
+    def capacity(
+        memory_browser: int = 512 << 20
+    ) -> int:
+        """
+        估算本机可同时运行的浏览器数量：取 CPU 核数与「可用内存 / 单个浏览器内存」中的较小值。
+
+        参数:
+            memory_browser (int): 单个浏览器预计占用的内存（字节）。
+
+        返回:
+            int: 至少为 1 的并发数量。
+        """
+        workers = cpu_count() or 1
+        try:
+            from psutil import virtual_memory
+            workers = min(workers, virtual_memory().available // memory_browser)
+        except ImportError:
+            pass
+        return max(1, int(workers))
+
+    def submit(
+        self,
+        data_config: Dict[str, Any],
+        data_params: Dict[str, Any]
+    ) -> Future:
+        """
+        提交一组命令，返回结果与 `main` 相同格式的 Future。
+
+        参数:
+            data_config (dict): `tiktok` 的初始化参数，`username` 为空时自动分配配置。
+            data_params (list | dict): 传给 `tiktok.call` 的命令。
+
+        返回:
+            Future: 结果为 {"status", "args", "return"} 字典。
+        """
+        return self._executor.submit(self._run, data_config, data_params)
+
+    def map(
+        self,
+        data_jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        并发执行多组 (data_config, data_params)，按提交顺序返回结果。
+        """
+        return [
+            future.result()
+            for future in [self.submit(*data_job) for data_job in data_jobs]
+        ]
+
+    def shutdown(
+        self,
+        wait: bool = True
+    ) -> None:
+        """
+        停止接收新命令，等待已提交的命令完成后关闭空闲会话。
+        """
+        self._executor.shutdown(wait=wait)
+        self.pool.close()
+
+    def __enter__(self) -> "scheduler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def _run(
+        self,
+        data_config: Dict[str, Any],
+        data_params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if data_config.get("username"):
+            data_result = execute(data_config, data_params, self.pool)
+        else:
+            profile = self._profiles.get()
+            try:
+                data_result = execute({**data_config, "username": profile}, data_params, self.pool)
+            finally:
+                self._profiles.put(profile)
+        # 结果直接交给进程内的调用方，视为已送达
+        dedup_store().commit(dedup_pending(data_result))
+        return data_result
+
+
+def execute(
+    data_config: Dict[str, Any],
+    data_params: Dict[str, Any],
+    browser_pool: Optional[pool] = None
+) -> Dict[str, Any]:
+    """
+    从会话池租用浏览器会话执行一组命令，返回 {"status", "args", "return"} 字典；
+    开启去重的步骤返回了新条目时附带 "dedup"（待记录的去重键），结果送达后由调用方交给 `dedup.commit`。
+
+    参数:
+        data_config (dict): `tiktok` 的初始化参数。
+        data_params (list | dict): 传给 `tiktok.call` 的命令，列表形式的计划在租用会话之前校验。
+        browser_pool (pool, 可选): 使用的会话池，默认为进程内共享的 `session_pool()`。
+    """
+    try:
+        isinstance(data_params, list) and tiktok.plan(data_params)
+        with (browser_pool or session_pool()).session(data_config) as browser:
+            try:
+                data_return = browser.call(data_params)
+            finally:
+                data_dedup = browser.dedup_pop()
+            return {
+                "status": True,
+                "args": [data_config, data_params],
+                "return": data_return,
+                **({"dedup": data_dedup} if data_dedup else {})
+            }
+    except Exception as e:
+        return {
+            "status": False,
+            "args": [data_config, data_params],
+            "return": str(e)
+        }
+
+
+def execute_stream(
+    data_config: Dict[str, Any],
+    data_params: List[Any],
+    browser_pool: Optional[pool] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    从会话池租用浏览器会话，以 `tiktok.stream` 逐条生成命令计划的执行进度，会话在生成结束（或生成器关闭）时归还。
+
+    参数:
+        data_config (dict): `tiktok` 的初始化参数。
+        data_params (list): 有序命令计划，在租用会话之前校验，校验失败时抛出 ValueError。
+        browser_pool (pool, 可选): 使用的会话池，默认为进程内共享的 `session_pool()`。
+
+    示例:
+        >>> for frame in execute_stream({"username": "mxlbbi"}, [
+        ...     {"get": {"browser_link": "https://www.tiktok.com/search/video?q=google"}},
+        ...     {"search_video": {"css_count": 1000}}
+        ... ]):
+        ...     print(frame)
+    """
+    tiktok.plan(data_params)
+    with (browser_pool or session_pool()).session(data_config) as browser:
+        try:
+            yield from browser.stream(data_params)
+        finally:
+            # 未随批次消息送出的待记录键直接丢弃
+            browser.dedup_pop()
+
+
+def benchmark_qrcode(
+    qr_text: str = "https://www.tiktok.com/t/ZT8qrLoginBenchmark/",
+    qr_scale: int = 4,
+    rounds: int = 100
+) -> Dict[str, float]:
+    """
+    比较二维码解码延迟：原 PIL 流程、复用解码器的 PNG 流程与原始灰度像素流程，返回每次解码的平均毫秒数。
+
+    示例:
+        >>> benchmark_qrcode(rounds=200)
+        {'pil': 4.8, 'png': 1.9, 'gray': 1.6}
+    """
+    qr_image = QRCodeEncoder.create().encode(qr_text)
+    qr_image = resize(qr_image, None, fx=qr_scale, fy=qr_scale, interpolation=INTER_NEAREST)
+    qr_png = "data:image/png;base64," + b64encode(imencode(".png", qr_image)[1].tobytes()).decode()
+    qr_gray, qr_width, qr_height = qr_image.tobytes(), qr_image.shape[1], qr_image.shape[0]
+
+    def decode_pil() -> str:
+        with Image.open(BytesIO(b64decode(qr_png.replace("data:image/png;base64,", str())))) as pil_image:
+            pil_border = Image.new('RGB', (pil_image.size[0] + 20, pil_image.size[1] + 20), 'white')
+            pil_border.paste(pil_image, (10, 10))
+            return QRCodeDetector().detectAndDecode(cvtColor(array(pil_border), COLOR_RGB2GRAY))[0]
+
+    decoder = qrdecoder()
+    benchmark_cases = {
+        "pil": decode_pil,
+        "png": lambda: decoder.decode_png(qr_png),
+        "gray": lambda: decoder.decode_gray(qr_gray, qr_width, qr_height)
+    }
+    benchmark_result = dict()
+    for case_name, case_decode in benchmark_cases.items():
+        assert case_decode() == qr_text, case_name
+        time_start = perf_counter()
+        for _ in range(rounds):
+            case_decode()
+        benchmark_result[case_name] = round((perf_counter() - time_start) * 1000 / rounds, 3)
+        print(f"{case_name:>4}: {benchmark_result[case_name]:.3f} ms/decode")
+    return benchmark_result
+
 
 def main(
     data_config: Dict[str, Any] = {
@@ -945,23 +2083,24 @@ def main(
         "proxy": None,
         "headless": False
     },
-    data_params: Dict = {},
+    data_params: Union[List, Dict] = [],
     data_debug: bool = False
 ) -> Dict[str, Any]:
     """
     主函数，用于演示 TikTok 自动化操作类的功能。
 
-    该函数通过 `tiktok` 类的实例化和调用，依次执行以下操作：
-    1. 启动浏览器并连接到调试端口。
-    2. 导航到指定的 TikTok 页面。
-    3. 搜索用户并返回用户信息列表。
-    4. 搜索视频并返回视频信息列表。
-    5. 发送消息到当前页面的输入框。
-    6. 获取当前页面的评论列表。
-    7. 根据指定的评论内容选择并回复评论。
-    8. 获取当前页面用户的详细信息。
-    9. 获取当前页面用户的关注列表或粉丝列表。
-    10. 关闭浏览器并终止浏览器进程。
+    浏览器会话从进程内共享的会话池 `session_pool()` 中租用，执行结束后归还；
+    同一账号/代理的后续命令复用已启动的浏览器，命令中的 `launch`、`connect` 在会话可用时不做任何操作。
+
+    该函数通过 `execute` 从会话池租用的浏览器会话，依次执行以下操作（浏览器的启动、连接与关闭由会话池负责）：
+    1. 导航到指定的 TikTok 页面。
+    2. 搜索用户并返回用户信息列表。
+    3. 搜索视频并返回视频信息列表。
+    4. 发送消息到当前页面的输入框。
+    5. 获取当前页面的评论列表。
+    6. 根据指定的评论内容选择并回复评论。
+    7. 获取当前页面用户的详细信息。
+    8. 获取当前页面用户的关注列表或粉丝列表。
 
     示例:
         >>> result = test()
@@ -974,63 +2113,50 @@ def main(
         - 请确保网络连接正常，并检查 TikTok 页面是否加载完成。
 
     返回:
-        Dict[str, Any]: 包含每个操作的执行结果，具体格式如下：
-            {
-                "operation_name": {
+        Dict[str, Any]: {"status", "args", "return"}，其中 "return" 为 `tiktok.call` 的结果，列表形式的计划格式如下：
+            [
+                {
+                    "func": "方法名",
                     "utc": "调用时间戳",
                     "args": "方法参数",
-                    "status": "执行状态（True/False/None）",
-                    "return": "方法返回值或错误信息"
+                    "status": "执行状态（True/False）",
+                    "return": "方法返回值或错误信息",
+                    "time": "耗时（秒）"
                 }
-            }
+            ]
     """
     # 执行 TikTok 自动化操作
     print(data_config)
     if data_debug:
-        data = tiktok(**data_config).call(
-            {
-                "launch": None,
-                "connect": None,
-                "get": {"browser_link": "https://www.tiktok.com/@leeyueheng78/video/7497920728721837332", "time_delay": 5.0},
-                "comment": None,
-                "comment": {"comments_count": {"😭😭😭": None, "😭😭": "Unc clip farming ❤️‍🩹"}},
-                "get": {"browser_link": "https://www.tiktok.com/@jay_mingz21", "time_delay": 5.0},
-                "user_get": None,
-                "click": None,
-                "user_list": None,
-                "get": {"browser_link": "https://www.tiktok.com/search/user?q=google", "time_delay": 5.0},
-                "search_user": None,
-                "get": {"browser_link": "https://www.tiktok.com/search/video?q=google", "time_delay": 5.0},
-                "search_video": None,
-                "quit": None
-            }
+        # 会话由会话池启动与回收，计划中不包含 launch、connect、quit
+        data = execute(
+            data_config,
+            [
+                {"get": {"browser_link": "https://www.tiktok.com/@leeyueheng78/video/7497920728721837332", "time_delay": 5.0}},
+                "comment",
+                {"comment": {"comments_count": {"😭😭😭": None, "😭😭": "Unc clip farming ❤️‍🩹"}}},
+                {"get": {"browser_link": "https://www.tiktok.com/@jay_mingz21", "time_delay": 5.0}},
+                "user_get",
+                "click",
+                "user_list",
+                {"get": {"browser_link": "https://www.tiktok.com/search/user?q=google", "time_delay": 5.0}},
+                "search_user",
+                {"get": {"browser_link": "https://www.tiktok.com/search/video?q=google", "time_delay": 5.0}},
+                "search_video"
+            ]
         )
     else:
-        data = dict()
-        try:
-            data = {
-                "status": True,
-                "args": [data_config, data_params],
-                "return": tiktok(**data_config).call(data_params)
-            }
-        except Exception as e:
-            data = {
-                "status": True,
-                "args": [data_config, data_params],
-                "return":  str(e)
-            }
+        data = execute(data_config, data_params)
     return data
 
 
 if __name__ == "__main__":
     from json import dumps
-    print(dumps(main(data_params={
-        "launch": None,
-        "connect": None,
-        "get": {
+    # benchmark_qrcode()
+    print(dumps(main(data_params=[
+        {"get": {
             "browser_link": "https://www.tiktok.com/login/qrcode",
             "time_delay": 5.0
-        },
-        # "quit": None
-    }
+        }}
+    ]
     ), indent=4, ensure_ascii=False))
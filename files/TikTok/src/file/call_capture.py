@@ -0,0 +1,292 @@
+"""
+TikTok Network Capture Module
+
+This module reads TikTok's JSON API responses (search, comments, follower lists) straight from the browser's network
+traffic and maps them to the same record keys as the DOM extractors in `call_browser.tiktok`. Responses are captured
+through Chrome's performance log and CDP `Network.getResponseBody` in Selenium, or through a `page.on("response")`
+listener in the playwright/Camoufox paths.
+
+网络抓取模块
+
+本模块直接从浏览器网络流量中读取 TikTok 的 JSON 接口响应（搜索、评论、关注/粉丝列表），
+并映射为与 `call_browser.tiktok` 中 DOM 提取器相同键名的记录。
+Selenium 中通过 Chrome 性能日志与 CDP `Network.getResponseBody` 获取响应，
+playwright/Camoufox 中通过 `page.on("response")` 监听获取响应。
+
+接口与记录键名：
+    - search_user：/api/search/user/full/ → user_link, user_img, user_id, user_name
+    - search_video：/api/search/item/full/ → video_link, video_avatar, video_description, video_tags, video_username, video_view_count, video_like_count
+    - comment：/api/comment/list/ → comment_img, comment_user, comment_name, comment_text, comment_time, comment_reply
+    - user_list：/api/user/list/ → followers_img, followers_user, followers_name
+
+示例:
+    >>> from call_capture import capture
+    >>> network = capture(driver)
+    >>> network.drain()
+    >>> driver.get("https://www.tiktok.com/search/user?q=google")
+    >>> network.records("search_user")
+    [{"user_link": "https://www.tiktok.com/@google", "user_img": "...", "user_id": "google", "user_name": "Google"}, ...]
+"""
+
+
+from json import loads
+from urllib.parse import urlsplit
+from time import time, sleep
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+def _first_url(image: Optional[Dict[str, Any]]) -> Optional[str]:
+    # 头像/封面字段：{"url_list": [...]}
+    return ((image or {}).get("url_list") or [None])[0]
+
+
+def _count(value: Any) -> Optional[str]:
+    # 与 DOM 提取保持一致，数量以字符串返回
+    return None if value is None else str(value)
+
+
+def parse_search_user(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    解析 /api/search/user/full/ 响应，返回与 `tiktok.search_user` 相同键名的记录。
+    """
+    return [
+        {
+            "user_link": f"https://www.tiktok.com/@{user['unique_id']}",
+            "user_img": _first_url(user.get("avatar_thumb")),
+            "user_id": user["unique_id"],
+            "user_name": user.get("nickname")
+        }
+        for user in (item.get("user_info") or {} for item in data.get("user_list") or [])
+        if user.get("unique_id")
+    ]
+
+
+def parse_search_video(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    解析 /api/search/item/full/ 响应，返回与 `tiktok.search_video` 相同键名的记录。
+    """
+    return [
+        {
+            "video_link": f"https://www.tiktok.com/@{(item.get('author') or {}).get('uniqueId')}/video/{item['id']}",
+            "video_avatar": (item.get("video") or {}).get("cover"),
+            "video_description": item.get("desc"),
+            "video_tags": [f"#{tag['hashtagName']}" for tag in item.get("textExtra") or [] if tag.get("hashtagName")],
+            "video_username": (item.get("author") or {}).get("uniqueId"),
+            "video_view_count": _count((item.get("stats") or {}).get("playCount")),
+            "video_like_count": _count((item.get("stats") or {}).get("diggCount", 0))
+        }
+        for item in data.get("item_list") or []
+        if item.get("id")
+    ]
+
+
+def parse_comment(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    解析 /api/comment/list/ 响应，返回与 `tiktok.comment` 相同键名的记录，
+    `comment_time` 为 UTC 时间字符串，`comment_reply` 为 None。
+    """
+    return [
+        {
+            "comment_img": _first_url((comment.get("user") or {}).get("avatar_thumb")),
+            "comment_user": f"https://www.tiktok.com/@{(comment.get('user') or {}).get('unique_id')}",
+            "comment_name": (comment.get("user") or {}).get("nickname"),
+            "comment_text": comment.get("text"),
+            "comment_time": datetime.fromtimestamp(comment["create_time"], timezone.utc).strftime("%Y-%m-%d %H:%M:%S") if comment.get("create_time") else None,
+            "comment_reply": None
+        }
+        for comment in data.get("comments") or []
+    ]
+
+
+def parse_user_list(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    解析 /api/user/list/ 响应，返回与 `tiktok.user_list` 相同键名的记录（不含 user_link）。
+    """
+    return [
+        {
+            "followers_img": user.get("avatarThumb"),
+            "followers_user": user.get("uniqueId"),
+            "followers_name": user.get("nickname")
+        }
+        for user in ((item.get("user") or {}) for item in data.get("userList") or [])
+        if user.get("uniqueId")
+    ]
+
+
+# 接口名 → (URL 路径片段, 解析函数)
+API_PARSERS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], List[Dict[str, Any]]]]] = {
+    "search_user": ("/api/search/user/full/", parse_search_user),
+    "search_video": ("/api/search/item/full/", parse_search_video),
+    "comment": ("/api/comment/list/", parse_comment),
+    "user_list": ("/api/user/list/", parse_user_list)
+}
+
+
+def match(url: str) -> Optional[str]:
+    """
+    返回 URL 对应的接口名，不是已知接口时返回 None。
+
+    按完整路径匹配，/api/comment/list/reply/ 等子路径不会被识别为其父接口。
+    """
+    url_path = urlsplit(url).path.rstrip("/") + "/"
+    for api_name, (api_path, _) in API_PARSERS.items():
+        if url_path == api_path:
+            return api_name
+    return None
+
+
+def parse(url: str, body: str) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """
+    解析一个接口响应，返回 (接口名, 记录列表)；不是已知接口或响应不是 JSON 时返回 (None, [])。
+
+    示例:
+        >>> parse("https://www.tiktok.com/api/search/user/full/?keyword=google", body)
+        ("search_user", [{"user_link": "https://www.tiktok.com/@google", ...}])
+    """
+    api_name = match(url)
+    if api_name is None:
+        return None, []
+    try:
+        return api_name, API_PARSERS[api_name][1](loads(body))
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return api_name, []
+
+
+def listener(sink: Dict[str, List[Dict[str, Any]]]) -> Callable:
+    """
+    生成 playwright/Camoufox 的响应监听函数，已知接口的记录按接口名追加到 `sink`。
+
+    示例:
+        >>> records = dict()
+        >>> page.on("response", listener(records))
+        >>> await page.goto("https://www.tiktok.com/search/video?q=google")
+        >>> records["search_video"]
+    """
+    async def on_response(response) -> None:
+        if match(response.url) is None:
+            return
+        try:
+            api_name, api_records = parse(response.url, await response.text())
+        except Exception:
+            return
+        sink.setdefault(api_name, []).extend(api_records)
+    return on_response
+
+
+class capture:
+    """
+    基于 Chrome 性能日志的 Selenium 接口抓取器。
+
+    需要在连接浏览器时开启性能日志（`goog:loggingPrefs` 为 {"performance": "ALL"}），
+    `tiktok(capture=True)` 会自动开启。每次读取日志都会清空 chromedriver 中已缓存的日志。
+
+    属性:
+        driver (webdriver): 开启了性能日志的 Selenium WebDriver 实例。
+    """
+
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self._pending: Dict[str, str] = dict()
+        self._buffer: Dict[str, List[Dict[str, Any]]] = dict()
+
+    def drain(self) -> None:
+        """
+        丢弃此前缓存的全部网络日志，通常在导航到新页面之前调用。
+        """
+        self.driver.get_log("performance")
+        self._pending.clear()
+        self._buffer.clear()
+
+    def responses(self) -> Iterator[Tuple[str, str]]:
+        """
+        读取自上次调用以来已完成的已知接口响应，逐个生成 (URL, 响应正文)。
+        """
+        for entry in self.driver.get_log("performance"):
+            message = loads(entry["message"])["message"]
+            params = message.get("params") or {}
+            if message["method"] == "Network.responseReceived":
+                if match(params["response"]["url"]) is not None:
+                    self._pending[params["requestId"]] = params["response"]["url"]
+            elif message["method"] == "Network.loadingFinished" and params.get("requestId") in self._pending:
+                response_url = self._pending.pop(params["requestId"])
+                try:
+                    yield response_url, self.driver.execute_cdp_cmd(
+                        "Network.getResponseBody",
+                        {"requestId": params["requestId"]}
+                    )["body"]
+                except Exception:
+                    continue
+
+    def records(self, api_name: str) -> List[Dict[str, Any]]:
+        """
+        读取自上次调用以来指定接口的全部记录，其他接口的记录保留到下次读取。
+        """
+        for response_url, response_body in self.responses():
+            response_api, response_records = parse(response_url, response_body)
+            self._buffer.setdefault(response_api, []).extend(response_records)
+        return self._buffer.pop(api_name, [])
+
+    def iterate(
+        self,
+        api_name: str,
+        css_max: float = float('inf'),
+        time_delay: float = 5.0,
+        css_scroll: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        逐批收集指定接口的记录：先生成已到达的响应，不足 `css_max` 条时滚动页面触发下一页请求，
+        每个新到达的响应为一批，在 `time_delay` 秒内没有新响应时结束。
+
+        参数:
+            api_name (str): 接口名，见 `API_PARSERS`。
+            css_max (float): 最大获取的数量。
+            time_delay (float): 每次滚动后等待新响应的最长时间（秒）。
+            css_scroll (str, 可选): 滚动容器的 CSS 选择器，为空时滚动整个页面。
+
+        返回:
+            Iterator[List[Dict[str, Any]]]: 逐批生成的记录列表。
+        """
+        api_count = 0
+        api_page = self.records(api_name)
+        try:
+            while True:
+                api_page = api_page[:int(min(len(api_page), css_max - api_count))]
+                if api_page:
+                    api_count += len(api_page)
+                    yield api_page
+                if api_count >= css_max:
+                    break
+                self.driver.execute_script(
+                    """
+                    const parent = arguments[0] && document.querySelector(arguments[0]);
+                    if (parent && parent.lastElementChild) parent.lastElementChild.scrollIntoView(true);
+                    else window.scrollTo(0, document.body.scrollHeight);
+                    """,
+                    css_scroll
+                )
+                time_start = time()
+                api_page = list()
+                while not api_page and time() - time_start < time_delay:
+                    sleep(0.1)
+                    api_page = self.records(api_name)
+                if not api_page:
+                    break
+        finally:
+            self.driver.execute_script("window.scrollTo(0, 0);")
+
+    def collect(
+        self,
+        api_name: str,
+        css_max: float = float('inf'),
+        time_delay: float = 5.0,
+        css_scroll: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        收集指定接口的记录，参数与 `iterate` 相同，返回全部批次合并后的列表。
+        """
+        return [
+            record
+            for api_page in self.iterate(api_name, css_max, time_delay, css_scroll)
+            for record in api_page
+        ]
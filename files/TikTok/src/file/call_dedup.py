@@ -0,0 +1,202 @@
+"""
+TikTok Dedup Store Module
+
+This module keeps a local SQLite index of the users and videos that have already been scraped, so that repeated
+`search_video`, `search_user` and `user_list` runs can skip known items and stop scrolling once most of a page is
+already known. Every key carries the time it was last seen and expires after a configurable TTL, after which the
+item is collected again.
+
+去重存储模块
+
+本模块在本地 SQLite 中记录已经采集过的用户与视频，重复执行 `search_video`、`search_user`、`user_list` 时
+可以跳过已知条目，并在一页中大部分条目已知时停止滚动。每个键记录最后一次出现的时间，超过 TTL 后失效并重新采集。
+
+过滤（`filter`）是只读的：新条目的键先作为待记录键随结果返回（回复或流式批次消息中的 `dedup` 字段），
+结果送达调用方之后再通过 `commit` 记录，执行失败或回复丢失时这些条目在下一次采集中仍会返回。
+
+键名：
+    - search_video：video_link
+    - search_user：user_link
+    - user_list：user_link + followers_user（同一用户出现在不同的关注/粉丝列表中视为不同条目）
+
+示例:
+    >>> from call_dedup import dedup
+    >>> store = dedup("cache/dedup.sqlite3", ttl=86400)
+    >>> store.filter("search_video", [{"video_link": "https://www.tiktok.com/@a/video/1"}])
+    ([{'video_link': 'https://www.tiktok.com/@a/video/1'}], 0.0, ['https://www.tiktok.com/@a/video/1'])
+    >>> store.commit({"search_video": ["https://www.tiktok.com/@a/video/1"]})
+    >>> store.filter("search_video", [{"video_link": "https://www.tiktok.com/@a/video/1"}])
+    ([], 1.0, [])
+"""
+
+
+import sqlite3
+from os import makedirs
+from os.path import dirname, join
+from threading import Lock
+from time import time
+from typing import Any, Container, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# 提取器名 → 组成键的字段
+DEDUP_KEYS: Dict[str, Tuple[str, ...]] = {
+    "search_video": ("video_link",),
+    "search_user": ("user_link",),
+    "user_list": ("user_link", "followers_user")
+}
+
+
+class dedup:
+    """
+    基于 SQLite 的去重索引，可在多个线程之间共享。
+
+    属性:
+        db_path (str): 数据库文件路径，":memory:" 表示仅保存在内存中。
+        ttl (float): 键的有效期（秒），None 表示永不过期。
+    """
+
+    def __init__(
+        self,
+        db_path: str = join(dirname(__file__), "cache", "dedup.sqlite3"),
+        ttl: Optional[float] = 7 * 24 * 3600.0
+    ) -> None:
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = Lock()
+        if db_path != ":memory:":
+            makedirs(dirname(db_path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS seen (kind TEXT, key TEXT, utc REAL, PRIMARY KEY (kind, key)) WITHOUT ROWID"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def key(api_name: str, item: Dict[str, Any]) -> Optional[str]:
+        """
+        返回条目的去重键，缺少键字段时返回 None（此类条目不参与去重）。
+        """
+        values = [item.get(field) for field in DEDUP_KEYS[api_name]]
+        return " ".join(values) if all(values) else None
+
+    def known(self, api_name: str, keys: Iterable[str]) -> Set[str]:
+        """
+        返回 `keys` 中尚未过期的已知键。
+        """
+        keys = list(keys)
+        if not keys:
+            return set()
+        utc_min = time() - self.ttl if self.ttl is not None else float("-inf")
+        with self._lock:
+            return {
+                row[0]
+                for start in range(0, len(keys), 500)
+                for row in self._db.execute(
+                    f"SELECT key FROM seen WHERE kind = ? AND utc >= ? AND key IN ({','.join('?' * len(keys[start:start + 500]))})",
+                    [api_name, utc_min, *keys[start:start + 500]]
+                )
+            }
+
+    def add(self, api_name: str, keys: Iterable[str]) -> None:
+        """
+        记录键并刷新其最后出现时间。
+        """
+        utc = time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT INTO seen (kind, key, utc) VALUES (?, ?, ?) ON CONFLICT (kind, key) DO UPDATE SET utc = excluded.utc",
+                [(api_name, key, utc) for key in keys]
+            )
+            self._db.commit()
+
+    def filter(
+        self,
+        api_name: str,
+        items: List[Dict[str, Any]],
+        pending: Container[str] = frozenset()
+    ) -> Tuple[List[Dict[str, Any]], float, List[str]]:
+        """
+        过滤一批条目（只读，不记录任何键）。
+
+        参数:
+            api_name (str): 提取器名，见 `DEDUP_KEYS`。
+            items (list): 一批条目。
+            pending (Container, 可选): 本次采集中已经返回、尚未记录的键，同样视为已知。
+
+        返回:
+            tuple: (新条目列表, 已知比例, 新条目的键)，空批次的已知比例为 0.0；新条目送达后需以 `commit` 记录其键。
+        """
+        keys = [self.key(api_name, item) for item in items]
+        known = self.known(api_name, (key for key in keys if key is not None and key not in pending))
+        fresh, fresh_keys = list(), dict()
+        for key, item in zip(keys, items):
+            if key is None or (key not in known and key not in pending and key not in fresh_keys):
+                fresh.append(item)
+                key is not None and fresh_keys.setdefault(key)
+        return fresh, (len(items) - len(fresh)) / len(items) if items else 0.0, list(fresh_keys)
+
+    def commit(self, pending: Dict[str, Iterable[str]]) -> None:
+        """
+        记录已经送达的条目的键：{提取器名: [键, ...]}，即回复中 `dedup` 字段的内容。
+        """
+        for api_name, keys in pending.items():
+            self.add(api_name, keys)
+
+    def purge(self) -> int:
+        """
+        删除已过期的键，返回删除的数量。
+        """
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            deleted = self._db.execute("DELETE FROM seen WHERE utc < ?", (time() - self.ttl,)).rowcount
+            self._db.commit()
+        return deleted
+
+    def clear(self, api_name: Optional[str] = None) -> None:
+        """
+        清空指定提取器（默认全部）的键。
+        """
+        with self._lock:
+            if api_name is None:
+                self._db.execute("DELETE FROM seen")
+            else:
+                self._db.execute("DELETE FROM seen WHERE kind = ?", (api_name,))
+            self._db.commit()
+
+    def close(self) -> None:
+        """
+        关闭数据库连接。
+        """
+        with self._lock:
+            self._db.close()
+
+
+def pending(message: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    取出（并删除）回复或流式批次消息中的待记录键，消息中没有时返回空字典。
+    """
+    keys = message.pop("dedup", None) or dict()
+    if isinstance(message.get("stream"), dict):
+        for api_name, api_keys in (message["stream"].pop("dedup", None) or dict()).items():
+            keys.setdefault(api_name, list()).extend(api_keys)
+    if isinstance(message.get("return"), dict):
+        for api_name, api_keys in (message["return"].pop("dedup", None) or dict()).items():
+            keys.setdefault(api_name, list()).extend(api_keys)
+    return keys
+
+
+# 进程内共享的去重索引，首次使用时创建
+_store: Optional[dedup] = None
+
+
+def dedup_store() -> dedup:
+    """
+    返回进程内共享的去重索引（cache/dedup.sqlite3，TTL 7 天）。
+    """
+    global _store
+    if _store is None:
+        _store = dedup()
+    return _store
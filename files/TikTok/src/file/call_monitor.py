@@ -0,0 +1,160 @@
+"""
+Resource Monitor Module
+
+This module samples system CPU / memory / disk usage and per-process stats of the browser processes (Chrome,
+chromedriver, Edge, Firefox/Camoufox) in a background thread, keeping the last `size` samples in fixed-size ring
+buffers. The Streamlit consoles read snapshots from it instead of sampling inside the script thread, so monitoring
+no longer blocks the other tabs.
+
+资源监控模块
+
+本模块在后台线程中采样系统 CPU/内存/磁盘使用率，以及浏览器进程（Chrome、chromedriver、Edge、Firefox/Camoufox）
+的进程级统计，最近 `size` 个采样保存在定长环形缓冲区中。Streamlit 控制台只读取快照，不再在脚本线程中采样，
+监控运行时其他标签页仍可正常使用。
+
+示例:
+    >>> from call_monitor import resource_monitor
+    >>> sampler = resource_monitor().start()
+    >>> sampler.snapshot()["cpu"][-5:]
+    [12.5, 9.8, 10.1, 30.2, 11.0]
+    >>> sampler.processes()
+    [{"name": "chrome", "count": 14, "cpu": 23.5, "memory": 1830.2}, ...]
+"""
+
+
+from collections import deque
+from threading import Event, Lock, Thread
+from time import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import psutil
+
+
+class monitor:
+    """
+    后台资源采样器。
+
+    属性:
+        interval (float): 采样间隔（秒）。
+        size (int): 环形缓冲区长度（保留的采样数量）。
+        process_names (tuple): 统计的进程名前缀（不区分大小写）。
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        size: int = 300,
+        process_names: Tuple[str, ...] = ("chrome", "chromedriver", "msedge", "firefox", "camoufox"),
+        disk_path: str = "/"
+    ) -> None:
+        self.interval = interval
+        self.size = size
+        self.process_names = tuple(name.lower() for name in process_names)
+        self.disk_path = disk_path
+        self.buffers: Dict[str, deque] = {
+            key: deque(maxlen=size)
+            for key in ("utc", "cpu", "memory", "disk")
+        }
+        self._processes: List[Dict[str, Any]] = list()
+        self._tracked: Dict[int, psutil.Process] = dict()
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """
+        采样线程是否在运行。
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "monitor":
+        """
+        启动采样线程（已运行时不做任何操作），返回自身。
+        """
+        if not self.running:
+            self._stop.clear()
+            psutil.cpu_percent(interval=None)
+            self._thread = Thread(target=self._run, name="resource-monitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        停止采样线程，已采集的数据保留。
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+        self._thread = None
+
+    def snapshot(self) -> Dict[str, List[float]]:
+        """
+        返回当前缓冲区的副本 {"utc", "cpu", "memory", "disk"}，各列表等长、按时间顺序排列。
+        """
+        with self._lock:
+            return {key: list(buffer) for key, buffer in self.buffers.items()}
+
+    def processes(self) -> List[Dict[str, Any]]:
+        """
+        返回最近一次采样的浏览器进程统计，按进程名汇总：
+        [{"name", "count", "cpu"（%，可超过 100）, "memory"（RSS，MB）}, ...]。
+        """
+        with self._lock:
+            return [dict(process) for process in self._processes]
+
+    def _sample_processes(self) -> List[Dict[str, Any]]:
+        # 复用 Process 对象，使 cpu_percent 统计的是两次采样之间的占用
+        summary: Dict[str, Dict[str, Any]] = dict()
+        alive = set()
+        for process in psutil.process_iter(["name"]):
+            name = (process.info["name"] or str()).lower()
+            if not name.startswith(self.process_names):
+                continue
+            process = self._tracked.setdefault(process.pid, process)
+            try:
+                cpu, memory = process.cpu_percent(interval=None), process.memory_info().rss / 1048576
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            alive.add(process.pid)
+            name = name.rsplit(".exe", 1)[0]
+            total = summary.setdefault(name, {"name": name, "count": 0, "cpu": 0.0, "memory": 0.0})
+            total["count"] += 1
+            total["cpu"] += cpu
+            total["memory"] += memory
+        self._tracked = {pid: process for pid, process in self._tracked.items() if pid in alive}
+        return [
+            {**total, "cpu": round(total["cpu"], 1), "memory": round(total["memory"], 1)}
+            for total in sorted(summary.values(), key=lambda total: total["memory"], reverse=True)
+        ]
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                sample = (
+                    time(),
+                    psutil.cpu_percent(interval=None),
+                    psutil.virtual_memory().percent,
+                    psutil.disk_usage(self.disk_path).percent
+                )
+                processes = self._sample_processes()
+            except Exception:
+                continue
+            with self._lock:
+                for key, value in zip(("utc", "cpu", "memory", "disk"), sample):
+                    self.buffers[key].append(value)
+                self._processes = processes
+
+
+# 进程内共享的采样器，首次使用时创建
+_monitor: Optional[monitor] = None
+
+
+def resource_monitor() -> monitor:
+    """
+    返回进程内共享的资源采样器（未启动）。
+    """
+    global _monitor
+    if _monitor is None:
+        _monitor = monitor()
+    return _monitor
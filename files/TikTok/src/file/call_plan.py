@@ -0,0 +1,82 @@
+"""
+TikTok Command Plan Module
+
+This module builds the command table and validates ordered command plans for both `call_browser.tiktok` and
+`call_playwright.tiktok_async`, so the two classes share one set of rules instead of two copies that drift apart.
+
+命令计划模块
+
+本模块为 `call_browser.tiktok` 与 `call_playwright.tiktok_async` 生成命令表并校验有序命令计划，
+两个类共用同一套规则。
+
+示例:
+    >>> from call_plan import commands, plan
+    >>> plan([{"get": {"browser_link": "https://www.tiktok.com/"}}, "search_user"], commands(tiktok))
+    [('get', {'browser_link': 'https://www.tiktok.com/'}), ('search_user', None)]
+"""
+
+
+from inspect import Signature, getmembers, isasyncgenfunction, isfunction, isgeneratorfunction, signature
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def commands(cls: type) -> Dict[str, Tuple[Callable, Signature]]:
+    """
+    返回类的命令表：所有公开的方法（不含 `call` 与生成器、异步生成器方法，如 `stream`、`*_iter`）及其签名。
+
+    参数:
+        cls (type): `tiktok` 或 `tiktok_async`。
+
+    返回:
+        dict: {方法名: (函数, 签名)}。
+    """
+    return {
+        func_name: (func, signature(func))
+        for func_name, func in getmembers(cls, isfunction)
+        if not func_name.startswith("_") and func_name != "call"
+        and not isgeneratorfunction(func) and not isasyncgenfunction(func)
+    }
+
+
+def plan(
+    func_plan: List[Any],
+    func_commands: Dict[str, Tuple[Callable, Signature]]
+) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    校验有序命令计划，返回 [(方法名, 参数), ...]；计划中的全部错误一次性以 ValueError 抛出。
+
+    计划中的每一步可以是方法名字符串（无参数），或只有一个键的字典 {方法名: 参数字典或 None}。
+    参数按方法签名校验（未知参数、缺少必填参数都会报错），因此错误的计划在启动浏览器之前就会失败。
+
+    参数:
+        func_plan (list): 有序命令计划。
+        func_commands (dict): `commands` 返回的命令表。
+
+    返回:
+        list: 校验后的 (方法名, 参数) 列表。
+    """
+    if not isinstance(func_plan, list):
+        raise ValueError(f"命令计划必须是列表: {type(func_plan).__name__}")
+    func_steps, func_errors = list(), list()
+    for step_index, step in enumerate(func_plan):
+        if isinstance(step, str):
+            step = {step: None}
+        if not isinstance(step, dict) or len(step) != 1:
+            func_errors.append(f"第 {step_index} 步必须是方法名或只有一个键的字典: {step!r}")
+            continue
+        (func_name, func_args), = step.items()
+        if func_name not in func_commands:
+            func_errors.append(f"第 {step_index} 步方法不存在: {func_name}")
+            continue
+        if func_args is not None and not isinstance(func_args, dict):
+            func_errors.append(f"第 {step_index} 步 {func_name} 的参数必须是字典或 None: {func_args!r}")
+            continue
+        try:
+            func_commands[func_name][1].bind(None, **(func_args or {}))
+        except TypeError as func_error:
+            func_errors.append(f"第 {step_index} 步 {func_name} 的参数无效: {func_error}")
+            continue
+        func_steps.append((func_name, func_args))
+    if func_errors:
+        raise ValueError("\n".join(func_errors))
+    return func_steps
@@ -0,0 +1,963 @@
+"""
+TikTok Async Playwright Module
+
+This module is an asynchronous counterpart of `call_browser.tiktok` built on playwright (Chromium, or Camoufox when
+installed). It implements the same commands (`get`, `click`, `msg`, `comment`, `user_get`, `user_list`,
+`search_user`, `search_video`, ...) with the same arguments and record keys, and reuses the in-page scripts and
+field mappings from `call_script`, so one event loop can drive many pages and contexts concurrently.
+
+异步 Playwright 模块
+
+本模块是基于 playwright（Chromium，安装 Camoufox 时也可使用 Camoufox）的 `call_browser.tiktok` 异步版本。
+实现了相同的命令（`get`、`click`、`msg`、`comment`、`user_get`、`user_list`、`search_user`、`search_video` 等），
+参数与返回的键名保持一致，并复用 `call_script` 中的页面脚本与字段映射，一个事件循环即可并发驱动多个页面与上下文。
+
+特点：
+    - 同一事件循环内的所有实例共用一个浏览器进程，每个账号使用独立的浏览器上下文（登录状态保存在 profiles/<账号>.json）。
+    - 命令计划格式与 `tiktok.call` 相同，执行前整体校验。
+    - 资源拦截按 playwright 的资源类型进行，追踪脚本按 URL 通配符拦截。
+    - 开启 `capture` 时，列表命令直接读取接口响应（见 `call_capture`）。
+
+Python 环境要求：
+    python -m pip install playwright
+    python -m playwright install chromium
+    可选：python -m pip install camoufox
+
+示例:
+    >>> import asyncio
+    >>> from call_playwright import main
+    >>> asyncio.run(main({"username": "mxlbbi"}, [
+    ...     {"get": {"browser_link": "https://www.tiktok.com/search/user?q=google", "time_delay": 5.0}},
+    ...     "search_user"
+    ... ]))
+"""
+
+
+import asyncio
+from contextlib import asynccontextmanager
+from fnmatch import fnmatchcase
+from inspect import Signature, iscoroutinefunction, signature
+from os import makedirs
+from os.path import dirname, isfile, join
+from time import perf_counter, time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+# 页面脚本与字段映射
+from call_script import (
+    JS_COLLECT,
+    JS_NETWORK_IDLE,
+    JS_TRAFFIC,
+    FIELDS_COMMENT,
+    FIELDS_USER_LIST,
+    FIELDS_SEARCH_USER,
+    FIELDS_SEARCH_VIDEO,
+    BLOCK_PATTERNS,
+    LIST_SELECTORS
+)
+from call_plan import commands as plan_commands, plan as plan_steps
+from call_capture import listener
+from call_dedup import dedup_store
+
+
+def _function(js_body: str) -> str:
+    # 将 Selenium 形式的脚本（使用 arguments 与 return）包装为 page.evaluate 可用的函数
+    return f"(args) => (function () {{{js_body}}}).apply(null, args)"
+
+
+def _function_async(js_body: str) -> str:
+    # 将 execute_async_script 形式的脚本（最后一个参数为回调）包装为返回 Promise 的函数
+    return f"(args) => new Promise(done => (function () {{{js_body}}}).apply(null, [...args, done]))"
+
+
+# 包装后的页面脚本，模块加载时生成一次
+PW_COLLECT = _function_async(JS_COLLECT)
+PW_NETWORK_IDLE = _function(JS_NETWORK_IDLE)
+PW_TRAFFIC = _function(JS_TRAFFIC)
+
+# playwright 中无法返回 DOM 元素，评论回复改为按序号定位
+FIELDS_COMMENT_ASYNC = {
+    field_name: field
+    for field_name, field in FIELDS_COMMENT.items()
+    if field[1] != "element"
+}
+
+
+class engine:
+    """
+    每个事件循环共用的 playwright 浏览器，首次使用时启动。
+
+    属性:
+        browser_type (str): "chromium" 或 "camoufox"。
+    """
+
+    _engines: Dict[Tuple[int, str, Optional[str], bool], "engine"] = dict()
+
+    def __init__(
+        self,
+        browser_type: str = "chromium",
+        browser_path: Optional[str] = None,
+        headless: bool = False
+    ) -> None:
+        self.browser_type = browser_type
+        self.browser_path = browser_path
+        self.headless = headless
+        self.browser: Optional[Browser] = None
+        self._playwright = None
+        self._lock = asyncio.Lock()
+        self._loop = asyncio.get_running_loop()
+
+    @classmethod
+    def shared(
+        cls,
+        browser_type: str = "chromium",
+        browser_path: Optional[str] = None,
+        headless: bool = False
+    ) -> "engine":
+        """
+        返回当前事件循环中与参数对应的共享浏览器。
+        """
+        # 已关闭事件循环的浏览器不再可用，先移除（其 id 可能被新的事件循环复用）
+        for engine_key in [engine_key for engine_key, shared in cls._engines.items() if shared._loop.is_closed()]:
+            del cls._engines[engine_key]
+        engine_key = (id(asyncio.get_running_loop()), browser_type, browser_path, headless)
+        if engine_key not in cls._engines:
+            cls._engines[engine_key] = cls(browser_type, browser_path, headless)
+        return cls._engines[engine_key]
+
+    async def start(self) -> Browser:
+        """
+        启动浏览器（已启动且仍连接时直接返回）。
+        """
+        async with self._lock:
+            if self.browser is not None and self.browser.is_connected():
+                return self.browser
+            if self.browser_type == "camoufox":
+                from camoufox.async_api import AsyncCamoufox
+                self._playwright = AsyncCamoufox(headless=self.headless)
+                self.browser = await self._playwright.start()
+            else:
+                self._playwright = await async_playwright().start()
+                self.browser = await self._playwright.chromium.launch(
+                    headless=self.headless,
+                    executable_path=self.browser_path,
+                    args=["--no-first-run", "--no-default-browser-check", "--disable-notifications"]
+                )
+            return self.browser
+
+    async def stop(self) -> None:
+        """
+        关闭浏览器与 playwright。
+        """
+        async with self._lock:
+            if self.browser is not None:
+                await self.browser.close()
+                self.browser = None
+            if self._playwright is not None:
+                await (self._playwright.__aexit__() if self.browser_type == "camoufox" else self._playwright.stop())
+                self._playwright = None
+
+
+class tiktok_async:
+    """
+    TikTok 异步自动化操作类，与 `call_browser.tiktok` 的命令、参数与返回键名保持一致。
+
+    属性:
+        username (str): TikTok 账号用户名，对应独立的浏览器上下文与登录状态文件。
+        proxy (str): 代理服务器地址（可选）。
+        headless (bool): 是否以无头模式运行浏览器。
+        capture (bool): 是否开启网络抓取模式。
+        browser_type (str): "chromium" 或 "camoufox"。
+        context (BrowserContext): 浏览器上下文。
+        page (Page): 当前页面。
+
+    示例:
+        >>> browser = tiktok_async(username="mxlbbi")
+        >>> await browser.call([{"get": {"browser_link": "https://www.tiktok.com/search/video?q=google"}}, "search_video"])
+    """
+
+    # 命令分发表 {方法名: (函数, 签名)}，由 `commands` 在首次使用时构建
+    _commands: Optional[Dict[str, Tuple[Callable, Signature]]] = None
+
+    # 资源拦截规则，image/font/media 按 playwright 资源类型拦截，其余按 URL 通配符拦截
+    block_patterns: Dict[str, List[str]] = BLOCK_PATTERNS
+
+    def __init__(
+        self,
+        browser_path: Optional[str] = None,
+        debug_port: Optional[int] = None,
+        username: Optional[str] = None,
+        proxy: Optional[str] = None,
+        headless: bool = False,
+        capture: bool = False,
+        lite: bool = False,
+        browser_type: str = "chromium"
+    ) -> None:
+        """
+        初始化异步 TikTok 自动化操作类，参数与 `tiktok` 相同（`debug_port`、`lite` 仅为兼容保留）。
+
+        参数:
+            browser_type (str, 可选): "chromium" 或 "camoufox"，默认为 "chromium"。
+        """
+        self.browser_path = browser_path
+        self.username = username or "default"
+        # 用户名来自远程配置，用作文件名前需拒绝路径分隔符
+        if any(separator in self.username for separator in ("/", "\\", "\0")) or self.username in (".", ".."):
+            raise ValueError(f"无效的用户名: {self.username!r}")
+        self.proxy = proxy
+        self.headless = headless
+        self.capture = capture
+        self.browser_type = browser_type
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.records: Dict[str, List[Dict[str, Any]]] = dict()
+        self.dedup_pending: Dict[str, Dict[str, None]] = dict()
+        self.state_path = join(dirname(__file__), "profiles", f"{self.username}.json")
+        makedirs(dirname(self.state_path), exist_ok=True)
+        self._blocked: List[str] = list()
+        self._blocked_patterns: List[str] = list()
+
+    async def _script(self, js_function: str, *args) -> Any:
+        return await self.page.evaluate(js_function, list(args))
+
+    def alive(self) -> bool:
+        """
+        检查页面是否可用。
+        """
+        return self.page is not None and not self.page.is_closed()
+
+    async def launch(self) -> bool:
+        """
+        创建浏览器上下文与页面，已可用时不做任何操作。
+        """
+        if self.alive():
+            return True
+        browser = await engine.shared(self.browser_type, self.browser_path, self.headless).start()
+        self.context = await browser.new_context(
+            proxy={"server": self.proxy} if self.proxy else None,
+            storage_state=self.state_path if isfile(self.state_path) else None
+        )
+        await self.context.route("**/*", self._route)
+        self.page = await self.context.new_page()
+        self.capture and self.page.on("response", listener(self.records))
+        return True
+
+    async def connect(self) -> bool:
+        """
+        与 `tiktok.connect` 对应，异步版本在 `launch` 中已完成连接。
+        """
+        return await self.launch()
+
+    async def quit(self) -> None:
+        """
+        保存登录状态并关闭浏览器上下文。
+        """
+        if self.context is not None:
+            await self.context.storage_state(path=self.state_path)
+            await self.context.close()
+        self.context = None
+        self.page = None
+
+    async def close(self) -> None:
+        """
+        关闭浏览器上下文，失败时忽略。
+        """
+        try:
+            await self.quit()
+        except Exception:
+            self.context = None
+            self.page = None
+
+    async def block(
+        self,
+        block_types: List[str] = ["media", "font", "tracker"],
+        block_urls: List[str] = []
+    ) -> List[str]:
+        """
+        拦截指定类型的资源请求，对当前上下文后续的所有页面生效，直到再次调用。
+
+        参数:
+            block_types (list): 拦截的资源类型，可选 "image"、"font"、"media"、"tracker"。
+            block_urls (list): 额外拦截的 URL 通配符。
+
+        返回:
+            list: 当前生效的拦截规则。
+        """
+        self._blocked = [block_type for block_type in block_types if block_type in ("image", "font", "media")]
+        self._blocked_patterns = [
+            pattern
+            for block_type in block_types
+            if block_type not in self._blocked
+            for pattern in self.block_patterns.get(block_type, [])
+        ] + list(block_urls)
+        return self._blocked + self._blocked_patterns
+
+    async def _route(self, route) -> None:
+        request = route.request
+        if request.resource_type in self._blocked or any(
+            fnmatchcase(request.url, pattern) for pattern in self._blocked_patterns
+        ):
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    async def traffic(self) -> Dict[str, int]:
+        """
+        统计当前页面自加载以来的网络请求数量与传输字节数。
+        """
+        return await self._script(PW_TRAFFIC)
+
+    async def wait(
+        self,
+        wait_for: Union[str, Dict[str, Any], None] = None,
+        time_delay: float = 5.0,
+        browser_link: Optional[str] = None
+    ) -> bool:
+        """
+        等待页面满足指定条件，条件格式与 `tiktok.wait` 相同。
+
+        返回:
+            bool: 条件在超时前满足时返回 True；超时返回 False。
+        """
+        if not wait_for or time_delay <= 0:
+            return True
+        if isinstance(wait_for, str):
+            wait_for = {"css": wait_for}
+        browser_link = browser_link or self.page.url
+        wait_timeout = time_delay * 1000
+        try:
+            async with asyncio.timeout(time_delay):
+                if wait_for.get("css"):
+                    await self.page.wait_for_selector(wait_for["css"], state="attached", timeout=wait_timeout)
+                if wait_for.get("url") is True:
+                    await self.page.wait_for_url(lambda url: url != browser_link, timeout=wait_timeout)
+                elif wait_for.get("url"):
+                    await self.page.wait_for_url(lambda url: wait_for["url"] in url, timeout=wait_timeout)
+                if wait_for.get("idle"):
+                    await self.page.wait_for_function(
+                        PW_NETWORK_IDLE,
+                        arg=[500 if wait_for["idle"] is True else int(wait_for["idle"])],
+                        polling=100,
+                        timeout=wait_timeout
+                    )
+            return True
+        except Exception:
+            return False
+
+    async def get(
+        self,
+        browser_link: str = "https://www.tiktok.com/login/qrcode",
+        time_delay: float = 1.0,
+        wait_for: Union[str, Dict[str, Any], None] = {"idle": 300}
+    ) -> bool:
+        """
+        导航到指定的 URL，并等待页面就绪（参数与 `tiktok.get` 相同）。
+        """
+        self.records.clear()
+        await self.page.goto(browser_link)
+        await self.page.keyboard.press("Escape")
+        return await self.wait(wait_for, time_delay)
+
+    async def click(
+        self,
+        css_selector: str = "div.css-1ldzp5s-DivNumber",
+        time_delay: float = 1.0,
+        wait_for: Union[str, Dict[str, Any], None] = {"idle": 300}
+    ) -> bool:
+        """
+        点击页面上第二个匹配的元素，并等待页面响应（与 `tiktok.click` 相同）。
+        """
+        browser_link = self.page.url
+        try:
+            await self.page.locator(css_selector).nth(1).click(timeout=time_delay * 1000)
+        except Exception:
+            return False
+        await self.wait(wait_for, time_delay, browser_link)
+        return True
+
+    async def msg(
+        self,
+        msg_send: str = "Hello World!",
+        time_delay: float = 0.0,
+        wait_for: Union[str, Dict[str, Any], None] = None
+    ) -> None:
+        """
+        在当前焦点输入框中输入指定内容并发送（与 `tiktok.msg` 相同）。
+        """
+        await self.page.keyboard.type(msg_send)
+        await self.wait(wait_for, time_delay)
+        await self.page.keyboard.press("Enter")
+
+    async def _collect(
+        self,
+        css_parent: str,
+        css_child: str,
+        fields: Dict[str, List[Any]],
+        css_max: float = float('inf'),
+        time_delay: float = 5.0
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        增量采集无限滚动列表，逻辑与 `tiktok._collect` 相同。
+        """
+        css_seen = 0
+        try:
+            while css_seen < css_max:
+                css_step = await self._script(
+                    PW_COLLECT,
+                    css_parent,
+                    css_child,
+                    css_seen,
+                    fields,
+                    int(time_delay * 1000)
+                )
+                if not css_step["parent"]:
+                    raise LookupError(f"Unable to locate element: {css_parent}")
+                css_items = css_step["items"][:int(min(len(css_step["items"]), css_max - css_seen))]
+                if not css_items:
+                    break
+                css_seen += len(css_items)
+                yield css_items
+        finally:
+            await self.page.evaluate("window.scrollTo(0, 0)")
+
+    async def _list(self, batches: AsyncIterator[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        # 合并异步批次
+        return [item async for items in batches for item in items]
+
+    async def _capture(
+        self,
+        api_name: str,
+        css_max: float,
+        time_delay: float,
+        css_scroll: Optional[str]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        网络抓取模式：逐批读取响应监听收集的记录，不足时滚动页面触发下一页请求，逻辑与 `capture.iterate` 相同。
+        """
+        api_count = 0
+        api_page = self.records.pop(api_name, [])
+        try:
+            while True:
+                api_page = api_page[:int(min(len(api_page), css_max - api_count))]
+                if api_page:
+                    api_count += len(api_page)
+                    yield api_page
+                if api_count >= css_max:
+                    break
+                await self.page.evaluate(
+                    """(cssScroll) => {
+                        const parent = cssScroll && document.querySelector(cssScroll);
+                        if (parent && parent.lastElementChild) parent.lastElementChild.scrollIntoView(true);
+                        else window.scrollTo(0, document.body.scrollHeight);
+                    }""",
+                    css_scroll
+                )
+                time_start = time()
+                while not self.records.get(api_name) and time() - time_start < time_delay:
+                    await asyncio.sleep(0.1)
+                api_page = self.records.pop(api_name, [])
+                if not api_page:
+                    break
+        finally:
+            await self.page.evaluate("window.scrollTo(0, 0)")
+
+    async def _dedup(
+        self,
+        api_name: str,
+        batches: AsyncIterator[List[Dict[str, Any]]],
+        dedup_stop: Optional[float] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        按去重索引过滤逐批结果，逻辑与 `tiktok._dedup` 相同（新条目的键加入 `dedup_pending`，送达后再记录）。
+        """
+        dedup_index = dedup_store() if dedup_stop is not None else None
+        api_pending = self.dedup_pending.setdefault(api_name, dict())
+        try:
+            async for items in batches:
+                if dedup_index is None:
+                    yield items
+                    continue
+                items, items_known, items_keys = dedup_index.filter(api_name, items, api_pending)
+                api_pending.update(dict.fromkeys(items_keys))
+                if items:
+                    yield items
+                if items_known >= dedup_stop:
+                    break
+        finally:
+            await batches.aclose()
+
+    def dedup_pop(self) -> Dict[str, List[str]]:
+        """
+        取出尚未记录的去重键（与 `tiktok.dedup_pop` 相同）。
+        """
+        pending, self.dedup_pending = self.dedup_pending, dict()
+        return {api_name: list(api_keys) for api_name, api_keys in pending.items() if api_keys}
+
+    async def comment(
+        self,
+        comments_count: Dict[str, Optional[str]] = dict(),
+        css_count: int = 0x400,
+        time_delay: float = 1.0,
+        wait_for: Union[str, Dict[str, Any], None] = {"idle": 300}
+    ) -> List[Dict[str, Any]]:
+        """
+        获取评论并按指定内容回复（与 `tiktok.comment` 相同）。
+        """
+        if not comments_count:
+            return await self._list(self.comment_iter(css_count, time_delay))
+        css_child = ".css-13wx63w-DivCommentObjectWrapper"
+        comments_data = [
+            {**comment, "comment_reply": comment_index}
+            for comment_index, comment in enumerate(await self._list(self._collect(
+                ".css-x4xlc7-DivCommentContainer", css_child, FIELDS_COMMENT_ASYNC, css_count, time_delay
+            )))
+        ]
+        browser_link = self.page.url
+        comments_data = [{"browser_link": browser_link, **comment} for comment in comments_data]
+        comments_data = {comment["comment_text"]: comment for comment in comments_data}
+        comments_reply = list()
+        for reply_text, comment_text in comments_count.items():
+            comment = comments_data.get(comment_text) if comment_text is not None else None
+            if comment is None:
+                comment = {
+                    "avatar_url": self.page.url,
+                    "username": (await self.page.locator("a[data-e2e='nav-profile']").first.get_attribute("href")).split("@")[1],
+                    "comment_text": None
+                }
+                reply_target = self.page.locator(".notranslate.public-DraftEditor-content").first
+            else:
+                reply_target = self.page.locator(css_child).nth(comment["comment_reply"]).locator(
+                    FIELDS_COMMENT["comment_reply"][0]
+                ).first
+            await reply_target.scroll_into_view_if_needed()
+            await reply_target.click()
+            await self.msg(msg_send=reply_text, time_delay=0.0)
+            comments_reply.append({**comment, "comment_reply": reply_text})
+            await self.wait(wait_for, time_delay)
+        await self.page.evaluate("window.scrollTo(0, 0)")
+        return comments_reply
+
+    async def comment_iter(
+        self,
+        css_count: int = 0x400,
+        time_delay: float = 1.0
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        逐批获取当前视频的评论（不回复），与 `tiktok.comment_iter` 相同。
+        """
+        css_parent, css_child = ".css-x4xlc7-DivCommentContainer", ".css-13wx63w-DivCommentObjectWrapper"
+        browser_link = self.page.url
+        async for comments in (
+            self._capture("comment", css_count, time_delay, css_parent) if self.capture else
+            self._collect(css_parent, css_child, FIELDS_COMMENT_ASYNC, css_count, time_delay)
+        ):
+            yield [
+                {"browser_link": browser_link, **comment, "comment_reply": None}
+                for comment in comments
+            ]
+
+    async def user_get(self) -> Dict[str, Any]:
+        """
+        获取当前页面用户的详细信息（与 `tiktok.user_get` 相同）。
+        """
+        page = self.page
+        user_info = {
+            "user_id": await page.locator("h1[data-e2e='user-title']").first.inner_text(),
+            "user_name": await page.locator("h2[data-e2e='user-subtitle']").first.inner_text(),
+            "user_signature": await page.locator("h2[data-e2e='user-bio']").first.inner_text(),
+            "user_avatar": await page.locator("img.css-1zpj2q-ImgAvatar.e1e9er4e1").first.get_attribute("src"),
+            "user_page": page.url,
+            "user_list": [],
+        }
+        for key, selectors in {
+            "info_follow": ["strong[data-e2e='following-count']", "span[data-e2e='following']"],
+            "info_fans": ["strong[data-e2e='followers-count']", "span[data-e2e='followers']"],
+            "info_likes": ["strong[data-e2e='likes-count']", "span[data-e2e='likes']"]
+        }.items():
+            user_info[key] = [await page.locator(selector).first.inner_text() for selector in selectors]
+        button_follow = page.locator("button[data-e2e='follow-button']").first
+        user_info["button_follow"] = (await button_follow.inner_text()) == "关注"
+        user_info["button_message"] = await page.locator("a.link-a11y-focus").last.get_attribute("href")
+        if user_info["button_follow"]:
+            await button_follow.click()
+        return user_info
+
+    async def user_list(
+        self,
+        css_parent=".css-wq5jjc-DivUserListContainer",
+        css_child=".css-14xr620-DivUserContainer",
+        css_count: int = 0xEB,
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        获取关注者或粉丝列表（与 `tiktok.user_list` 相同）。
+        """
+        return await self._list(self.user_list_iter(css_parent, css_child, css_count, time_delay, dedup_stop))
+
+    async def user_list_iter(
+        self,
+        css_parent=".css-wq5jjc-DivUserListContainer",
+        css_child=".css-14xr620-DivUserContainer",
+        css_count: int = 0xEB,
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        逐批获取关注者或粉丝列表（与 `tiktok.user_list_iter` 相同）。
+        """
+        async for users in self._dedup("user_list", self._linked(self.page.url, (
+            self._capture("user_list", css_count, time_delay, css_parent) if self.capture else
+            self._collect(css_parent, css_child, FIELDS_USER_LIST, css_count, time_delay)
+        )), dedup_stop):
+            yield users
+
+    @staticmethod
+    async def _linked(user_link: str, batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[List[Dict[str, Any]]]:
+        # 为关注/粉丝列表的记录补全 user_link
+        async for users in batches:
+            yield [{"user_link": user_link, **user} for user in users]
+
+    async def search_user(
+        self,
+        css_parent=".css-f2h6fp-DivSearchContainer",
+        css_child="[data-e2e='search-user-container']",
+        css_count: int = 0x20,
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        获取用户搜索结果（与 `tiktok.search_user` 相同）。
+        """
+        return await self._list(self.search_user_iter(css_parent, css_child, css_count, time_delay, dedup_stop))
+
+    async def search_user_iter(
+        self,
+        css_parent=".css-f2h6fp-DivSearchContainer",
+        css_child="[data-e2e='search-user-container']",
+        css_count: int = 0x20,
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        逐批获取用户搜索结果（与 `tiktok.search_user_iter` 相同）。
+        """
+        async for users in self._dedup("search_user", (
+            self._capture("search_user", css_count, time_delay, css_parent) if self.capture else
+            self._collect(css_parent, css_child, FIELDS_SEARCH_USER, css_count, time_delay)
+        ), dedup_stop):
+            yield users
+
+    async def search_video(
+        self,
+        css_parent=".css-4dxm8q-DivVideoFeed.eegew6e0",
+        css_child=".css-1soki6-DivItemContainerForSearch",
+        css_count: int = 0x100,
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        获取视频搜索结果（与 `tiktok.search_video` 相同）。
+        """
+        return await self._list(self.search_video_iter(css_parent, css_child, css_count, time_delay, dedup_stop))
+
+    async def search_video_iter(
+        self,
+        css_parent=".css-4dxm8q-DivVideoFeed.eegew6e0",
+        css_child=".css-1soki6-DivItemContainerForSearch",
+        css_count: int = 0x100,
+        time_delay: float = 5.0,
+        dedup_stop: Optional[float] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        逐批获取视频搜索结果（与 `tiktok.search_video_iter` 相同）。
+        """
+        async for videos in self._dedup("search_video", (
+            self._capture("search_video", css_count, time_delay, css_parent) if self.capture else
+            self._videos(self._collect(css_parent, css_child, FIELDS_SEARCH_VIDEO, css_count, time_delay))
+        ), dedup_stop):
+            yield videos
+
+    @staticmethod
+    async def _videos(batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[List[Dict[str, Any]]]:
+        # 页面提取的视频字段补全为 `search_video` 的键名
+        async for videos in batches:
+            yield [
+                {
+                    "video_link": video["video_link"],
+                    "video_avatar": video["video_avatar"],
+                    "video_description": video["video_description"],
+                    "video_tags": [tag.strip() for tag in (video["video_description"] or "").split() if tag.startswith('#')],
+                    "video_username": (video["video_link"] or "").split('/')[-3] if (video["video_link"] or "").count('/') >= 3 else None,
+                    "video_view_count": video["video_view_count"],
+                    "video_like_count": video["video_like_count"]
+                }
+                for video in videos
+            ]
+
+    async def snapshot(
+        self,
+        api_name: str = "search_video",
+        css_count: int = 0x100,
+        time_delay: float = 5.0,
+        snapshot_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        滚动加载列表后保存页面源码，参数与格式与 `tiktok.snapshot` 相同，可由 `call_snapshot` 离线提取。
+        """
+        css_parent, css_child = LIST_SELECTORS[api_name]
+        snapshot_items = await self._list(self._collect(css_parent, css_child, dict(), css_count, time_delay))
+        snapshot_data = {
+            "api": api_name,
+            "browser_link": self.page.url,
+            "utc": time(),
+            "count": len(snapshot_items),
+            "html": await self.page.content()
+        }
+        if snapshot_path:
+            # call_snapshot 依赖 lxml 与 HtmlToJson，仅在保存快照时导入
+            from call_snapshot import save as snapshot_save
+            snapshot_save(snapshot_data, snapshot_path)
+            snapshot_data["path"] = snapshot_path
+            del snapshot_data["html"]
+        return snapshot_data
+
+    @classmethod
+    def commands(cls) -> Dict[str, Tuple[Callable, Signature]]:
+        """
+        返回可通过 `call` 调用的命令表，规则与 `tiktok.commands` 相同（见 `call_plan.commands`）。
+        """
+        if cls.__dict__.get("_commands") is None:
+            cls._commands = plan_commands(cls)
+        return cls._commands
+
+    @classmethod
+    def plan(cls, func_plan: List[Any]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        校验有序命令计划，规则与 `tiktok.plan` 相同（见 `call_plan.plan`），全部错误一次性以 ValueError 抛出。
+        """
+        return plan_steps(func_plan, cls.commands())
+
+    async def call(
+        self,
+        func_call: Union[List[Any], Dict[str, Any]]
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any], None]:
+        """
+        依次执行命令计划并返回每一步的结果，格式与 `tiktok.call` 相同。
+        """
+        if isinstance(func_call, dict):
+            func_call = [{func_name: func_args} for func_name, func_args in func_call.items()]
+        if not isinstance(func_call, list):
+            return None
+        return [
+            {"func": func_name, **await self._step(func_name, func_args)}
+            for func_name, func_args in self.plan(func_call)
+        ]
+
+    async def stream(self, func_call: List[Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        按顺序执行有序命令计划，逐条生成批次消息与步骤结果，格式与 `tiktok.stream` 相同。
+        """
+        for func_name, func_args in self.plan(func_call):
+            func_iter = getattr(self, f"{func_name}_iter", None)
+            if func_iter is None or (func_name == "comment" and (func_args or {}).get("comments_count")):
+                yield {"func": func_name, **await self._step(func_name, func_args)}
+                continue
+            iter_args = {
+                arg_name: arg_value
+                for arg_name, arg_value in (func_args or {}).items()
+                if arg_name in signature(func_iter).parameters
+            }
+            func_utc, func_start, func_count = time(), perf_counter(), 0
+            try:
+                func_batch = 0
+                async for func_items in func_iter(**iter_args):
+                    func_count += len(func_items)
+                    func_pending = self.dedup_pop()
+                    yield {
+                        "func": func_name,
+                        "batch": func_batch,
+                        "return": func_items,
+                        **({"dedup": func_pending} if func_pending else {})
+                    }
+                    func_batch += 1
+                func_status, func_return = True, func_count
+            except Exception as func_error:
+                func_status, func_return = False, str(func_error)
+            yield {
+                "func": func_name,
+                "utc": func_utc,
+                "args": func_args,
+                "status": func_status,
+                "return": func_return,
+                "time": round(perf_counter() - func_start, 6)
+            }
+
+    async def _step(
+        self,
+        func_name: str,
+        func_args: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        # 执行一步命令并记录开始时间与耗时，同步方法直接调用
+        func = self.commands()[func_name][0]
+        func_utc, func_start = time(), perf_counter()
+        try:
+            func_return = func(self, **func_args) if isinstance(func_args, dict) else func(self)
+            func_status, func_return = True, await func_return if iscoroutinefunction(func) else func_return
+        except Exception as func_error:
+            func_status, func_return = False, str(func_error)
+        return {
+            "utc": func_utc,
+            "args": func_args,
+            "status": func_status,
+            "return": func_return,
+            "time": round(perf_counter() - func_start, 6)
+        }
+
+
+# 空闲超过该时间（秒）的实例在下一次取用实例时关闭，与 `call_browser.pool` 的默认值相同
+SESSION_IDLE_TIMEOUT = 600.0
+
+# 同一事件循环内按配置复用的 (事件循环, 实例, 锁)，同一账号的命令串行执行；_used 为各实例最后一次使用的时间
+_sessions: Dict[Tuple, Tuple[asyncio.AbstractEventLoop, tiktok_async, asyncio.Lock]] = dict()
+_used: Dict[Tuple, float] = dict()
+
+
+def _session_key(data_config: Dict[str, Any]) -> Tuple:
+    # 复用实例的键：事件循环、浏览器类型/路径、账号、代理、无头模式、抓取模式
+    return (
+        id(asyncio.get_running_loop()),
+        data_config.get("browser_type", "chromium"),
+        data_config.get("browser_path"),
+        data_config.get("username") or "default",
+        data_config.get("proxy"),
+        bool(data_config.get("headless")),
+        bool(data_config.get("capture"))
+    )
+
+
+async def _expire() -> None:
+    # 移除已关闭事件循环的实例（保存的事件循环引用保证其 id 不会被复用），并关闭当前事件循环中空闲超时的实例
+    loop, time_now = asyncio.get_running_loop(), time()
+    for session_key in [session_key for session_key, (session_loop, _, _) in _sessions.items() if session_loop.is_closed()]:
+        del _sessions[session_key]
+        _used.pop(session_key, None)
+    for session_key in [
+        session_key
+        for session_key, (session_loop, _, session_lock) in _sessions.items()
+        if session_loop is loop and not session_lock.locked()
+        and time_now - _used.get(session_key, time_now) > SESSION_IDLE_TIMEOUT
+    ]:
+        _, browser, _ = _sessions.pop(session_key)
+        _used.pop(session_key, None)
+        await browser.close()
+
+
+@asynccontextmanager
+async def _lease(data_config: Dict[str, Any]) -> AsyncIterator[tiktok_async]:
+    # 取得当前事件循环中与配置对应的实例并持有其锁，实例已启动浏览器上下文；退出时记录使用时间
+    await _expire()
+    session_key = _session_key(data_config)
+    if session_key not in _sessions:
+        _sessions[session_key] = (asyncio.get_running_loop(), tiktok_async(**data_config), asyncio.Lock())
+    _, browser, browser_lock = _sessions[session_key]
+    _used[session_key] = time()
+    async with browser_lock:
+        try:
+            await browser.launch()
+            yield browser
+        finally:
+            _used[session_key] = time()
+
+
+async def close_sessions() -> int:
+    """
+    关闭当前事件循环中的全部实例（等待正在执行的命令结束）与共享浏览器，返回关闭的实例数量。
+
+    示例:
+        >>> await close_sessions()
+        2
+    """
+    loop = asyncio.get_running_loop()
+    session_keys = [session_key for session_key, (session_loop, _, _) in _sessions.items() if session_loop is loop]
+    for session_key in session_keys:
+        _, browser, browser_lock = _sessions.pop(session_key)
+        _used.pop(session_key, None)
+        async with browser_lock:
+            await browser.close()
+    for engine_key, shared in list(engine._engines.items()):
+        if shared._loop is loop:
+            del engine._engines[engine_key]
+            await shared.stop()
+    return len(session_keys)
+
+
+async def main(
+    data_config: Dict[str, Any] = {
+        "username": "mxlbbi",
+        "proxy": None,
+        "headless": False
+    },
+    data_params: Union[List, Dict] = []
+) -> Dict[str, Any]:
+    """
+    异步主函数，与 `call_browser.main` 的参数与返回格式相同，可在 WebSocket 循环中直接 await。
+
+    同一账号/代理/抓取模式的命令复用同一个 `tiktok_async` 实例并串行执行，不同账号并发执行；
+    空闲超过 `SESSION_IDLE_TIMEOUT` 秒的实例在下一次调用时关闭，`close_sessions` 关闭全部实例。
+    列表形式的计划在创建浏览器上下文之前校验。
+
+    示例:
+        >>> await asyncio.gather(
+        ...     main({"username": "a"}, [{"get": {"browser_link": "https://www.tiktok.com/search/user?q=google"}}, "search_user"]),
+        ...     main({"username": "b"}, [{"get": {"browser_link": "https://www.tiktok.com/search/video?q=google"}}, "search_video"])
+        ... )
+    """
+    try:
+        isinstance(data_params, list) and tiktok_async.plan(data_params)
+        async with _lease(data_config) as browser:
+            try:
+                data_return = await browser.call(data_params)
+            finally:
+                data_dedup = browser.dedup_pop()
+            return {
+                "status": True,
+                "args": [data_config, data_params],
+                "return": data_return,
+                **({"dedup": data_dedup} if data_dedup else {})
+            }
+    except Exception as e:
+        return {
+            "status": False,
+            "args": [data_config, data_params],
+            "return": str(e)
+        }
+
+
+async def main_stream(
+    data_config: Dict[str, Any],
+    data_params: List[Any]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    流式执行命令计划，逐条生成 `tiktok_async.stream` 的批次消息与步骤结果，与 `call_browser.execute_stream` 对应。
+    计划在创建浏览器上下文之前校验，校验失败时抛出 ValueError。
+    """
+    tiktok_async.plan(data_params)
+    async with _lease(data_config) as browser:
+        try:
+            async for data_frame in browser.stream(data_params):
+                yield data_frame
+        finally:
+            browser.dedup_pop()
+
+
+if __name__ == "__main__":
+    from json import dumps
+    print(dumps(asyncio.run(main(data_params=[
+        {"get": {
+            "browser_link": "https://www.tiktok.com/search/video?q=google",
+            "time_delay": 5.0
+        }},
+        {"search_video": {"css_count": 10}}
+    ])), indent=4, ensure_ascii=False))
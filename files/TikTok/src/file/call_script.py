@@ -0,0 +1,260 @@
+"""
+TikTok Page Script Module
+
+This module holds the in-page JavaScript snippets and the per-extractor field mappings used by `call_browser.tiktok`.
+Each extractor declares its fields once; a single `execute_script` call then walks every item and returns plain
+dictionaries, instead of one WebDriver round-trip per field and per item.
+
+页面脚本模块
+
+本模块集中保存 `call_browser.tiktok` 使用的页面内 JavaScript 脚本与各提取器的字段映射。
+字段映射按提取器声明一次，由一次 `execute_script` 调用遍历全部条目并返回普通字典，
+不再为每个条目的每个字段单独发起 WebDriver 请求。
+
+字段映射格式：
+    {"字段名": [选择器, 取值方式, 默认值(可选)]}
+
+    - 选择器：CSS 选择器；以 "/"、"./" 或 "(" 开头时按 XPath 解析（上下文为当前条目）；空字符串表示条目本身。
+    - 取值方式："text" 取可见文本，"element" 返回元素本身（Selenium 中为 WebElement），
+      其他值按属性名读取，优先读取 DOM 属性（如 href、src 返回绝对地址），其次读取 HTML 属性。
+    - 默认值：元素不存在时返回的值，缺省为 None。
+"""
+
+
+# 按字段映射提取条目的公共函数：fields 为 null 时直接返回元素本身
+JS_EXTRACT_FUNCTION = """
+const pick = (root, selector) => {
+    if (!selector) return root;
+    if (/^(\\/|\\.\\/|\\()/.test(selector)) {
+        return document.evaluate(
+            selector, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return root.querySelector(selector);
+};
+const read = (node, how) => {
+    if (how === "element") return node;
+    if (how === "text") return (node.innerText || "").trim();
+    const value = how in node ? node[how] : node.getAttribute(how);
+    return value === undefined ? null : value;
+};
+const extract = (items, fields) => !fields ? items : items.map(item => {
+    const record = {};
+    for (const [name, [selector, how, fallback]] of Object.entries(fields)) {
+        const node = pick(item, selector);
+        const value = node ? read(node, how) : null;
+        record[name] = value === null ? (fallback ?? null) : value;
+    }
+    return record;
+});
+"""
+
+# 按字段映射批量提取条目：arguments[0] 为条目元素列表，arguments[1] 为字段映射
+JS_EXTRACT = JS_EXTRACT_FUNCTION + """
+return extract(arguments[0], arguments[1]);
+"""
+
+# 无限滚动增量采集（execute_async_script）：
+# arguments = [父容器选择器, 子元素选择器, 已采集数量, 字段映射, 最长等待毫秒, 回调]
+# 已有未采集的子元素时立即返回；否则滚动到最后一个子元素，
+# 由 MutationObserver 在新子元素出现时立即返回，超过最长等待时间则返回空结果。
+JS_COLLECT = JS_EXTRACT_FUNCTION + """
+const [cssParent, cssChild, seen, fields, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const parent = document.querySelector(cssParent);
+if (!parent) {
+    done({parent: false, count: 0, items: []});
+    return;
+}
+const children = () => document.querySelectorAll(cssChild);
+let timer = null;
+const observer = new MutationObserver(() => {
+    if (children().length > seen) finish();
+});
+const finish = () => {
+    observer.disconnect();
+    clearTimeout(timer);
+    const all = Array.from(children());
+    done({parent: true, count: all.length, items: extract(all.slice(seen), fields)});
+};
+if (children().length > seen) {
+    finish();
+} else {
+    observer.observe(parent, {childList: true, subtree: true});
+    timer = setTimeout(finish, timeout);
+    const all = children();
+    (all.length ? all[all.length - 1] : parent).scrollIntoView(true);
+}
+"""
+
+
+# 评论列表（tiktok.comment）
+FIELDS_COMMENT = {
+    "comment_img": ["img.css-1zpj2q-ImgAvatar", "src"],
+    "comment_user": ["div.css-2hpyn8-DivTriggerWrapper>a.link-a11y-focus", "href"],
+    "comment_name": ["a.link-a11y-focus > p.TUXText", "text"],
+    "comment_text": ["div.css-1k8xzzl-DivCommentContentWrapper > span > p", "text"],
+    "comment_time": ["div.css-1ivw6bb-DivCommentSubContentSplitWrapper > div > span", "text"],
+    "comment_reply": ["span.TUXText--weight-medium", "element"]
+}
+
+# 关注/粉丝列表（tiktok.user_list）
+FIELDS_USER_LIST = {
+    "followers_img": ["//*[@id='tux-portal-container']/div/div[2]/div/div/div[2]/div/div/section/div/div[3]/li[1]/div/div/a/span/img", "src"],
+    "followers_user": ["p.css-swczgi-PUniqueId", "text"],
+    "followers_name": ["div.css-1d8n6nn-DivNicknameContainer > span", "text"]
+}
+
+# 用户搜索结果（tiktok.search_user）
+FIELDS_SEARCH_USER = {
+    "user_link": ["a.css-7ogsq9-StyledAvatarUserLink", "href"],
+    "user_img": ["img.css-1zpj2q-ImgAvatar", "src"],
+    "user_id": ["//*[@id='search_user-item-user-link-1']/div/div/a[2]/div/p", "text"],
+    "user_name": ["p.css-1ns35wh-PTitle", "text"]
+}
+
+# 视频搜索结果（tiktok.search_video），video_tags / video_username 由 video_description / video_link 派生
+FIELDS_SEARCH_VIDEO = {
+    "video_link": ["a.css-1mdo0pl-AVideoContainer", "href"],
+    "video_avatar": ["img", "src"],
+    "video_description": ["img", "alt"],
+    "video_view_count": ["strong.video-count.css-dirst9-StrongVideoCount.e148ts222", "text"],
+    "video_like_count": ["div.css-11u47i-DivCardFooter svg.like-icon + strong", "text", "0"]
+}
+
+
+# 网络空闲判断：arguments[0] 为静默毫秒数
+# 页面加载完成，且最近一次资源响应结束已超过静默时间时返回 true；
+# 资源计时缓冲区接近上限时先累计响应时间与传输量再清空，避免新的请求不再被记录
+JS_NETWORK_IDLE = """
+const quiet = arguments[0];
+const entries = performance.getEntriesByType("resource");
+window.__tiktokResponseEnd = entries.reduce(
+    (last, entry) => Math.max(last, entry.responseEnd), window.__tiktokResponseEnd || 0
+);
+if (entries.length >= 200) {
+    window.__tiktokTransferCount = (window.__tiktokTransferCount || 0) + entries.length;
+    window.__tiktokTransferSize = (window.__tiktokTransferSize || 0) + entries.reduce((size, entry) => size + (entry.transferSize || 0), 0);
+    performance.clearResourceTimings();
+}
+return document.readyState === "complete" && performance.now() - window.__tiktokResponseEnd >= quiet;
+"""
+
+# 当前页面的网络传输统计：请求数量与传输字节数（含 JS_NETWORK_IDLE 清空前累计的部分）
+JS_TRAFFIC = """
+const entries = performance.getEntriesByType("navigation").concat(performance.getEntriesByType("resource"));
+return {
+    requests: (window.__tiktokTransferCount || 0) + entries.length,
+    bytes: (window.__tiktokTransferSize || 0) + entries.reduce((size, entry) => size + (entry.transferSize || 0), 0)
+};
+"""
+
+# 调试用标签结构：arguments = [CSS 选择器, 最大深度(null 为不限), 起始序号, 最多返回数量(null 为全部)]
+# 以显式栈先序遍历子树，只序列化 [起始序号, 起始序号 + 数量) 范围内的节点；done 为 true 时遍历已结束
+JS_DEBUG = """
+const [cssSelector, depthMax, start, count] = arguments;
+const root = document.querySelector(cssSelector);
+if (!root) return null;
+const end = count === null ? Infinity : start + count;
+const items = [];
+const stack = [[root, 0]];
+let index = 0;
+while (stack.length && index < end) {
+    const [node, depth] = stack.pop();
+    if (index >= start) {
+        items.push({
+            html_tag_name: node.tagName.toLowerCase(),
+            html_class: node.getAttribute("class"),
+            html_text: (node.innerText ?? node.textContent ?? "").trim(),
+            html_attributes: node.outerHTML
+        });
+    }
+    index++;
+    if (depthMax === null || depth < depthMax) {
+        for (let child = node.lastElementChild; child; child = child.previousElementSibling) {
+            stack.push([child, depth + 1]);
+        }
+    }
+}
+return {items: items, done: stack.length === 0};
+"""
+
+
+# 离线提取（call_snapshot）使用的查询，语法见 HtmlToJson.Selector，类名使用 [class~=...] 匹配。
+# 格式：(条目查询, {"字段名": [查询, 取值方式, 默认值(可选)]})
+#     - 查询为空表示条目本身；多个查询以 " >> " 连接时，依次在上一步匹配元素的子树中查找。
+#     - 取值方式："text" 取子树文本，其他值按属性名读取（href、src 按页面地址补全为绝对地址）。
+#     - 无法用查询表达的字段（如 user_id、video_tags）由 call_snapshot 从其他字段派生。
+QUERIES_COMMENT = ("*[class~=css-13wx63w-DivCommentObjectWrapper]", {
+    "comment_img": ["img[class~=css-1zpj2q-ImgAvatar]", "src"],
+    "comment_user": ["div[class~=css-2hpyn8-DivTriggerWrapper] >> a[class~=link-a11y-focus]", "href"],
+    "comment_name": ["a[class~=link-a11y-focus] >> p[class~=TUXText]", "text"],
+    "comment_text": ["div[class~=css-1k8xzzl-DivCommentContentWrapper] >> span >> p", "text"],
+    "comment_time": ["div[class~=css-1ivw6bb-DivCommentSubContentSplitWrapper] >> span", "text"]
+})
+
+QUERIES_USER_LIST = ("*[class~=css-14xr620-DivUserContainer]", {
+    "followers_img": ["img", "src"],
+    "followers_user": ["p[class~=css-swczgi-PUniqueId]", "text"],
+    "followers_name": ["div[class~=css-1d8n6nn-DivNicknameContainer] >> span", "text"]
+})
+
+QUERIES_SEARCH_USER = ("*[data-e2e=search-user-container]", {
+    "user_link": ["a[class~=css-7ogsq9-StyledAvatarUserLink]", "href"],
+    "user_img": ["img[class~=css-1zpj2q-ImgAvatar]", "src"],
+    "user_name": ["p[class~=css-1ns35wh-PTitle]", "text"]
+})
+
+QUERIES_SEARCH_VIDEO = ("*[class~=css-1soki6-DivItemContainerForSearch]", {
+    "video_link": ["a[class~=css-1mdo0pl-AVideoContainer]", "href"],
+    "video_avatar": ["img", "src"],
+    "video_description": ["img", "alt"],
+    "video_view_count": ["strong[class~=video-count]", "text"],
+    "video_like_count": ["div[class~=css-11u47i-DivCardFooter] >> strong", "text", "0"]
+})
+
+# 二维码画布的灰度像素：arguments = [画布 CSS 选择器, 上次的像素哈希]
+# 2d 画布按 alpha 与白色背景混合后转为灰度，并计算 FNV-1a 哈希；哈希未变化时不返回像素。
+# 灰度像素以 base64 字符串返回，比数字数组传输更快；非 2d 画布（如 WebGL）回退为 PNG 数据 URL。
+JS_QR_PIXELS = """
+const [cssSelector, lastHash] = arguments;
+const canvas = document.querySelector(cssSelector);
+if (!canvas || !canvas.width || !canvas.height) return null;
+const {width, height} = canvas;
+const context = canvas.getContext("2d", {willReadFrequently: true});
+if (!context) return {width: width, height: height, hash: null, gray: null, png: canvas.toDataURL("image/png")};
+const rgba = context.getImageData(0, 0, width, height).data;
+const gray = new Uint8Array(width * height);
+let hash = 2166136261;
+for (let i = 0, j = 0; j < gray.length; i += 4, j++) {
+    const luma = (rgba[i] * 77 + rgba[i + 1] * 150 + rgba[i + 2] * 29) >> 8;
+    gray[j] = 255 - (rgba[i + 3] * (255 - luma)) / 255;
+    hash = Math.imul(hash ^ gray[j], 16777619);
+}
+hash = hash >>> 0;
+if (hash === lastHash) return {width: width, height: height, hash: hash, gray: null, png: null};
+let binary = "";
+for (let k = 0; k < gray.length; k += 0x8000) {
+    binary += String.fromCharCode.apply(null, gray.subarray(k, k + 0x8000));
+}
+return {width: width, height: height, hash: hash, gray: btoa(binary), png: null};
+"""
+
+# 资源拦截规则（URL 通配符），按类型由 `tiktok.block` / `tiktok_async.block` 选用
+BLOCK_PATTERNS = {
+    "image": ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.heic*", "*.image*"],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*"],
+    "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.m4a*", "*.mp3*", "*/video/tos/*", "*mime_type=video*"],
+    "tracker": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*connect.facebook.net*",
+        "*mon.tiktokv.com*", "*mcs.tiktokw.us*", "*/monitor_browser/*", "*/web/report*", "*/slardar/*"
+    ]
+}
+
+# 各列表提取器的 (父容器, 子元素) CSS 选择器，供 `tiktok.snapshot` / `tiktok_async.snapshot` 滚动加载使用
+LIST_SELECTORS = {
+    "comment": (".css-x4xlc7-DivCommentContainer", ".css-13wx63w-DivCommentObjectWrapper"),
+    "user_list": (".css-wq5jjc-DivUserListContainer", ".css-14xr620-DivUserContainer"),
+    "search_user": (".css-f2h6fp-DivSearchContainer", "[data-e2e='search-user-container']"),
+    "search_video": (".css-4dxm8q-DivVideoFeed.eegew6e0", ".css-1soki6-DivItemContainerForSearch")
+}
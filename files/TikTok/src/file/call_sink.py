@@ -0,0 +1,161 @@
+"""
+TikTok Mongo Sink Module
+
+This module flattens `call_browser` results (`search_video`, `search_user`, `user_list`, `comment`, `user_get`) into
+one document per entity and writes them into per-entity MongoDB collections with batched, unordered `bulk_write`
+upserts. Each collection has a unique index on its natural key plus indexes on the fields that are usually queried,
+so queries hit indexes instead of scanning the nested arrays of the raw command results.
+
+Mongo 写入模块
+
+本模块将 `call_browser` 的执行结果（`search_video`、`search_user`、`user_list`、`comment`、`user_get`）
+展开为每个实体一条文档，使用分批、无序的 `bulk_write` upsert 写入按实体划分的 MongoDB 集合。
+每个集合在实体的自然键上建立唯一索引，并为常用查询字段建立索引，查询时无需扫描原始结果中的嵌套数组。
+
+集合与键：
+    - videos：search_video → video_link
+    - users：search_user → user_link
+    - followers：user_list → user_link + followers_user
+    - comments：comment → browser_link + comment_user + comment_text
+    - profiles：user_get → user_page
+
+每条文档附加 `_device`（执行设备）、`_func`（来源命令）、`_utc`（最后一次采集时间）与 `_first_utc`（首次采集时间）。
+
+示例:
+    >>> from pymongo import MongoClient
+    >>> from call_sink import sink
+    >>> tiktok_sink = sink(MongoClient()["tiktok"])
+    >>> tiktok_sink.write(exec_json)
+    {'videos': 120, 'users': 0, 'followers': 0, 'comments': 0, 'profiles': 0}
+    >>> tiktok_sink.collections["videos"].find({"video_username": "google"})
+"""
+
+
+from time import time
+from typing import Any, Dict, Iterator, List, Tuple
+
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+
+
+# 命令名 → (集合名, 自然键字段, 其他索引字段)
+ENTITIES: Dict[str, Tuple[str, Tuple[str, ...], Tuple[str, ...]]] = {
+    "search_video": ("videos", ("video_link",), ("video_username", "video_tags")),
+    "search_user": ("users", ("user_link",), ("user_id",)),
+    "user_list": ("followers", ("user_link", "followers_user"), ("followers_user",)),
+    "comment": ("comments", ("browser_link", "comment_user", "comment_text"), ("comment_user",)),
+    "user_get": ("profiles", ("user_page",), ("user_id",))
+}
+
+
+def _steps(exec_json: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    # 从回复消息中取出各步骤结果：列表计划、旧的字典计划，以及流式批次消息
+    if isinstance(exec_json.get("stream"), dict):
+        yield {"status": True, "utc": exec_json.get("utc"), **exec_json["stream"]}
+        return
+    exec_return = exec_json.get("return")
+    exec_steps = exec_return.get("return") if isinstance(exec_return, dict) else None
+    if isinstance(exec_steps, list):
+        yield from (step for step in exec_steps if isinstance(step, dict))
+    elif isinstance(exec_steps, dict):
+        yield from (
+            {"func": func_name, **step}
+            for func_name, step in exec_steps.items()
+            if isinstance(step, dict)
+        )
+
+
+def flatten(exec_json: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    将一条回复消息展开为按集合划分的实体文档，执行失败的步骤与其他命令会被忽略。
+
+    参数:
+        exec_json (dict): `network_client` 发回的回复消息（含流式批次消息）。
+
+    返回:
+        dict: {集合名: [文档, ...]}。
+    """
+    entities = {collection: list() for collection, _, _ in ENTITIES.values()}
+    for step in _steps(exec_json):
+        if step.get("func") not in ENTITIES or not step.get("status"):
+            continue
+        collection, keys, _ = ENTITIES[step["func"]]
+        step_return = step.get("return")
+        for entity in [step_return] if isinstance(step_return, dict) else step_return if isinstance(step_return, list) else []:
+            if isinstance(entity, dict) and all(entity.get(key) is not None for key in keys):
+                entities[collection].append({
+                    **entity,
+                    "_device": exec_json.get("device"),
+                    "_func": step["func"],
+                    "_utc": step.get("utc") or time()
+                })
+    return entities
+
+
+class sink:
+    """
+    按实体划分集合的 MongoDB 写入器。
+
+    属性:
+        database (Database): pymongo 数据库对象。
+        collections (dict): {集合名: Collection}。
+        batch_size (int): 每次 `bulk_write` 的最大操作数。
+    """
+
+    def __init__(
+        self,
+        database,
+        suffix: str = str(),
+        batch_size: int = 1000
+    ) -> None:
+        """
+        初始化写入器并建立索引。
+
+        参数:
+            database (Database): pymongo 数据库对象。
+            suffix (str, 可选): 集合名后缀，例如 "_<设备>"。
+            batch_size (int): 每次 `bulk_write` 的最大操作数。
+        """
+        self.database = database
+        self.batch_size = batch_size
+        self.collections = {
+            collection: database[f"{collection}{suffix}"]
+            for collection, _, _ in ENTITIES.values()
+        }
+        self.ensure_indexes()
+
+    def ensure_indexes(self) -> None:
+        """
+        建立自然键唯一索引、常用查询字段索引与采集时间索引（已存在时不做任何操作）。
+        """
+        for collection, keys, fields in ENTITIES.values():
+            self.collections[collection].create_index([(key, ASCENDING) for key in keys], unique=True)
+            for field in fields:
+                self.collections[collection].create_index([(field, ASCENDING)])
+            self.collections[collection].create_index([("_utc", DESCENDING)])
+
+    def write(self, exec_json: Dict[str, Any]) -> Dict[str, int]:
+        """
+        展开一条回复消息并以 upsert 写入各集合，同一实体再次采集时更新字段与 `_utc`，保留 `_first_utc`。
+
+        参数:
+            exec_json (dict): `network_client` 发回的回复消息。
+
+        返回:
+            dict: {集合名: 写入（插入或更新）的文档数量}。
+        """
+        entities = flatten(exec_json)
+        written = dict()
+        for collection, keys, _ in ENTITIES.values():
+            documents = entities[collection]
+            written[collection] = 0
+            for start in range(0, len(documents), self.batch_size):
+                result = self.collections[collection].bulk_write([
+                    UpdateOne(
+                        {key: document[key] for key in keys},
+                        {"$set": document, "$setOnInsert": {"_first_utc": document["_utc"]}},
+                        upsert=True
+                    )
+                    for document in documents[start:start + self.batch_size]
+                ], ordered=False)
+                written[collection] += result.upserted_count + result.modified_count
+        return written
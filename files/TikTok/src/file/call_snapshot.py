@@ -0,0 +1,205 @@
+"""
+TikTok Page Snapshot Module
+
+This module extracts list records from saved page snapshots instead of the live WebDriver session. `tiktok.snapshot`
+scrolls a list to the end and grabs `page_source` once; the snapshot is then parsed with `HtmlToJson.HTMLToJSON` and
+queried with precompiled `HtmlToJson.Selector` queries, in a process pool when there are many pages. Snapshots can be
+stored on disk and re-extracted later when selectors change, and the browser session is released as soon as the
+snapshot is taken.
+
+页面快照模块
+
+本模块从保存的页面快照中提取列表记录，不再依赖正在运行的 WebDriver 会话。
+`tiktok.snapshot` 将列表滚动到底后一次性读取 `page_source`，之后由 `HtmlToJson.HTMLToJSON` 解析，
+并使用预编译的 `HtmlToJson.Selector` 查询提取字段，页面较多时在进程池中并行执行。
+快照可保存到磁盘，选择器变化后重新提取；浏览器会话在快照完成后即可释放。
+
+快照格式：
+    {"api": 提取器名, "browser_link": 页面地址, "utc": 时间戳, "html": 页面源码}
+
+示例:
+    >>> page = tiktok_instance.snapshot("search_video", css_count=100)
+    >>> records = extract_snapshot(page)
+    >>> records = extract_many([page1, page2, page3], max_workers=4)
+"""
+
+
+from gzip import open as gzip_open
+from json import dump, load as load_json
+from bisect import bisect_right
+from urllib.parse import urljoin
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from HtmlToJson import HTMLToJSON, compile
+from call_script import (
+    QUERIES_COMMENT,
+    QUERIES_USER_LIST,
+    QUERIES_SEARCH_USER,
+    QUERIES_SEARCH_VIDEO
+)
+
+
+# 提取器名 → 离线查询
+QUERIES: Dict[str, Tuple[str, Dict[str, List[Any]]]] = {
+    "comment": QUERIES_COMMENT,
+    "user_list": QUERIES_USER_LIST,
+    "search_user": QUERIES_SEARCH_USER,
+    "search_video": QUERIES_SEARCH_VIDEO
+}
+
+
+def _link_user(link: Optional[str]) -> Optional[str]:
+    # 从 https://www.tiktok.com/@user/... 中取出 user
+    return link.split("/@", 1)[1].split("/", 1)[0].split("?", 1)[0] if link and "/@" in link else None
+
+
+def _derive(api_name: str, record: Dict[str, Any], browser_link: str) -> Dict[str, Any]:
+    """
+    补全无法用查询表达的字段，使记录键名与 `tiktok` 的 DOM 提取结果一致。
+    """
+    if api_name == "comment":
+        return {"browser_link": browser_link, **record, "comment_reply": None}
+    if api_name == "user_list":
+        return {"user_link": browser_link, **record}
+    if api_name == "search_user":
+        return {
+            "user_link": record["user_link"],
+            "user_img": record["user_img"],
+            "user_id": _link_user(record["user_link"]),
+            "user_name": record["user_name"]
+        }
+    if api_name == "search_video":
+        return {
+            "video_link": record["video_link"],
+            "video_avatar": record["video_avatar"],
+            "video_description": record["video_description"],
+            "video_tags": [tag.strip() for tag in (record["video_description"] or "").split() if tag.startswith('#')],
+            "video_username": _link_user(record["video_link"]),
+            "video_view_count": record["video_view_count"],
+            "video_like_count": record["video_like_count"]
+        }
+    return record
+
+
+class _document:
+    """
+    快照文档的查询辅助：按文档顺序为 XPath 编号，利用先序遍历中子树连续的特点定位条目内的首个匹配。
+    """
+
+    def __init__(self, html_str: str, browser_link: str) -> None:
+        self.converter = HTMLToJSON.create_from_string(html_str)
+        self.mapping = self.converter.dict()
+        self.xpaths = list(self.mapping)
+        self.position = {xpath: index for index, xpath in enumerate(self.xpaths)}
+        self.browser_link = browser_link
+        self._matches: Dict[str, Tuple[List[int], List[str]]] = dict()
+
+    def find(self, query: str) -> List[str]:
+        # 全文档匹配，按文档顺序
+        return list(compile(query).find(self.converter))
+
+    def first(self, scope: str, query: str) -> Optional[str]:
+        # scope 子树内（不含 scope 本身）按文档顺序的第一个匹配
+        if query not in self._matches:
+            matches = self.find(query)
+            self._matches[query] = ([self.position[xpath] for xpath in matches], matches)
+        positions, matches = self._matches[query]
+        index = bisect_right(positions, self.position[scope])
+        if index < len(matches) and matches[index].startswith(scope + "/"):
+            return matches[index]
+        return None
+
+    def text(self, scope: str) -> str:
+        # 子树文本：先序遍历中 scope 之后连续的后代节点
+        texts = [self.mapping[scope]["text"]]
+        for xpath in self.xpaths[self.position[scope] + 1:]:
+            if not xpath.startswith(scope + "/"):
+                break
+            texts.append(self.mapping[xpath]["text"])
+        return " ".join(text for text in texts if text)
+
+    def read(self, scope: str, field: List[Any]) -> Any:
+        query, how = field[0], field[1]
+        node = scope
+        for step in filter(None, (step.strip() for step in query.split(">>"))):
+            node = self.first(node, step)
+            if node is None:
+                return field[2] if len(field) > 2 else None
+        if how == "text":
+            return self.text(node)
+        value = self.mapping[node]["attributes"].get(how)
+        if value is not None and how in ("href", "src"):
+            return urljoin(self.browser_link, value)
+        return value if value is not None else (field[2] if len(field) > 2 else None)
+
+
+def extract(
+    html_str: str,
+    browser_link: str,
+    api_name: str,
+    css_max: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    从页面源码中提取指定提取器的记录，键名与 `tiktok` 对应方法的返回值相同（`comment_reply` 为 None）。
+
+    参数:
+        html_str (str): 页面源码。
+        browser_link (str): 页面地址，用于补全相对链接。
+        api_name (str): 提取器名，见 `QUERIES`。
+        css_max (int, 可选): 最大返回的数量。
+
+    返回:
+        list: 记录列表。
+    """
+    document = _document(html_str, browser_link)
+    item_query, fields = QUERIES[api_name]
+    return [
+        _derive(api_name, {
+            field_name: document.read(item_xpath, field)
+            for field_name, field in fields.items()
+        }, browser_link)
+        for item_xpath in document.find(item_query)[:css_max]
+    ]
+
+
+def extract_snapshot(snapshot: Dict[str, Any], css_max: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    从 `tiktok.snapshot` 返回的快照（或 `load` 读取的快照）中提取记录。
+    """
+    return extract(snapshot["html"], snapshot["browser_link"], snapshot["api"], css_max)
+
+
+def extract_many(
+    snapshots: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    在进程池中并行提取多个快照，按输入顺序返回每个快照的记录列表。
+
+    参数:
+        snapshots (list): 快照列表。
+        max_workers (int, 可选): 进程数量，默认为 CPU 核数。
+    """
+    if len(snapshots) <= 1:
+        return [extract_snapshot(snapshot) for snapshot in snapshots]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(extract_snapshot, snapshots))
+
+
+def save(snapshot: Dict[str, Any], file_path: str) -> str:
+    """
+    将快照以 gzip 压缩的 JSON 保存到文件，返回文件路径。
+    """
+    with gzip_open(file_path, "wt", encoding="utf-8") as snapshot_file:
+        dump(snapshot, snapshot_file, ensure_ascii=False)
+    return file_path
+
+
+def load(file_path: str) -> Dict[str, Any]:
+    """
+    读取 `save` 保存的快照。
+    """
+    with gzip_open(file_path, "rt", encoding="utf-8") as snapshot_file:
+        return load_json(snapshot_file)
+
@@ -0,0 +1,269 @@
+"""
+TikTok Result Wait Module
+
+This module replaces the `while not x: find_one_and_delete(...); sleep(0.1)` loops in the UI with one blocking wait
+primitive. `waiter.wait` claims the first document matching a filter (usually a correlation `id`), waking on a
+MongoDB change stream when the server supports it (replica set / sharded cluster) and falling back to polling with
+exponential backoff on a standalone server. Every wait has a deadline and returns None instead of hanging.
+`memory` is an in-process stand-in collection with the same calls, used for local runs and tests without MongoDB.
+
+结果等待模块
+
+本模块用一个阻塞等待原语替换 UI 中 `while not x: find_one_and_delete(...); sleep(0.1)` 形式的轮询。
+`waiter.wait` 取走第一条匹配过滤条件（通常为关联 `id`）的文档：服务器支持时（副本集/分片集群）通过 MongoDB
+变更流在文档到达时唤醒，单机服务器上退化为指数退避轮询。每次等待都有截止时间，超时返回 None，不会一直挂起。
+`memory` 是进程内的替身集合，提供相同的调用，用于没有 MongoDB 时的本地运行与测试。
+
+示例:
+    >>> from call_wait import waiter
+    >>> reply = waiter(mongo_read).wait({"id": "3f2a..."}, timeout=10.0)
+    >>> reply is None  # 10 秒内没有回复
+"""
+
+
+from re import search
+from threading import Condition
+from time import monotonic, sleep
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class waiter:
+    """
+    基于变更流（或退避轮询）的结果等待器。
+
+    属性:
+        collection (Collection): 接收回复的集合（pymongo Collection 或 `memory`）。
+        poll_min (float): 退避轮询的初始间隔（秒）。
+        poll_max (float): 退避轮询的最大间隔（秒）。
+    """
+
+    def __init__(
+        self,
+        collection,
+        poll_min: float = 0.05,
+        poll_max: float = 1.0
+    ) -> None:
+        self.collection = collection
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self._watch: Optional[bool] = None
+
+    def wait(
+        self,
+        match: Dict[str, Any],
+        timeout: float = 10.0,
+        projection: Optional[Dict[str, Any]] = {"_id": 0}
+    ) -> Optional[Dict[str, Any]]:
+        """
+        等待并取走（删除）第一条匹配的文档。
+
+        参数:
+            match (dict): 过滤条件，例如 {"id": 关联标识}；变更流只监听插入，条件作用于新文档。
+            timeout (float): 最长等待时间（秒）。
+            projection (dict, 可选): 返回字段。
+
+        返回:
+            dict | None: 匹配的文档；超时返回 None。
+        """
+        deadline = monotonic() + timeout
+        document = self.collection.find_one_and_delete(match, projection)
+        if document is not None or timeout <= 0:
+            return document
+        if self._watch is not False:
+            try:
+                return self._wait_stream(match, deadline, projection)
+            except Exception:
+                # 单机服务器不支持变更流，之后改用退避轮询
+                self._watch = False
+        return self._wait_poll(match, deadline, projection)
+
+    def wait_all(
+        self,
+        matches: List[Dict[str, Any]],
+        timeout: float = 10.0,
+        projection: Optional[Dict[str, Any]] = {"_id": 0}
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        在同一个截止时间内依次等待多条文档，按 `matches` 的顺序返回，超时的位置为 None。
+        """
+        deadline = monotonic() + timeout
+        return [
+            self.wait(match, max(0.0, deadline - monotonic()), projection)
+            for match in matches
+        ]
+
+    def wait_each(
+        self,
+        match: Dict[str, Any],
+        count: int,
+        timeout: float = 10.0,
+        projection: Optional[Dict[str, Any]] = {"_id": 0}
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        在同一个截止时间内逐条取走最多 `count` 条匹配的文档（例如扇出消息的各设备回复），每到达一条即产出一条；
+        截止时间到达后停止。
+        """
+        deadline = monotonic() + timeout
+        for _ in range(count):
+            document = self.wait(match, max(0.0, deadline - monotonic()), projection)
+            if document is None:
+                return
+            yield document
+
+    def _wait_stream(
+        self,
+        match: Dict[str, Any],
+        deadline: float,
+        projection: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        pipeline = [{"$match": {
+            "operationType": "insert",
+            # $or 等顶层运算符只由 find_one_and_delete 判断，变更流仅按字段条件唤醒
+            **{f"fullDocument.{key}": value for key, value in match.items() if not key.startswith("$")}
+        }}]
+        with self.collection.watch(pipeline, max_await_time_ms=200) as stream:
+            self._watch = True
+            # 变更流打开之前到达的文档
+            document = self.collection.find_one_and_delete(match, projection)
+            while document is None and monotonic() < deadline:
+                if stream.try_next() is not None:
+                    document = self.collection.find_one_and_delete(match, projection)
+            return document
+
+    def _wait_poll(
+        self,
+        match: Dict[str, Any],
+        deadline: float,
+        projection: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        poll_delay = self.poll_min
+        while monotonic() < deadline:
+            sleep(min(poll_delay, max(0.0, deadline - monotonic())))
+            document = self.collection.find_one_and_delete(match, projection)
+            if document is not None:
+                return document
+            poll_delay = min(poll_delay * 2, self.poll_max)
+        return None
+
+
+def _values(value: Any, parts: List[str]) -> List[Any]:
+    # 按点号路径取值，路径经过数组时展开为其中每个元素的取值
+    if not parts:
+        return value if isinstance(value, list) else [value]
+    if isinstance(value, list):
+        return [found for item in value for found in _values(item, parts)]
+    if isinstance(value, dict) and parts[0] in value:
+        return _values(value[parts[0]], parts[1:])
+    return []
+
+
+def _matches(document: Dict[str, Any], match: Dict[str, Any]) -> bool:
+    # `memory` 支持的过滤条件：相等、$exists、$in、$regex（$options 仅支持 i）与顶层 $or，键可用点号表示嵌套字段
+    for key, condition in match.items():
+        if key == "$or":
+            if not any(_matches(document, branch) for branch in condition):
+                return False
+            continue
+        parts = key.split(".")
+        values = _values(document, parts)
+        found = any(isinstance(parent, dict) and parts[-1] in parent for parent in _values(document, parts[:-1]))
+        if isinstance(condition, dict) and any(operator.startswith("$") for operator in condition):
+            if "$exists" in condition and found != bool(condition["$exists"]):
+                return False
+            if "$in" in condition and not any(value in condition["$in"] for value in values):
+                return False
+            if "$regex" in condition:
+                flags = 2 if "i" in condition.get("$options", str()) else 0
+                if not any(isinstance(value, str) and search(condition["$regex"], value, flags) for value in values):
+                    return False
+        elif condition not in values:
+            return False
+    return True
+
+
+class memory:
+    """
+    进程内的替身集合，提供 `waiter` 与 UI 用到的 pymongo 调用（insert_one、insert_many、find、find_one_and_delete、
+    delete_many、watch）。
+
+    示例:
+        >>> replies = memory()
+        >>> Thread(target=lambda: (sleep(0.5), replies.insert_one({"id": "a", "status": True}))).start()
+        >>> waiter(replies).wait({"id": "a"}, timeout=2.0)
+        {'id': 'a', 'status': True}
+    """
+
+    def __init__(self) -> None:
+        self.documents: List[Dict[str, Any]] = list()
+        self._inserted = Condition()
+        self._version = 0
+
+    def insert_one(self, document: Dict[str, Any]) -> None:
+        with self._inserted:
+            self.documents.append(dict(document))
+            self._version += 1
+            self._inserted.notify_all()
+
+    def insert_many(self, documents: List[Dict[str, Any]]) -> None:
+        with self._inserted:
+            self.documents.extend(dict(document) for document in documents)
+            self._version += 1
+            self._inserted.notify_all()
+
+    def find(
+        self,
+        match: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        with self._inserted:
+            return [
+                {key: value for key, value in document.items() if (projection or {}).get(key, 1)}
+                for document in self.documents if _matches(document, match)
+            ]
+
+    def find_one_and_delete(
+        self,
+        match: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        with self._inserted:
+            for index, document in enumerate(self.documents):
+                if _matches(document, match):
+                    del self.documents[index]
+                    return {key: value for key, value in document.items() if (projection or {}).get(key, 1)}
+        return None
+
+    def delete_many(self, match: Dict[str, Any]) -> None:
+        with self._inserted:
+            self.documents = [document for document in self.documents if not _matches(document, match)]
+
+    def watch(self, pipeline: List[Dict[str, Any]], max_await_time_ms: int = 200) -> "_stream":
+        return _stream(self, max_await_time_ms / 1000)
+
+
+class _stream:
+    """
+    `memory.watch` 返回的变更流：`try_next` 在有新插入时返回非 None，否则最多等待 `max_await` 秒后返回 None。
+    """
+
+    def __init__(self, collection: memory, max_await: float) -> None:
+        self.collection = collection
+        self.max_await = max_await
+        self._version = collection._version
+
+    def try_next(self) -> Optional[Dict[str, Any]]:
+        with self.collection._inserted:
+            self.collection._inserted.wait_for(
+                lambda: self.collection._version != self._version,
+                timeout=self.max_await
+            )
+            if self.collection._version == self._version:
+                return None
+            self._version = self.collection._version
+            return {"operationType": "insert"}
+
+    def __enter__(self) -> "_stream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
@@ -10,9 +10,11 @@ WebSocket客户端端配置
 - 通过消息循环接收服务器消息并进行处理。
 - 支持自定义服务器地址和端口。
 - 支持自定义密钥、认证码、设备标识和类型。
+- 浏览器命令在线程池中执行，执行期间连接保持响应，新的调用消息排队等待。
+- 支持流式调用，长时间的列表采集按批次分多条消息返回。
 
 示例用法（使用默认参数值）：
-python network_client.py --host 206.119.166.200 --port 8500 --secret "从data_config获取" --code "从data_config获取" --device "从data_config获取" --type "TikTok.Server"
+python network_client.py --host 206.119.166.200 --port 8500 --secret "从data_config获取" --code "从data_config获取" --device "从data_config获取" --type "TikTok.Server" --workers 2 --heartbeat 5
 
 设计架构图：
 ┌──────────┐
@@ -73,13 +75,16 @@ python network_client.py --host 206.119.166.200 --port 8500 --secret "从data_co
 """
 
 import asyncio
+from sys import modules
 from os.path import basename
 from time import time
 from uuid import uuid1
 from json import dumps, loads
 from argparse import ArgumentParser
 from call_mfa import totp
-from call_browser import main
+from call_browser import main, execute_stream
+from call_dedup import dedup_store, pending as dedup_pending
+from concurrent.futures import ThreadPoolExecutor
 from websockets.client import State
 from websockets.asyncio.client import connect
 
@@ -93,6 +98,9 @@ data_config = [
         "type": "TikTok.Client"
     }
 ]
+# 同时执行的调用数量与心跳间隔（秒，0 表示不发送心跳），可由命令行参数修改
+ws_workers = 1
+ws_heartbeat_delay = 0.0
 
 
 def ws_cmd():
@@ -108,6 +116,8 @@ def ws_cmd():
     --code         自定义认证码
     --device       自定义设备标识
     --type         自定义类型
+    --workers      同时执行的调用数量
+    --heartbeat    调用执行期间的心跳间隔（秒）
 
     返回值：
         dict: 包含命令行参数值的字典。
@@ -124,20 +134,27 @@ def ws_cmd():
     parser.add_argument("--code", metavar="     CODE", help="自定义认证码")
     parser.add_argument("--device", metavar="   DEVICE", help="自定义设备标识")
     parser.add_argument("--type", metavar="     TYPE", help="自定义类型")
+    parser.add_argument("--workers", type=int, metavar="  WORKERS", help="同时执行的调用数量")
+    parser.add_argument("--heartbeat", type=float, metavar="HEARTBEAT", help="调用执行期间的心跳间隔（秒）")
     args = parser.parse_args()
+    global ws_workers, ws_heartbeat_delay
     args.host and args.port and data_config.__setitem__(
         0, f"ws://{args.host}:{args.port}")
     args.secret and data_config[1].__setitem__("secret", args.secret)
     args.code and data_config[1].__setitem__("code", args.code)
     args.device and data_config[1].__setitem__("device", args.device)
     args.type and data_config[1].__setitem__("type", args.type)
+    ws_workers = max(1, args.workers or ws_workers)
+    ws_heartbeat_delay = args.heartbeat or ws_heartbeat_delay
     return {
         "host": args.host,
         "port": args.port,
         "secret": args.secret,
         "code": args.code,
         "device": args.device,
-        "type": args.type
+        "type": args.type,
+        "workers": args.workers,
+        "heartbeat": args.heartbeat
     }
 
 
@@ -168,40 +185,225 @@ def ws_connect(uri, auth_message):
     return decorator
 
 
+def ws_execute(data_main):
+    """
+    执行一条调用消息，返回带有执行结果的消息（在线程池中运行，不阻塞事件循环）。
+
+    Args:
+        data_main (dict): 调用消息，包含config和params。
+
+    Returns:
+        dict: 更新了return的调用消息。
+    """
+    data_config = dict(data_main["config"])
+    data_config.pop("backend", None)
+    data_main.update({"return": main(data_config, data_main["params"])})
+    return data_main
+
+
+def ws_stream(data_main, data_send):
+    """
+    流式执行一条调用消息（在线程池中运行）：列表采集的每一批记录通过 data_send 单独发送，
+    返回带有各步骤执行结果的最终消息。
+
+    Args:
+        data_main (dict): 调用消息，包含config、params，以及已补全的id。
+        data_send (callable): 发送一条消息的函数，返回前消息已交给WebSocket。
+
+    Returns:
+        dict: 最终消息，return为各步骤的执行结果（流式步骤的return为记录总数），done为True；
+            执行中途出错时同样返回最终消息，见 ws_done。
+    """
+    data_config = dict(data_main["config"])
+    data_config.pop("backend", None)
+    data_steps = list()
+    data_seq = 0
+    try:
+        for data_frame in execute_stream(data_config, data_main["params"]):
+            if "batch" in data_frame:
+                data_send(ws_frame(data_main, data_seq, data_frame))
+                data_seq += 1
+            else:
+                data_steps.append(data_frame)
+    except Exception as e:
+        return ws_done(data_main, data_config, data_seq, data_steps, e)
+    return ws_done(data_main, data_config, data_seq, data_steps)
+
+
+def ws_done(data_main, data_config, data_seq, data_steps, data_error=None):
+    """
+    生成流式调用的最终消息（done为True）。执行中途出错时return的status为False，
+    return为出错前已完成的步骤结果，error为错误信息，调用方据此结束该id的接收。
+    """
+    data_main.update({
+        "seq": data_seq,
+        "done": True,
+        "return": {
+            "status": data_error is None,
+            "args": [data_config, data_main["params"]],
+            "return": data_steps,
+            **({"error": str(data_error)} if data_error is not None else {})
+        }
+    })
+    return data_main
+
+
+def ws_frame(data_main, data_seq, data_frame):
+    """
+    生成一条流式批次消息，路由字段与调用消息相同，id为调用的关联标识，seq从0开始递增。
+    """
+    return {
+        "send": data_main.get("send"),
+        "receive": data_main.get("receive"),
+        "device": data_main.get("device"),
+        "id": data_main["id"],
+        "seq": data_seq,
+        "done": False,
+        "stream": data_frame
+    }
+
+
 @ws_connect(data_config[0], data_config[1])
 async def ws_function(websocket, auth_message):
     """
     处理WebSocket消息循环和业务逻辑。
 
-    此函数通过消息循环接收服务器消息，调用call_browser.main函数处理消息，并将结果发送回服务器。
+    接收任务持续读取服务器消息，调用消息放入队列，消息队列的确认回执直接丢弃；
+    执行任务从队列中取出调用消息，在线程池中调用call_browser.main函数（config 中 backend 为 "playwright" 时
+    直接 await call_playwright.main），并将结果发送回服务器。浏览器命令执行期间事件循环保持响应，
+    WebSocket 的 ping/pong 正常进行，新的调用消息继续排队。
 
     Args:
         websocket: WebSocket连接对象。
         auth_message: 更新后的认证消息。
+
+    注意：
+        - 调用消息中 stream 为 true 且 params 为列表时，列表采集（comment、user_list、search_user、search_video）
+          的每一批记录单独发送：{"send", "receive", "device", "id", "seq", "done": false, "stream": {"func", "batch", "return"}}，
+          最后发送 done 为 true 的最终消息，其中流式步骤的 return 为记录总数；id 取调用消息中的 id，没有时自动生成。
+          执行中途出错时同样发送最终消息，其 return.status 为 false、return.error 为错误信息。
+        - 同时执行的调用数量由 ws_cmd 的 --workers 指定。selenium 后端中同一账号（同一用户数据目录）的调用
+          在会话池 `pool.lease` 中等待前一个调用归还会话后再执行；playwright 后端中同一配置的调用按实例锁依次执行。
+        - 执行出错时回复 {"send", "receive", "device", "id", "utc", "return": {"status": false, "args", "return": 错误信息}}。
+        - --heartbeat 大于 0 时，每条调用执行期间按该间隔（秒）向调用方发送心跳消息：
+          {"send", "receive", "device", "heartbeat": {"status": "running", "elapsed": 秒}}。
     """
-    async def ws_loop():
+    data_queue = asyncio.Queue()
+    data_send = asyncio.Lock()
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=ws_workers)
+
+    async def ws_send(data_main):
+        # 去重键不随消息发出，消息交给 WebSocket 之后才记录为已采集
+        data_dedup = dedup_pending(data_main) if isinstance(data_main, dict) else dict()
+        async with data_send:
+            await websocket.send(dumps(data_main, ensure_ascii=False))
+        data_dedup and dedup_store().commit(data_dedup)
+
+    async def ws_reader():
         while websocket.state == State.OPEN:
             data_main = await websocket.recv()
+            try:
+                data_json = loads(data_main)
+            except Exception:
+                data_json = None
+            if isinstance(data_json, dict) and "config" not in data_json and "params" not in data_json:
+                continue  # 消息队列的确认回执
             print(data_main)
+            await data_queue.put(data_main)
+
+    async def ws_heartbeat(data_main, time_start):
+        while True:
+            await asyncio.sleep(ws_heartbeat_delay)
+            try:
+                await ws_send({
+                    "send": data_main.get("send"),
+                    "receive": data_main.get("receive"),
+                    "device": data_main.get("device"),
+                    **({"id": data_main["id"]} if "id" in data_main else {}),
+                    "heartbeat": {"status": "running", "elapsed": round(time() - time_start, 3)}
+                })
+            except Exception as e:
+                print(F"[{time()}]:发送心跳失败，错误原因：{e}")
+                return
+
+    async def ws_worker():
+        while True:
+            data_main = await data_queue.get()
+            heartbeat = None
             try:
                 data_main = loads(data_main)
-                data_main.update(
-                    {"return": main(data_main["config"], data_main["params"])})
+                if ws_heartbeat_delay > 0:
+                    heartbeat = asyncio.create_task(ws_heartbeat(data_main, time()))
+                data_stream = bool(data_main.get("stream")) and isinstance(data_main["params"], list)
+                if data_stream:
+                    data_main.setdefault("id", str(uuid1()))
+                if data_main["config"].get("backend", "selenium") == "playwright":
+                    # 异步 playwright 后端，按需导入
+                    from call_playwright import main as main_async, main_stream
+                    data_config = dict(data_main["config"])
+                    data_config.pop("backend")
+                    if data_stream:
+                        data_steps, data_seq = list(), 0
+                        try:
+                            async for data_frame in main_stream(data_config, data_main["params"]):
+                                if "batch" in data_frame:
+                                    await ws_send(ws_frame(data_main, data_seq, data_frame))
+                                    data_seq += 1
+                                else:
+                                    data_steps.append(data_frame)
+                        except Exception as e:
+                            data_main = ws_done(data_main, data_config, data_seq, data_steps, e)
+                        else:
+                            data_main = ws_done(data_main, data_config, data_seq, data_steps)
+                    else:
+                        data_main.update(
+                            {"return": await main_async(data_config, data_main["params"])})
+                elif data_stream:
+                    data_main = await loop.run_in_executor(
+                        executor,
+                        ws_stream,
+                        data_main,
+                        lambda data_frame: asyncio.run_coroutine_threadsafe(ws_send(data_frame), loop).result()
+                    )
+                else:
+                    data_main = await loop.run_in_executor(executor, ws_execute, data_main)
             except Exception as e:
+                # 保留路由字段与 id，调用方按 id 收到失败结果，而不是等到超时
+                data_json = data_main if isinstance(data_main, dict) else dict()
                 data_main = {
+                    **{key: data_json[key] for key in ("send", "receive", "device", "id") if key in data_json},
                     "utc": time(),
-                    "status": True,
-                    "code": data_main,
-                    "exec": str(e)
+                    "return": {
+                        "status": False,
+                        "args": [data_json.get("config"), data_json.get("params")],
+                        "return": str(e)
+                    }
                 }
-            await websocket.send(dumps(data_main, ensure_ascii=False))
-            await websocket.recv()
+            finally:
+                heartbeat and heartbeat.cancel()
+                data_queue.task_done()
+            # 发送失败只记录，不结束执行任务，后续调用消息继续执行
+            try:
+                await ws_send(data_main)
+            except Exception as e:
+                print(F"[{time()}]:发送结果失败（id：{data_main.get('id')}），错误原因：{e}")
+
+    workers = [asyncio.create_task(ws_worker()) for _ in range(ws_workers)]
     try:
         print(F"[{time()}]:开始通信...")
-        await ws_loop()
+        await ws_reader()
         print(F"[{time()}]:结束通信...")
     except Exception as e:
         print(F"[{time()}]:结束通信...，错误原因：{e}")
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        executor.shutdown(wait=False, cancel_futures=True)
+        if "call_playwright" in modules:
+            # 连接结束时关闭 playwright 后端的浏览器上下文与共享浏览器
+            await modules["call_playwright"].close_sessions()
 
 
 if __name__ == "__main__":
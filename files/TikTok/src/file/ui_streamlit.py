@@ -6,19 +6,167 @@ pip install pymongo streamlit websockets pyotp numpy opencv-python selenium pill
 # _return_ = popen("dir").read()
 # print(_return_)
 
-from time import sleep
 from json import loads, dumps
 from datetime import datetime as dt
-from uuid import uuid1
+from time import monotonic
+from uuid import uuid1, uuid4
 from pymongo import MongoClient
 from streamlit import *
+from call_sink import sink
+from call_wait import waiter
+from call_monitor import resource_monitor
 
 
-mongo = MongoClient("mongodb://localhost:27017/")
-mac = str(uuid1())[-12:]
-mongo_read = mongo["app_cache"][f"tiktok_read_{mac}"]
-mongo_write = mongo["app_cache"][f"tiktok_write_{mac}"]
-tiktok_raw = mongo["tiktok"][f"raw_{mac}"]
+@cache_resource
+def resources(mongo_uri="mongodb://localhost:27017/"):
+    """
+    进程级共享资源：MongoDB 客户端（连接池）、设备标识与各集合，只在进程内首次运行时创建，页面重新运行时复用。
+    """
+    mongo = MongoClient(mongo_uri)
+    mac = str(uuid1())[-12:]
+    return {
+        "mongo": mongo,
+        "mac": mac,
+        "mongo_read": mongo["app_cache"][f"tiktok_read_{mac}"],
+        "mongo_write": mongo["app_cache"][f"tiktok_write_{mac}"],
+        "tiktok_raw": mongo["tiktok"][f"raw_{mac}"],
+        "tiktok_sink": sink(mongo["tiktok"], suffix=f"_{mac}"),
+        "mongo_wait": waiter(mongo["app_cache"][f"tiktok_read_{mac}"])
+    }
+
+
+mongo, mac, mongo_read, mongo_write, tiktok_raw, tiktok_sink, mongo_wait = resources().values()
+
+
+@cache_data(ttl=60, show_spinner="正在获取设备列表...")
+def devices(mac):
+    """
+    向消息队列查询在线的 TikTok 设备，结果缓存 60 秒（按 mac 区分），可通过 devices.clear() 立即刷新。
+
+    返回:
+        list: [{"device", "type", "send", "receive"}, ...]；5 秒内没有回复时抛出 TimeoutError（不缓存）。
+    """
+    mongo_write.insert_one({"$query": {}})
+    device = mongo_wait.wait(
+        {
+            "query.parameters.type": {
+                "$regex": "TikTok", "$options": "i"
+            }
+        }.copy(),
+        timeout=5.0
+    )
+    if (not device):
+        raise TimeoutError("设备列表查询超时")
+    return [
+        {
+            "device": f1["parameters"]["device"],
+            "type": f1["parameters"]["type"],
+            "send": f1["send"],
+            "receive": f1["receive"]
+        }
+        for f1 in device["query"]
+    ]
+
+
+def fanout(targets, payload, field, timeout=60.0):
+    """
+    将同一条命令以一条扇出消息（receive 为设备地址列表、共用一个关联 id）提交给多台设备，
+    在同一个截止时间内并发收集各设备的回复，按设备汇总。
+
+    参数:
+        targets (list): 设备列表 [{"device", "type", "send", "receive"}, ...]。
+        payload (dict): 命令内容，例如 {"data": ...} 或 {"config": ..., "params": ...}。
+        field (str): 回复中的结果字段，"data" 或 "return"；执行出错的回复结果在 "return" 中。
+        timeout (float): 每台设备的等待时间（秒），所有设备同时开始计时。
+
+    返回:
+        tuple: (关联 id, [{"device", "type", "status", "elapsed", "result", "reply"}, ...])，与 targets 顺序相同；
+               status 为 成功/失败/运行中/超时/离线；截止时间内没有回复但发送过心跳的设备为运行中，
+               运行中、超时与离线设备的 reply 为 None。
+    """
+    message = {
+        "send": targets[0]["send"],
+        "receive": [f1["receive"] for f1 in targets],
+        "id": str(uuid4()),
+        **payload
+    }
+    time_start = monotonic()
+    mongo_write.insert_one(message.copy())
+    receipt = mongo_wait.wait(
+        {"id": message["id"], "status": {"$exists": True}, "data": {"$exists": False}, "return": {"$exists": False}},
+        timeout=10.0
+    )
+    if (not receipt):
+        raise TimeoutError("等待回执超时：消息队列未响应")
+    online = [f1["status"] for f1 in receipt.get("targets", [receipt])]
+    # 回复经消息队列转发后 receive 为回复设备的地址
+    replies = dict()
+    for f1 in mongo_wait.wait_each(
+        {"id": message["id"], "$or": [{field: {"$exists": True}}, {"return": {"$exists": True}}]},
+        sum(online),
+        timeout=timeout
+    ):
+        replies[dumps(f1["receive"])] = (f1, round(monotonic() - time_start, 3))
+    running = heartbeats(message["id"])
+    rows = list()
+    for f1, f2 in zip(targets, online):
+        reply, elapsed = replies.get(dumps(f1["receive"]), (None, None))
+        result = None if reply is None else reply.get(field, reply.get("return"))
+        rows.append({
+            "device": f1["device"],
+            "type": f1["type"],
+            "status": "离线" if not f2 else (
+                ("运行中" if dumps(f1["receive"]) in running else "超时") if reply is None
+                else "成功" if succeeded(result) else "失败"
+            ),
+            "elapsed": elapsed,
+            "result": None if reply is None else dumps(result, ensure_ascii=False)[:200],
+            "reply": reply
+        })
+    return message["id"], rows
+
+
+def heartbeats(id):
+    """
+    取走接收集合中的全部心跳消息（心跳只表明设备仍在执行，不需要保留），返回其中属于关联 id 的发送设备地址集合。
+    """
+    match = {"heartbeat": {"$exists": True}}
+    running = {dumps(f1.get("receive")) for f1 in mongo_read.find({**match, "id": id}, {"_id": 0, "receive": 1})}
+    mongo_read.delete_many(match)
+    return running
+
+
+def succeeded(result):
+    """
+    判断一条回复结果是否成功：顶层 status 为真，且命令计划中没有 status 为假的步骤。
+    """
+    steps = result.get("return") if isinstance(result, dict) else None
+    steps = steps.values() if isinstance(steps, dict) else steps if isinstance(steps, list) else []
+    return bool(result.get("status")) and all(step.get("status", True) for step in steps if isinstance(step, dict))
+
+
+def fanout_table(rows):
+    """
+    以表格显示扇出提交的汇总结果（每台设备一行），并提示成功数量。
+    """
+    status = [f1["status"] for f1 in rows]
+    if (status.count("成功") == len(status)):
+        success(F"全部 {len(status)} 台设备执行成功")
+        balloons()
+    else:
+        warning("，".join(F"{f1}：{status.count(f1)}" for f1 in ("成功", "失败", "运行中", "超时", "离线") if f1 in status))
+    dataframe(
+        [{key: value for key, value in f1.items() if key != "reply"} for f1 in rows],
+        column_config={
+            "device": "设备",
+            "type": "类型",
+            "status": "状态",
+            "elapsed": "耗时（秒）",
+            "result": "结果摘要"
+        },
+        hide_index=True,
+        use_container_width=True
+    )
 
 
 set_page_config(
@@ -31,92 +179,59 @@ set_page_config(
 title("欢迎使用：TikTok任务页！")
 markdown(F"【**{str(dt.now())[:-7]}**】 正在使用 {mac} 设备：使用前请确保组件服务已启动，否则无法继续响应任务！")
 
+if (sidebar.button("刷新设备", key="button_devices")):
+    devices.clear()
+fanout_timeout = sidebar.number_input("单台设备超时（秒）", min_value=1.0, value=60.0, step=5.0, key="number_input_timeout")
+
 tab = list(tabs(["状态", "数据", "AutoXJS", "管理", "执行"]))
 
-mongo_write.insert_one({"$query": {}})
-sleep(2)
-device = mongo_read.find_one_and_delete(
-    {
-        "query.parameters.type": {
-            "$regex": "TikTok", "$options": "i"
-        }
-    }.copy(), {"_id": 0}
-)
+try:
+    device = devices(mac)
+except TimeoutError as e:
+    device = list()
+    warning(e)
 
-if (device):
-    device = [
-        {
-            "device": f1["parameters"]["device"],
-            "type": f1["parameters"]["type"],
-            "send": f1["send"],
-            "receive": f1["receive"]
-        }
-        for f1 in device["query"]
-    ]
-sleep(2)
 with tab[0]:
-    import psutil
-
     title("系统资源监控")
 
-    # 创建刷新按钮
-    refreshing = False  # 初始状态为不刷新
-
-    # 创建三列布局用于显示指标
+    # 后台采样线程写入环形缓冲区，页面只读取快照，监控运行时其他标签页仍可操作
+    sampler = resource_monitor()
     col1, col2, col3 = columns(3)
-
     if col1.button("刷新"):
         rerun()
     if col2.button("开始"):
-        refreshing = True
-    if refreshing:
-        if col3.button("停止"):
-            refreshing = False
-    # 初始化数据
-    cpu_data = []
-    memory_data = []
-    disk_data = []
-
-    # 初始化图表
-    resource_chart = line_chart({})
-
-    # 初始化指标占位符
-    cpu_metric = col1.empty()
-    memory_metric = col2.empty()
-    disk_metric = col3.empty()
-
-    while refreshing:
-        # 获取系统资源使用情况
-        cpu_usage = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-
-        # 更新数据
-        cpu_data.append(cpu_usage)
-        memory_data.append(memory.percent)
-        disk_data.append(disk.percent)
-
-        # 更新指标
-        cpu_metric.metric(label="CPU 使用率", value=f"{cpu_usage}%")
-        memory_metric.metric(label="内存使用率", value=f"{memory.percent}%")
-        disk_metric.metric(label="磁盘使用率", value=f"{disk.percent}%")
-
-        # 更新图表
-        resource_chart.line_chart({
-            "CPU": cpu_data,
-            "内存": memory_data,
-            "磁盘": disk_data
-        })
+        sampler.start()
+    if col3.button("停止"):
+        sampler.stop()
 
-        # 限制数据点数量
-        if len(cpu_data) > 60:  # 保留最近60个数据点
-            cpu_data.pop(0)
-            memory_data.pop(0)
-            disk_data.pop(0)
+    @fragment(run_every=2 if sampler.running else None)
+    def monitor_panel():
+        snapshot = sampler.snapshot()
+        if (not snapshot["utc"]):
+            info("监控未开始" if not sampler.running else "正在采样...")
+            return
+        metric_cpu, metric_memory, metric_disk = columns(3)
+        metric_cpu.metric(label="CPU 使用率", value=f'{snapshot["cpu"][-1]}%')
+        metric_memory.metric(label="内存使用率", value=f'{snapshot["memory"][-1]}%')
+        metric_disk.metric(label="磁盘使用率", value=f'{snapshot["disk"][-1]}%')
+        line_chart({
+            "CPU": snapshot["cpu"][-60:],
+            "内存": snapshot["memory"][-60:],
+            "磁盘": snapshot["disk"][-60:]
+        })
+        processes = sampler.processes()
+        if (processes):
+            markdown("**浏览器进程**（CPU 为所有同名进程之和，内存为 RSS，单位 MB）")
+            dataframe(processes, use_container_width=True, hide_index=True)
 
-        sleep(2)
+    monitor_panel()
 
 with tab[1]:
+    collection = selectbox(
+        "请选择集合",
+        ["raw", *tiktok_sink.collections],
+        key="selectbox_1"
+    )
     mongodb = text_area(
         label="请提交MongoDB语法",
         value=dict(),
@@ -126,16 +241,21 @@ with tab[1]:
     if (mongodb):
         try:
             mongodb = loads(mongodb)
-            json_swap = list()
-            for f1 in tiktok_raw.find(mongodb, {"_id": 0}):
-                json_swap.append(f1)
-            mongodb = 5
-            column = list(columns(mongodb))
-            for f1 in range(len(json_swap)):
-                with column[f1 % mongodb]:
-                    with popover(F'{json_swap[f1]["device"]}|{json_swap[f1]["type"]}'):
-                        f1 = F"```json\n{dumps(json_swap[f1]["return"]["return"], indent=4, ensure_ascii=False)}\n```"
-                        markdown(F"**查询结果：{str(dt.now())}**\n{f1}")
+            if (collection != "raw"):
+                json_swap = list(tiktok_sink.collections[collection].find(mongodb, {"_id": 0}).limit(1000))
+                markdown(F"**查询结果：{str(dt.now())}**，共 {len(json_swap)} 条（最多显示 1000 条）")
+                dataframe(json_swap, use_container_width=True)
+            else:
+                json_swap = list()
+                for f1 in tiktok_raw.find(mongodb, {"_id": 0}):
+                    json_swap.append(f1)
+                mongodb = 5
+                column = list(columns(mongodb))
+                for f1 in range(len(json_swap)):
+                    with column[f1 % mongodb]:
+                        with popover(F'{json_swap[f1]["device"]}|{json_swap[f1]["type"]}'):
+                            f1 = F"```json\n{dumps(json_swap[f1]["return"]["return"], indent=4, ensure_ascii=False)}\n```"
+                            markdown(F"**查询结果：{str(dt.now())}**\n{f1}")
             # write(json_swap)
         except Exception as e:
             error(e)
@@ -157,30 +277,17 @@ with tab[2]:
         markdown(
             F"---\n等待提交的javascript代码（代码预览区）\n```javascript\n{javascript}\n```"
         )
-        if (data_tab_2 and javascript):
-            javascript = {"data": javascript}
-            for f1 in data_tab_2:
-                f1.update(javascript)
-        javascript = None
-        if (button("提交", key="button_2_1")):
+        if (button("提交", key="button_2_1") and data_tab_2 and javascript):
             try:
-                mongo_write.insert_many(data_tab_2.copy())
-                while not javascript:
-                    javascript = mongo_read.find_one_and_delete(
-                        dict(), {"_id": 0})
-                    sleep(0.1)
-                sleep(2)
-                if (javascript and ["status", "send", "receive"] == list(javascript)):
-                    if (javascript["status"]):
-                        success("提交成功")
-                        balloons()
-                    else:
-                        error("提交失败")
-                        snow()
+                with spinner(F"等待 {len(data_tab_2)} 台设备回复..."):
+                    _, rows = fanout(data_tab_2, {"data": javascript}, "data", fanout_timeout)
+                fanout_table(rows)
             except Exception as e:
                 warning(e)
+        javascript = None
         if (button("获取", key="button_2_2")):
-            javascript = mongo_read.find_one_and_delete(dict(), {"_id": 0})
+            heartbeats(None)
+            javascript = mongo_wait.wait({"data": {"$exists": True}}, timeout=5.0)
             if (javascript and "data" in javascript):
                 # write(javascript)
                 text(
@@ -204,29 +311,17 @@ with tab[3]:
         markdown(
             F"---\n等待提交的Python代码（代码预览区）\n```python\n{python}\n```"
         )
-        if (data_tab_3 and python):
-            python = {"data": {"code": python}}
-            for f1 in data_tab_3:
-                f1.update(python)
         # write(data_tab_3)
-        if (button("提交", key="button_3_1")):
+        if (button("提交", key="button_3_1") and data_tab_3 and python):
             try:
-                mongo_write.insert_many(data_tab_3.copy())
-                while not python:
-                    python = mongo_read.find_one_and_delete(dict(), {"_id": 0})
-                    sleep(0.1)
-                sleep(2)
-                if (python and ["status", "send", "receive"] == list(python)):
-                    if (python["status"]):
-                        success("提交成功")
-                        balloons()
-                    else:
-                        error("提交失败")
-                        snow()
+                with spinner(F"等待 {len(data_tab_3)} 台设备回复..."):
+                    _, rows = fanout(data_tab_3, {"data": {"code": python}}, "data", fanout_timeout)
+                fanout_table(rows)
             except Exception as e:
                 warning(e)
         if (button("获取", key="button_3_2")):
-            python = mongo_read.find_one_and_delete(dict(), {"_id": 0})
+            heartbeats(None)
+            python = mongo_wait.wait({"data": {"$exists": True}}, timeout=5.0)
             if (python and "data" in python):
                 # write(python["data"])
                 text(
@@ -268,34 +363,32 @@ with tab[4]:
             key="text_area_4"
         )
         if (data_tab_4 and exec_json):
-            for f1 in data_tab_4:
-                f1.update(loads(exec_json))
             markdown(
-                F"---\n等待提交的JSON配置文件（代码预览区）\n```json\n{dumps(data_tab_4, indent=4, ensure_ascii=False)}\n```"
+                F"---\n等待提交的JSON配置文件（代码预览区）\n```json\n{dumps(loads(exec_json), indent=4, ensure_ascii=False)}\n```"
             )
-        if (button("提交", key="button_4_1")):
+        if (button("提交", key="button_4_1") and data_tab_4 and exec_json):
             try:
-                mongo_write.insert_many(data_tab_4.copy())
-                exec_json = None
-                while not (exec_json and ["status", "send", "receive"] == list(exec_json)):
-                    exec_json = mongo_read.find_one_and_delete(
-                        dict(), {"_id": 0})
-                    sleep(0.1)
-                sleep(2)
-                if (exec_json and ["status", "send", "receive"] == list(exec_json)):
-                    if (exec_json["status"]):
-                        success("提交成功")
-                        balloons()
-                    else:
-                        error("提交失败")
-                        snow()
+                with spinner(F"等待 {len(data_tab_4)} 台设备回复..."):
+                    session_state["exec_id"], rows = fanout(data_tab_4, loads(exec_json), "return", fanout_timeout)
+                for f1 in rows:
+                    if (f1["reply"]):
+                        tiktok_raw.insert_one(f1["reply"].copy())
+                        tiktok_sink.write(f1["reply"])
+                fanout_table(rows)
             except Exception as e:
                 warning(e)
+        # 获取在截止时间之后到达的回复
         if (button("获取", key="button_4_2")):
-            exec_json = mongo_read.find_one_and_delete(dict(), {"_id": 0})
+            heartbeats(session_state.get("exec_id"))
+            exec_json = mongo_wait.wait(
+                {"id": session_state["exec_id"], "return": {"$exists": True}}
+                if session_state.get("exec_id") else {"return": {"$exists": True}},
+                timeout=5.0
+            )
             if (exec_json):
                 # write(exec_json)
-                tiktok_raw.insert_one(exec_json)
+                tiktok_raw.insert_one(exec_json.copy())
+                tiktok_sink.write(exec_json)
                 text(
                     F'运行{"成功" if exec_json["return"]["status"] else "失败"}：{dt.now()}'
                 )
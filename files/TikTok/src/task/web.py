@@ -10,13 +10,22 @@ from uuid import uuid1
 from time import sleep
 from task import *
 from os import makedirs, walk, system, chdir, getcwd, remove
-from os.path import exists, dirname, abspath, isfile
+from os.path import exists, dirname, abspath, isfile, getmtime
 from pandas import read_excel
+from call_monitor import resource_monitor
 
 current_script_dir = dirname(abspath(__file__))
 chdir(current_script_dir)
 
 
+@cache_data(ttl=600, max_entries=64, show_spinner=False)
+def read_excel_cached(file_path, file_mtime):
+    """
+    读取 Excel 预览，按文件路径与修改时间缓存，页面重新运行时不再重复解析未修改的文件。
+    """
+    return read_excel(file_path)
+
+
 def web():
     set_page_config(
         page_title="TikTok任务页",
@@ -37,70 +46,46 @@ def web():
                 markdown(pf.read())
 
     with tab[1]:
-        import psutil
         markdown("## 监控运行")
-        refreshing = False  # 初始状态为不刷新
-
+        # 后台采样线程写入环形缓冲区，页面只读取快照，监控运行时其他标签页仍可操作
+        sampler = resource_monitor()
         col1, col2, col3 = columns(3)
         if col1.button("刷新"):
             rerun()
         if col2.button("开始"):
-            refreshing = True
-        if refreshing:
-            if col3.button("停止"):
-                refreshing = False
-
-        cpu_data = []
-        memory_data = []
-        disk_data = []
-
-        # 创建可折叠区域
-        with expander("监控数据", expanded=True):
-            # 在可折叠区域内创建指标和图表的占位符
-            col_metric1, col_metric2, col_metric3 = columns(3)
-            cpu_metric = col_metric1.empty()
-            memory_metric = col_metric2.empty()
-            disk_metric = col_metric3.empty()
-            resource_chart = empty()
-
-        with expander("运行状态", expanded=False):
-            column_path = columns(2)
-            image1 = column_path[0].empty()
-            image2 = column_path[1].empty()
+            sampler.start()
+        if col3.button("停止"):
+            sampler.stop()
 
-        while refreshing:
-            cpu_usage = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-
-            cpu_data.append(cpu_usage)
-            memory_data.append(memory.percent)
-            disk_data.append(disk.percent)
-
-            # 更新指标
-            cpu_metric.metric(label="CPU 使用率", value=f"{cpu_usage}%")
-            memory_metric.metric(label="内存使用率", value=f"{memory.percent}%")
-            disk_metric.metric(label="磁盘使用率", value=f"{disk.percent}%")
-
-            # 更新图表
-            resource_chart.line_chart({
-                "CPU": cpu_data,
-                "内存": memory_data,
-                "磁盘": disk_data
-            })
-
-            if len(cpu_data) > 60:  # 保留最近60个数据点
-                cpu_data.pop(0)
-                memory_data.pop(0)
-                disk_data.pop(0)
+        @fragment(run_every=1 if sampler.running else None)
+        def monitor_panel():
+            snapshot = sampler.snapshot()
+            with expander("监控数据", expanded=True):
+                if (snapshot["utc"]):
+                    col_metric1, col_metric2, col_metric3 = columns(3)
+                    col_metric1.metric(label="CPU 使用率", value=f'{snapshot["cpu"][-1]}%')
+                    col_metric2.metric(label="内存使用率", value=f'{snapshot["memory"][-1]}%')
+                    col_metric3.metric(label="磁盘使用率", value=f'{snapshot["disk"][-1]}%')
+                    line_chart({
+                        "CPU": snapshot["cpu"][-60:],
+                        "内存": snapshot["memory"][-60:],
+                        "磁盘": snapshot["disk"][-60:]
+                    })
+                    processes = sampler.processes()
+                    if (processes):
+                        markdown("**浏览器进程**（CPU 为所有同名进程之和，内存为 RSS，单位 MB）")
+                        dataframe(processes, use_container_width=True, hide_index=True)
+                else:
+                    info("监控未开始" if not sampler.running else "正在采样...")
 
-            # 更新图片
-            if isfile("images.png"):
-                image1.image("images.png", caption=F"{str(dt.now())[:-7]} 运行正常...")
-            if isfile("error.png"):
-                image2.image("error.png", caption=F"{str(dt.now())[:-7]} 运行错误...")
+            with expander("运行状态", expanded=False):
+                column_path = columns(2)
+                if isfile("images.png"):
+                    column_path[0].image("images.png", caption=F"{str(dt.now())[:-7]} 运行正常...")
+                if isfile("error.png"):
+                    column_path[1].image("error.png", caption=F"{str(dt.now())[:-7]} 运行错误...")
 
-            sleep(1)
+        monitor_panel()
 
     with tab[2]:
         tab_config = {
@@ -422,7 +407,7 @@ def web():
             for f11, f12 in enumerate(config_swap):
                 try:
                     try:
-                        column_path[f11 % 4].dataframe(read_excel(f12))
+                        column_path[f11 % 4].dataframe(read_excel_cached(f12, getmtime(f12)))
                         continue
                     except:
                         pass